@@ -0,0 +1,87 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures import time of falcon-heavy modules with ``python -X importtime``
+
+Usage::
+
+    python benchmarks/importtime.py [-n RUNS] [--top N] [--max MS] [module ...]
+
+Each module is imported in a fresh interpreter. The median cumulative
+import time and the heaviest imported modules are reported. The exit status
+is 1 when ``--max`` is given and a median exceeds it.
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+import typing as ty
+
+DEFAULT_MODULES = (
+    'falcon_heavy.core',
+    'falcon_heavy.contrib',
+)
+
+
+def measure(module: str) -> ty.Dict[str, ty.Tuple[int, int]]:
+    """Returns self and cumulative import times in microseconds by module"""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+    result = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        result[name.strip()] = (int(own), int(cumulative))
+    return result
+
+
+def main(argv: ty.Optional[ty.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('-n', '--runs', type=int, default=5, help="number of runs per module")
+    parser.add_argument('--top', type=int, default=10, help="number of the heaviest imports to show")
+    parser.add_argument('--max', type=float, help="maximum median import time in milliseconds")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.runs)]
+        median = statistics.median(run[module][1] for run in runs) / 1000
+        print("%s: %.1f ms (median of %d runs)" % (module, median, args.runs))
+
+        last = runs[-1]
+        heaviest = sorted(
+            (name for name in last if not name.startswith('falcon_heavy') and name != module),
+            key=lambda name: last[name][1],
+            reverse=True
+        )
+        for name in heaviest[:args.top]:
+            print("    %8.1f ms  %s" % (last[name][1] / 1000, name))
+
+        if args.max is not None and median > args.max:
+            status = 1
+
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures throughput of the multipart parser on synthetic bodies
+
+Usage::
+
+    python benchmarks/multipart.py [--size GIB] [--files N] [--chunk-size BYTES] [--temp-dir DIR] [--base64]
+
+The body is generated while it's read, so bodies of several gigabytes
+don't have to fit in memory. Its payload contains fragments that look
+like a delimiter. Uploaded files are spooled to the temporary directory.
+
+With ``--base64`` files are sent in base64 transfer encoding broken into
+lines of 76 characters, as legacy clients do.
+"""
+
+import io
+import base64
+import sys
+import time
+import random
+import argparse
+import typing as ty
+
+from falcon_heavy.http.multipart_parser import MultiPartParser
+
+BOUNDARY = b'----WebKitFormBoundaryjdSFhcARk8fyGNy6'
+
+
+class SyntheticBody(io.RawIOBase):
+
+    """Multipart body of the specified number of files"""
+
+    def __init__(self, size: int, files: int, seed: int = 0, base64_: bool = False) -> None:
+        rnd = random.Random(seed)
+        file_size = size // files
+        header = b'Content-Type: application/octet-stream\r\n'
+        if base64_:
+            # Lines of 76 characters encode 57 bytes, so the block is made of whole lines
+            raw = rnd.getrandbits(8 * 57 << 16).to_bytes(57 << 16, 'little')
+            block = base64.encodebytes(raw).replace(b'\n', b'\r\n')
+            file_size -= file_size % 78
+            header += b'Content-Transfer-Encoding: base64\r\n'
+        else:
+            block = bytearray(rnd.getrandbits(8 << 22).to_bytes(1 << 22, 'little'))
+            # Fragments of the delimiter make the parser look closer
+            for _ in range(64):
+                position = rnd.randrange(len(block) - len(BOUNDARY))
+                block[position:position + len(BOUNDARY)] = b'\r\n--' + BOUNDARY[:rnd.randrange(len(BOUNDARY) - 4)]
+        self.block = memoryview(bytes(block))
+
+        delimiter = b'--' + BOUNDARY
+        self.pieces: ty.List[ty.Union[bytes, int]] = []
+        for i in range(files):
+            self.pieces.append(
+                delimiter + b'\r\n'
+                b'Content-Disposition: form-data; name="field%d"\r\n\r\n'
+                b'value\r\n' % i
+            )
+            self.pieces.append(
+                delimiter + b'\r\n'
+                b'Content-Disposition: form-data; name="file%d"; filename="file%d.bin"\r\n' % (i, i) +
+                header + b'\r\n'
+            )
+            self.pieces.append(file_size)
+            self.pieces.append(b'\r\n')
+        self.pieces.append(delimiter + b'--\r\n')
+        self.length = sum(piece if isinstance(piece, int) else len(piece) for piece in self.pieces)
+        self.index = 0
+        self.offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: ty.Any) -> int:
+        """Reads the rest of the current piece at most"""
+        if self.index == len(self.pieces):
+            return 0
+
+        piece, offset = self.pieces[self.index], self.offset
+        if isinstance(piece, int):
+            start = offset % len(self.block)
+            size = min(len(buffer), piece - offset, len(self.block) - start)
+            buffer[:size] = self.block[start:start + size]
+            length = piece
+        else:
+            size = min(len(buffer), len(piece) - offset)
+            buffer[:size] = piece[offset:offset + size]
+            length = len(piece)
+
+        self.offset += size
+        if self.offset == length:
+            self.index += 1
+            self.offset = 0
+
+        return size
+
+
+def main(argv: ty.Optional[ty.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=float, default=2, help="size of files in GiB")
+    parser.add_argument('--files', type=int, default=4, help="number of files")
+    parser.add_argument('--chunk-size', type=int, default=64 * 1024, help="chunk size of the parser")
+    parser.add_argument('--temp-dir', help="directory of spooled files")
+    parser.add_argument('--base64', action='store_true', help="send files in base64 transfer encoding")
+    args = parser.parse_args(argv)
+
+    body = SyntheticBody(int(args.size * (1 << 30)), args.files, base64_=args.base64)
+
+    started = time.perf_counter()
+    form, files = MultiPartParser(
+        body,
+        'multipart/form-data; boundary=%s' % BOUNDARY.decode('ascii'),
+        body.length,
+        file_upload_temp_dir=args.temp_dir,
+        chunk_size=args.chunk_size
+    ).parse()
+    elapsed = time.perf_counter() - started
+
+    assert len(form) == len(files) == args.files
+    print("%.2f GiB in %.2f s: %.0f MiB/s" % (body.length / (1 << 30), elapsed, body.length / (1 << 20) / elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
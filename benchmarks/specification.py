@@ -0,0 +1,155 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures loading of specification documents
+
+Usage::
+
+    python benchmarks/specification.py [--size MIB] [--repeat N] [--path FILE]
+
+A synthetic specification of the given size is generated and written as
+YAML and JSON. Pass ``--path`` to measure an existing YAML or JSON file instead.
+Compares the pure Python YAML loader, the libyaml loader, the JSON fast path
+and the disk cache of parsed documents. The best of repeated runs is reported.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import typing as ty
+
+import yaml
+
+from falcon_heavy.core.types import ref_resolver
+
+
+def _make_unit(i: int) -> ty.Tuple[ty.Dict[str, ty.Any], ty.Dict[str, ty.Any]]:
+    """Returns a schema and a path item that uses it"""
+    schema = {
+        'type': 'object',
+        'description': 'Entity number %d of the synthetic specification' % i,
+        'required': ['id', 'name'],
+        'properties': {
+            'id': {'type': 'integer', 'format': 'int64', 'minimum': 1},
+            'name': {'type': 'string', 'maxLength': 255},
+            'tags': {'type': 'array', 'items': {'type': 'string'}, 'maxItems': 16},
+            'created': {'type': 'string', 'format': 'date-time', 'readOnly': True},
+            'parent': {'$ref': '#/components/schemas/Entity%d' % max(i - 1, 0)}
+        }
+    }
+    ref = {'$ref': '#/components/schemas/Entity%d' % i}
+    path_item = {
+        'get': {
+            'operationId': 'getEntity%d' % i,
+            'parameters': [{'name': 'limit', 'in': 'query', 'schema': {'type': 'integer', 'maximum': 100}}],
+            'responses': {
+                '200': {'description': 'ok', 'content': {'application/json': {'schema': ref}}}
+            }
+        },
+        'put': {
+            'operationId': 'putEntity%d' % i,
+            'requestBody': {'content': {'application/json': {'schema': ref}}},
+            'responses': {'204': {'description': 'ok'}}
+        }
+    }
+    return schema, path_item
+
+
+def make_specification(size: int) -> ty.Dict[str, ty.Any]:
+    """Makes a specification which JSON document takes about the given number of bytes"""
+    unit_size = len(json.dumps(_make_unit(1)))
+    schemas = {}
+    paths = {}
+    for i in range(max(size // unit_size, 1)):
+        schemas['Entity%d' % i], paths['/entities%d/{id}' % i] = _make_unit(i)
+
+    return {
+        'openapi': '3.0.2',
+        'info': {'title': 'Synthetic', 'version': '1'},
+        'paths': paths,
+        'components': {'schemas': schemas}
+    }
+
+
+def _measure(func: ty.Callable[[], ty.Any], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _load_file(path: str, cache_dir: ty.Optional[str] = None) -> ty.Any:
+    # Documents loaded before are kept in memory until their files change
+    ref_resolver._files_cache.clear()
+    return ref_resolver.load_file(path, cache_dir=cache_dir)
+
+
+def main(argv: ty.Optional[ty.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=float, default=5, help="size of the JSON document in MiB")
+    parser.add_argument('--repeat', type=int, default=3, help="number of runs of each case")
+    parser.add_argument('--path', help="specification file to load instead of a synthetic one")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    try:
+        if args.path is not None:
+            paths = {os.path.splitext(args.path)[1].lstrip('.') or 'file': args.path}
+
+        else:
+            specification = make_specification(int(args.size * (1 << 20)))
+            paths = {}
+            for kind, dump in (('yaml', yaml.safe_dump), ('json', json.dump)):
+                paths[kind] = os.path.join(directory, 'openapi.' + kind)
+                with open(paths[kind], 'w') as fh:
+                    dump(specification, fh)
+
+        cases = []
+        for kind, path in paths.items():
+            with open(path, 'rb') as fh:
+                data = fh.read()
+
+            print("%s file: %.1f MiB" % (kind, len(data) / (1 << 20)))
+            cases.append((
+                "yaml.SafeLoader, %s file" % kind, lambda data=data: yaml.load(data, Loader=yaml.SafeLoader)))
+            if hasattr(yaml, 'CSafeLoader'):
+                cases.append((
+                    "yaml.CSafeLoader, %s file" % kind, lambda data=data: yaml.load(data, Loader=yaml.CSafeLoader)))
+            cases.append(("load_file, %s file" % kind, lambda path=path: _load_file(path)))
+
+            cache_dir = os.path.join(directory, 'cache-' + kind)
+            # The first load fills the cache
+            _load_file(path, cache_dir=cache_dir)
+            cases.append((
+                "load_file, warm disk cache, %s file" % kind,
+                lambda path=path, cache_dir=cache_dir: _load_file(path, cache_dir=cache_dir)
+            ))
+
+        for name, func in cases:
+            print("%-45s %8.3f s" % (name, _measure(func, args.repeat)))
+
+    finally:
+        shutil.rmtree(directory)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
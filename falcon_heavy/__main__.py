@@ -0,0 +1,79 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import json
+import argparse
+import typing as ty
+
+from falcon_heavy.core import types as t, openapi as o
+
+__all__ = (
+    'main',
+)
+
+
+def _bundle(args: argparse.Namespace) -> None:
+    bundle = o.bundle_specification(
+        args.path, cache_dir=args.cache_dir, validate=not args.no_validate)
+
+    if args.output is None:
+        json.dump(bundle, sys.stdout, default=str)
+        sys.stdout.write('\n')
+
+    else:
+        with open(args.output, 'w') as fh:
+            json.dump(bundle, fh, default=str)
+
+
+def _fingerprint(args: argparse.Namespace) -> None:
+    if not args.no_validate:
+        o.load_specification(args.path, cache_dir=args.cache_dir)
+
+    print(o.fingerprint_specification(args.path, cache_dir=args.cache_dir))
+
+
+def main(argv: ty.Optional[ty.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='falcon_heavy')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    bundle_parser = subparsers.add_parser(
+        'bundle', help="Bundle a specification into a single self-contained JSON document")
+    bundle_parser.add_argument('path', help="path of the specification file")
+    bundle_parser.add_argument('-o', '--output', help="path of the bundle. Defaults to stdout")
+    bundle_parser.set_defaults(func=_bundle)
+
+    fingerprint_parser = subparsers.add_parser(
+        'fingerprint', help="Validate a specification and print its fingerprint")
+    fingerprint_parser.add_argument('path', help="path of the specification file")
+    fingerprint_parser.set_defaults(func=_fingerprint)
+
+    for subparser in (bundle_parser, fingerprint_parser):
+        subparser.add_argument('--cache-dir', help="directory for caching parsed and retrieved documents")
+        subparser.add_argument('--no-validate', action='store_true', help="don't validate the specification")
+
+    args = parser.parse_args(argv)
+
+    try:
+        args.func(args)
+    except t.SchemaError as e:
+        sys.stderr.write("Invalid specification:\n%s\n" % e)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
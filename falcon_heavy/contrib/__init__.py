@@ -15,8 +15,10 @@
 from .decorators import *
 from .name_resolver import *
 from .operations import *
+from .parallel import *
 from .parsers import *
 from .path import *
+from .reloader import *
 from .renderers import *
 from .request import *
 from .responses import *
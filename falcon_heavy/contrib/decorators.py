@@ -26,10 +26,17 @@ from cachetools import cachedmethod, LRUCache
 from falcon_heavy.core import types as t, openapi as o
 
 from .parsers import AbstractParser, ParseError
-from .renderers import AbstractRenderer, RenderError
+from .renderers import AbstractRenderer, RenderError, RenderedContent
 from .request import OpenAPIRequest
 from .responses import OpenAPIResponse, Cookie, ContentKind
-from .operations import OpenAPIOperations, OpenAPIOperation, OperationFindingError
+from .operations import (
+    OpenAPIOperations,
+    OpenAPIOperation,
+    OpenAPIOAuthFlows,
+    OpenAPISecurityScheme,
+    OperationFindingError
+)
+from .reloader import OpenAPIOperationsReloader
 
 __all__ = (
     'NormalizedRequest',
@@ -66,7 +73,7 @@ class AbstractOpenAPIDecorator:
 
     def __init__(
             self,
-            operations: OpenAPIOperations,
+            operations: ty.Union[OpenAPIOperations, OpenAPIOperationsReloader],
             parsers: ty.Iterable[AbstractParser] = (),
             renderers: ty.Iterable[AbstractRenderer] = ()
     ) -> None:
@@ -198,7 +205,7 @@ class AbstractOpenAPIDecorator:
             self,
             request: NormalizedRequest,
             instance: ty.Any,
-            flows: o.OAuthFlowsObject,
+            flows: ty.Union[o.OAuthFlowsObject, OpenAPIOAuthFlows],
             scopes: ty.Iterable[str],
             context: ty.MutableMapping[str, ty.Any]
     ) -> ty.Optional[str]:
@@ -227,7 +234,8 @@ class AbstractOpenAPIDecorator:
                 scheme = operation.security_schemes[scheme_name]
                 reason = None
                 if scheme.type == o.SECURITY_SCHEME_TYPE.API_KEY:
-                    assert isinstance(scheme, o.APIKeySecuritySchemeObject)
+                    assert isinstance(scheme, (o.APIKeySecuritySchemeObject, OpenAPISecurityScheme))
+                    assert scheme.name is not None
                     name = scheme.name.lower()
                     location = scheme.location
 
@@ -245,7 +253,8 @@ class AbstractOpenAPIDecorator:
                         request, instance, key, scopes, context)
 
                 elif scheme.type == o.SECURITY_SCHEME_TYPE.HTTP:
-                    assert isinstance(scheme, o.HttpSecuritySchemeObject)
+                    assert isinstance(scheme, (o.HttpSecuritySchemeObject, OpenAPISecurityScheme))
+                    assert scheme.scheme is not None
                     reason = self._apply_http_security(
                         request,
                         instance,
@@ -257,12 +266,14 @@ class AbstractOpenAPIDecorator:
                     )
 
                 elif scheme.type == o.SECURITY_SCHEME_TYPE.OAUTH2:
-                    assert isinstance(scheme, o.OAuth2SecuritySchemeObject)
+                    assert isinstance(scheme, (o.OAuth2SecuritySchemeObject, OpenAPISecurityScheme))
+                    assert scheme.flows is not None
                     reason = self._apply_oauth2_security(
                         request, instance, scheme.flows, scopes, context)
 
                 elif scheme.type == o.SECURITY_SCHEME_TYPE.OPEN_ID_CONNECT:
-                    assert isinstance(scheme, o.OpenIdConnectSecuritySchemeObject)
+                    assert isinstance(scheme, (o.OpenIdConnectSecuritySchemeObject, OpenAPISecurityScheme))
+                    assert scheme.open_id_connect_url is not None
                     reason = self._apply_open_id_connect_security(
                         request, instance, scheme.open_id_connect_url, scopes, context)
 
@@ -288,9 +299,15 @@ class AbstractOpenAPIDecorator:
 
         raise ParseError("Couldn't find parser for '%s'" % content_type)
 
-    def _parse(self, stream: ty.IO, content_type: str, content_length: int) -> ty.Any:
+    def _parse(
+            self,
+            stream: ty.IO,
+            content_type: str,
+            content_length: int,
+            media_type: ty.Optional[t.AbstractConvertible] = None
+    ) -> ty.Any:
         parser = self._get_parser(content_type)
-        return parser.parse(stream, content_type, content_length)
+        return parser.parse_media(stream, content_type, content_length, media_type)
 
     @cachedmethod(operator.attrgetter('_get_renderer_cache'))
     def _get_renderer(self, content_type: str) -> AbstractRenderer:
@@ -305,9 +322,13 @@ class AbstractOpenAPIDecorator:
 
         raise RenderError("Couldn't find renderer for '%s'" % content_type)
 
-    def _render(self, content: ty.Any, content_type: str) -> str:
+    def _render(self, content: ty.Any, content_type: str) -> ty.Union[bytes, str]:
         renderer = self._get_renderer(content_type)
-        return renderer.render(content)
+        result: RenderedContent = renderer.render(content)
+        if isinstance(result, memoryview):
+            # Frameworks send bytes only
+            return result.tobytes()
+        return result
 
     def _get_response(
             self,
@@ -331,10 +352,14 @@ class AbstractOpenAPIDecorator:
                 content = self._parse(
                     request.stream,
                     request.content_type,
-                    request.content_length
+                    request.content_length,
+                    media_type=operation.request_converter.get_media_type(request.content_type)
                 )
             except ParseError as e:
                 return self._handle_parse_error(request, operation, instance, e)
+            except t.SchemaError as e:
+                return self._handle_invalid_request(
+                    request, operation, instance, e)
 
         elif request.content_length > 0:
             content = request.stream
@@ -396,11 +421,16 @@ class AbstractOpenAPIDecorator:
 
             return self._render_500_error(instance, args, kwargs)
 
+        assert response_object is not None
+
+        content_length = response.content_length
         try:
             content: ty.Any = response_object.content
             if content is not t.Undefined and response.content_kind == ContentKind.MEDIA:
                 assert response.content_type
                 content = self._render(content, response.content_type)
+                if content_length is None and isinstance(content, bytes):
+                    content_length = len(content)
         except RenderError as e:
             try:
                 self._handle_render_error(
@@ -418,7 +448,7 @@ class AbstractOpenAPIDecorator:
             args,
             kwargs,
             content_type=response.content_type,
-            content_length=response.content_length,
+            content_length=content_length,
             content=content,
             content_kind=response.content_kind,
             **response.context
@@ -72,7 +72,10 @@ class FalconAbstractOpenAPIDecorator(AbstractOpenAPIDecorator):
             response.content_length = content_length
 
         if content_kind == ContentKind.MEDIA:
-            response.body = content
+            if isinstance(content, bytes):
+                response.data = content
+            else:
+                response.body = content
 
         elif content_kind == ContentKind.STREAMING:
             response.stream = content
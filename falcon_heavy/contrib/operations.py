@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import os
 import operator
+import threading
 import typing as ty
 from collections import ChainMap
 
 from cachetools import cachedmethod, LRUCache
 
 from falcon_heavy.core import types as t, openapi as o, factories as f
+from falcon_heavy.core.factories.registry import release_registry
 
 from .path import OpenAPIPath
 
@@ -26,7 +30,12 @@ __all__ = (
     'OperationFindingError',
     'OperationNotFoundError',
     'OperationMultipleFoundError',
+    'OpenAPIServer',
+    'OpenAPIOAuthFlow',
+    'OpenAPIOAuthFlows',
+    'OpenAPISecurityScheme',
     'OpenAPIOperation',
+    'ForkPreparationReport',
     'OpenAPIOperations',
 )
 
@@ -43,17 +52,281 @@ class OperationMultipleFoundError(OperationFindingError):
     pass
 
 
-class OpenAPIOperation(ty.NamedTuple):
-    operation_id: ty.Optional[str]
-    method: str
-    servers: ty.Optional[ty.Iterable[o.ServerObject]]
-    request_converter: f.RequestConverter
-    response_converter: f.ResponseConverter
-    security: ty.Iterable[ty.Mapping[str, ty.Iterable[str]]]
-    security_schemes: ty.Mapping[str, o.AnySecuritySchemeObject]
-    summary: ty.Optional[str]
+class _ConverterFactory:
+
+    """Builds converters of operations on demand
+
+    A single lock is shared by all operations of a specification because
+    generated types are registered in the common type factory.
+    """
+
+    __slots__ = (
+        'request_factory',
+        'responses_factory',
+        'lock',
+    )
+
+    def __init__(self, type_cache: ty.Optional[f.TypeCache] = None) -> None:
+        type_factory = f.TypeFactory(cache=type_cache)
+        self.request_factory = f.RequestFactory(type_factory)
+        self.responses_factory = f.ResponsesFactory(type_factory)
+        self.lock = threading.RLock()
+
+    def release(self) -> ty.List[ty.Any]:
+        """Drops registries of factories and returns generated types"""
+        generated: ty.List[ty.Any] = []
+        for factory in (
+                self.request_factory.type_factory,
+                self.request_factory.parameter_factory,
+                self.request_factory.request_body_factory,
+                self.responses_factory.parameter_factory,
+                self.responses_factory.response_factory
+        ):
+            generated.extend(release_registry(factory))
+        return generated
+
+
+class OpenAPIServer(ty.NamedTuple):
+    url: str
     description: ty.Optional[str]
-    extensions: ty.Mapping[str, ty.Any]
+    variables: ty.Mapping[str, str]  # default values of variables
+
+
+class OpenAPIOAuthFlow(ty.NamedTuple):
+    authorization_url: str
+    token_url: str
+    refresh_url: ty.Optional[str]
+    scopes: ty.Mapping[str, str]
+
+
+class OpenAPIOAuthFlows(ty.NamedTuple):
+    implicit: ty.Optional[OpenAPIOAuthFlow]
+    password: ty.Optional[OpenAPIOAuthFlow]
+    client_credentials: ty.Optional[OpenAPIOAuthFlow]
+    authorization_code: ty.Optional[OpenAPIOAuthFlow]
+
+
+class OpenAPISecurityScheme(ty.NamedTuple):
+    type: str
+    name: ty.Optional[str] = None  # apiKey
+    location: ty.Optional[str] = None  # apiKey
+    scheme: ty.Optional[str] = None  # http
+    bearer_format: ty.Optional[str] = None  # http
+    flows: ty.Optional[OpenAPIOAuthFlows] = None  # oauth2
+    open_id_connect_url: ty.Optional[str] = None  # openIdConnect
+
+
+AnySecurityScheme = ty.Union[o.AnySecuritySchemeObject, OpenAPISecurityScheme]
+
+
+def _compact_oauth_flow(flow: ty.Optional[o.OAuthFlowObject]) -> ty.Optional[OpenAPIOAuthFlow]:
+    if flow is None:
+        return None
+
+    return OpenAPIOAuthFlow(
+        authorization_url=flow.authorization_url,
+        token_url=flow.token_url,
+        refresh_url=flow.refresh_url,
+        scopes=dict(flow.scopes)
+    )
+
+
+def _compact_security_scheme(scheme: o.AnySecuritySchemeObject) -> OpenAPISecurityScheme:
+    if isinstance(scheme, o.APIKeySecuritySchemeObject):
+        return OpenAPISecurityScheme(type=scheme.type, name=scheme.name, location=scheme.location)
+
+    if isinstance(scheme, o.HttpSecuritySchemeObject):
+        return OpenAPISecurityScheme(type=scheme.type, scheme=scheme.scheme, bearer_format=scheme.bearer_format)
+
+    if isinstance(scheme, o.OAuth2SecuritySchemeObject):
+        flows = scheme.flows
+        return OpenAPISecurityScheme(type=scheme.type, flows=OpenAPIOAuthFlows(
+            implicit=_compact_oauth_flow(flows.implicit),
+            password=_compact_oauth_flow(flows.password),
+            client_credentials=_compact_oauth_flow(flows.client_credentials),
+            authorization_code=_compact_oauth_flow(flows.authorization_code)
+        ))
+
+    if isinstance(scheme, o.OpenIdConnectSecuritySchemeObject):
+        return OpenAPISecurityScheme(type=scheme.type, open_id_connect_url=scheme.open_id_connect_url)
+
+    return OpenAPISecurityScheme(type=scheme.type)
+
+
+class OpenAPIOperation:
+
+    """OpenAPI operation
+
+    Request and response converters are generated on first access.
+    """
+
+    __slots__ = (
+        'operation_id',
+        'method',
+        'servers',
+        'security',
+        'security_schemes',
+        'summary',
+        'description',
+        'extensions',
+        '_operation',
+        '_converter_factory',
+        '_request_converter',
+        '_response_converter',
+    )
+
+    def __init__(
+            self,
+            operation: o.OperationObject,
+            method: str,
+            servers: ty.Optional[ty.Iterable[o.ServerObject]],
+            security: ty.Iterable[ty.Mapping[str, ty.Iterable[str]]],
+            security_schemes: ty.Mapping[str, o.AnySecuritySchemeObject],
+            extensions: ty.Mapping[str, ty.Any],
+            converter_factory: ty.Optional[_ConverterFactory]
+    ) -> None:
+        self.operation_id: ty.Optional[str] = operation.operation_id
+        self.method = method
+        self.servers = servers
+        self.security = security
+        self.security_schemes: ty.Mapping[str, AnySecurityScheme] = security_schemes
+        self.summary: ty.Optional[str] = operation.summary
+        self.description: ty.Optional[str] = operation.description
+        self.extensions = extensions
+        self._operation: ty.Optional[o.OperationObject] = operation
+        self._converter_factory: ty.Optional[_ConverterFactory] = converter_factory
+        self._request_converter: ty.Optional[f.RequestConverter] = None
+        self._response_converter: ty.Optional[f.ResponseConverter] = None
+
+    def __repr__(self) -> str:
+        return "%s(operation_id=%r, method=%r)" % (self.__class__.__name__, self.operation_id, self.method)
+
+    @property
+    def request_converter(self) -> f.RequestConverter:
+        converter = self._request_converter
+        if converter is None:
+            converter_factory = self._converter_factory
+            assert converter_factory is not None
+            with converter_factory.lock:
+                converter = self._request_converter
+                if converter is None:
+                    assert self._operation is not None
+                    converter = converter_factory.request_factory.generate(
+                        parameters=self._operation.parameters,
+                        request_body=self._operation.request_body
+                    )
+                    self._request_converter = converter
+                    self._release_operation()
+
+        return converter
+
+    @property
+    def response_converter(self) -> f.ResponseConverter:
+        converter = self._response_converter
+        if converter is None:
+            converter_factory = self._converter_factory
+            assert converter_factory is not None
+            with converter_factory.lock:
+                converter = self._response_converter
+                if converter is None:
+                    assert self._operation is not None
+                    converter = converter_factory.responses_factory.generate(
+                        self._operation.responses
+                    )
+                    self._response_converter = converter
+                    self._release_operation()
+
+        return converter
+
+    @property
+    def is_prepared(self) -> bool:
+        """Returns True if both converters are already generated"""
+        return self._request_converter is not None and self._response_converter is not None
+
+    def prepare(self) -> None:
+        """Generates request and response converters"""
+        self.request_converter  # noqa
+        self.response_converter  # noqa
+
+    def compact(self, shared: ty.Dict[int, ty.Tuple[ty.Any, ty.Any]]) -> ty.Optional[_ConverterFactory]:
+        """Replaces specification objects with plain records
+
+        Converters must be already generated.
+
+        :param shared: compacted values shared between operations
+        :return: converter factory that is no longer needed
+        """
+        assert self.is_prepared
+
+        def share(value: ty.Any, compact: ty.Callable[[ty.Any], ty.Any]) -> ty.Any:
+            try:
+                return shared[id(value)][1]
+            except KeyError:
+                result = compact(value)
+                # The original value is kept so its id is not reused
+                shared[id(value)] = (value, result)
+                return result
+
+        if self.servers is not None:
+            self.servers = share(self.servers, lambda servers: tuple(
+                share(server, lambda server: OpenAPIServer(
+                    url=server.url,
+                    description=server.description,
+                    variables={name: variable.default for name, variable in (server.variables or {}).items()}
+                )) for server in servers
+            ))
+        self.security = share(self.security, lambda security: tuple(
+            {name: tuple(scopes) for name, scopes in requirement.items()}
+            for requirement in security
+        ))
+        self.security_schemes = share(self.security_schemes, lambda security_schemes: {
+            name: share(scheme, _compact_security_scheme) for name, scheme in security_schemes.items()
+        })
+        self.extensions = dict(self.extensions)
+
+        converter_factory, self._converter_factory = self._converter_factory, None
+        return converter_factory
+
+    def _release_operation(self) -> None:
+        # The operation object is only needed until both converters are generated
+        if self.is_prepared:
+            self._operation = None
+
+
+class ForkPreparationReport(ty.NamedTuple):
+    operations: int
+    frozen_objects: int
+    # Resident memory in bytes shared with other processes and private to the process.
+    # Pages of the master become shared with workers once they are forked
+    shared_size: ty.Optional[int]
+    private_size: ty.Optional[int]
+
+
+def _get_memory_sizes() -> ty.Tuple[ty.Optional[int], ty.Optional[int]]:
+    """Returns sizes of shared and private resident memory of the process"""
+    try:
+        sizes = {}
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name.startswith(('Shared_', 'Private_')):
+                    sizes[name] = int(value.split()[0]) * 1024  # in kB
+        return (
+            sizes['Shared_Clean'] + sizes['Shared_Dirty'],
+            sizes['Private_Clean'] + sizes['Private_Dirty']
+        )
+    except (OSError, ValueError, IndexError, KeyError):
+        pass
+
+    # Linux before 4.14 has no smaps_rollup
+    try:
+        with open('/proc/self/statm') as f:
+            fields = f.read().split()
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        resident, shared = int(fields[1]) * page_size, int(fields[2]) * page_size
+        return shared, resident - shared
+    except (OSError, ValueError, IndexError):
+        return None, None
 
 
 T = ty.TypeVar('T', bound='OpenAPIOperations')
@@ -64,20 +337,64 @@ class OpenAPIOperations(ty.Dict[OpenAPIPath, ty.Dict[str, OpenAPIOperation]]):
     def __init__(self, *args: ty.Any, **kwargs: ty.Any) -> None:
         super(OpenAPIOperations, self).__init__(*args, **kwargs)
         self._cache = LRUCache(1024)
+        self._generated: ty.Tuple[ty.Any, ...] = ()
+        self.subset_report: ty.Optional[o.SubsetReport] = None
 
     @classmethod
-    def from_file(cls: ty.Type[T], path: str, handlers: ty.Optional[t.RefHandlers] = None) -> T:
-        openapi_object: o.OpenAPIObject = o.load_specification(
-            path, handlers=handlers)
-        return cls.from_openapi_object(openapi_object)
+    def from_file(
+            cls: ty.Type[T],
+            path: str,
+            handlers: ty.Optional[t.RefHandlers] = None,
+            cache_dir: ty.Optional[str] = None,
+            trusted_fingerprint: ty.Optional[str] = None,
+            compact: bool = False,
+            type_cache: ty.Optional[f.TypeCache] = None,
+            include_tags: ty.Optional[ty.Iterable[str]] = None,
+            include_paths: ty.Optional[ty.Iterable[str]] = None,
+            include_operation_ids: ty.Optional[ty.Iterable[str]] = None
+    ) -> T:
+        """Makes operations of the specification file
+
+        If any of ``include_tags``, ``include_paths`` or ``include_operation_ids`` is specified,
+        only matching operations and components they reach are loaded. What was kept
+        is reported in ``subset_report``. See :func:`~falcon_heavy.core.openapi.load_specification_subset`.
+        """
+        if include_tags is None and include_paths is None and include_operation_ids is None:
+            openapi_object: o.OpenAPIObject = o.load_specification(
+                path, handlers=handlers, cache_dir=cache_dir, trusted_fingerprint=trusted_fingerprint)
+            return cls.from_openapi_object(openapi_object, compact=compact, type_cache=type_cache)
+
+        openapi_object, report = o.load_specification_subset(
+            path,
+            include_tags=include_tags,
+            include_paths=include_paths,
+            include_operation_ids=include_operation_ids,
+            handlers=handlers,
+            cache_dir=cache_dir,
+            trusted_fingerprint=trusted_fingerprint
+        )
+        self = cls.from_openapi_object(openapi_object, compact=compact, type_cache=type_cache)
+        self.subset_report = report
+        return self
 
     @classmethod
-    def from_openapi_object(cls: ty.Type[T], openapi_object: o.OpenAPIObject) -> T:
+    def from_openapi_object(
+            cls: ty.Type[T],
+            openapi_object: o.OpenAPIObject,
+            compact: bool = False,
+            type_cache: ty.Optional[f.TypeCache] = None
+    ) -> T:
+        """Makes operations of the specification
+
+        :param openapi_object: the specification
+        :param compact: generate all converters and release the specification
+        :param type_cache: cache of generated types. The operations have a private cache
+            by default. Pass :data:`~falcon_heavy.core.factories.shared_type_cache` to share
+            types with operations of other specifications in the process
+        """
         self = cls()
 
-        type_factory = f.TypeFactory()
-        request_factory = f.RequestFactory(type_factory)
-        responses_factory = f.ResponsesFactory(type_factory)
+        converter_factory = _ConverterFactory(type_cache)
 
         security_schemes: ty.Mapping[str, o.AnySecuritySchemeObject] = (
             {} if openapi_object.components is None else openapi_object.components.security_schemes or {})
@@ -104,29 +421,110 @@ class OpenAPIOperations(ty.Dict[OpenAPIPath, ty.Dict[str, OpenAPIOperation]]):
                     operation_level_security = operation.security
 
                 mapping[method] = OpenAPIOperation(
-                    operation_id=operation.operation_id,
+                    operation,
                     method=method,
                     servers=operation_level_servers,
-                    request_converter=request_factory.generate(
-                        parameters=operation.parameters,
-                        request_body=operation.request_body
-                    ),
-                    response_converter=responses_factory.generate(
-                        operation.responses
-                    ),
                     security=operation_level_security,
                     security_schemes=security_schemes,
-                    summary=operation.summary,
-                    description=operation.description,
                     extensions=ChainMap(
                         operation.pattern_properties,
                         path_item.pattern_properties,
                         openapi_object.pattern_properties
-                    )
+                    ),
+                    converter_factory=converter_factory
                 )
 
+        if compact:
+            self.compact()
+
         return self
 
+    def iter_operations(self) -> ty.Iterator[OpenAPIOperation]:
+        for mapping in self.values():
+            yield from mapping.values()
+
+    def warm_up(self, operation_ids: ty.Optional[ty.Iterable[str]] = None) -> int:
+        """Generates converters of operations ahead of the first request
+
+        :param operation_ids: identifiers of operations to prepare. All operations
+            are prepared if not specified
+        :return: number of prepared operations
+        """
+        if operation_ids is None:
+            operations = list(self.iter_operations())
+
+        else:
+            by_id = {
+                operation.operation_id: operation
+                for operation in self.iter_operations()
+                if operation.operation_id is not None
+            }
+
+            operations = []
+            for operation_id in operation_ids:
+                try:
+                    operations.append(by_id[operation_id])
+                except KeyError:
+                    raise OperationNotFoundError("Operation '%s' not found" % operation_id)
+
+        for operation in operations:
+            operation.prepare()
+
+        return len(operations)
+
+    def compact(self) -> None:
+        """Generates all converters and releases the specification
+
+        Servers, security requirements, security schemes and extensions of
+        operations are copied into plain records, and registries of factories
+        are dropped, so the specification objects can be garbage collected.
+        """
+        self.warm_up()
+
+        shared: ty.Dict[int, ty.Tuple[ty.Any, ty.Any]] = {}
+        converter_factories = set()
+        for operation in self.iter_operations():
+            converter_factory = operation.compact(shared)
+            if converter_factory is not None:
+                converter_factories.add(converter_factory)
+
+        generated = list(self._generated)
+        for converter_factory in converter_factories:
+            generated.extend(converter_factory.release())
+        self._generated = tuple(generated)
+
+    def prepare_for_fork(self) -> ForkPreparationReport:
+        """Prepares operations to be shared between forked workers
+
+        Generates all converters, compiles path patterns and moves all objects
+        tracked by the garbage collector into the permanent generation, so
+        collections in workers do not touch the pages holding them.
+        Call it in the master process right before forking.
+
+        The report has sizes of shared and private resident memory of the process.
+        Private pages of the master are shared by workers until they write to them.
+        """
+        count = self.warm_up()
+
+        for uri_template in self.keys():
+            uri_template.regex  # noqa
+
+        gc.collect()
+
+        frozen_objects = 0
+        freeze = getattr(gc, 'freeze', None)  # Python 3.7+
+        if freeze is not None:
+            freeze()
+            frozen_objects = gc.get_freeze_count()
+
+        shared_size, private_size = _get_memory_sizes()
+        return ForkPreparationReport(
+            operations=count,
+            frozen_objects=frozen_objects,
+            shared_size=shared_size,
+            private_size=private_size
+        )
+
     @cachedmethod(operator.attrgetter('_cache'))
     def find(self, path: str, method: str, return_first: bool = True) -> OpenAPIOperation:
         method = method.lower()
@@ -0,0 +1,274 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import typing as ty
+from collections import Mapping
+
+from falcon_heavy.core import types as t, openapi as o
+
+from .operations import OpenAPIOperations
+from .path import OpenAPIPath
+
+__all__ = (
+    'build_operations',
+)
+
+# Types which are equal if their attributes are equal
+_CANONICAL_CLASSES = frozenset((
+    t.AnyType,
+    t.StringType,
+    t.NumberType,
+    t.IntegerType,
+    t.Int32Type,
+    t.Int64Type,
+    t.BooleanType,
+    t.DateType,
+    t.DateTimeType,
+    t.ByteType,
+    t.BinaryType,
+    t.ArrayType,
+    t.ObjectType,
+    t.AllOfType,
+    t.AnyOfType,
+    t.OneOfType,
+    t.NotType,
+))
+
+_SCALARS = (str, bytes, int, float, bool, type(None), t.UndefinedType)
+
+
+def _iter_attributes(obj: ty.Any) -> ty.Iterator[ty.Tuple[str, ty.Any]]:
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name == '__weakref__':
+                continue
+            try:
+                yield name, getattr(obj, name)
+            except AttributeError:
+                pass
+
+    yield from getattr(obj, '__dict__', {}).items()
+
+
+class _Interner:
+
+    """Replaces structurally equal types of merged partitions with a single instance"""
+
+    __slots__ = (
+        'canonical',
+        'memo',
+    )
+
+    def __init__(self) -> None:
+        self.canonical: ty.Dict[ty.Hashable, ty.Any] = {}
+        self.memo: ty.Dict[int, ty.Tuple[ty.Any, ty.Any]] = {}
+
+    def _token(self, value: ty.Any) -> ty.Hashable:
+        if isinstance(value, _SCALARS):
+            return type(value), value
+
+        elif isinstance(value, Mapping):
+            return dict, frozenset((k, self._token(v)) for k, v in value.items())
+
+        elif isinstance(value, (list, tuple)):
+            return list, tuple(self._token(v) for v in value)
+
+        elif isinstance(value, (set, frozenset)):
+            return set, frozenset(self._token(v) for v in value)
+
+        elif isinstance(value, ty.Pattern):
+            return ty.Pattern, value.pattern, value.flags
+
+        elif type(value).__module__.startswith('falcon_heavy.'):
+            # Subtypes are already interned
+            return id(value)
+
+        raise TypeError()
+
+    def intern(self, value: ty.Any) -> ty.Any:
+        if isinstance(value, _SCALARS):
+            return value
+
+        try:
+            return self.memo[id(value)][1]
+        except KeyError:
+            pass
+
+        # The original is kept, so its identifier is not reused while interning
+        self.memo[id(value)] = (value, value)
+
+        result = value
+        if isinstance(value, dict):
+            for k, v in value.items():
+                interned = self.intern(v)
+                if interned is not v:
+                    value[k] = interned
+
+        elif isinstance(value, list):
+            for i, v in enumerate(value):
+                value[i] = self.intern(v)
+
+        elif isinstance(value, tuple):
+            items = [self.intern(v) for v in value]
+            if any(a is not b for a, b in zip(items, value)):
+                result = type(value)(*items) if hasattr(value, '_fields') else tuple(items)
+
+        elif type(value).__module__.startswith('falcon_heavy.'):
+            for name, v in list(_iter_attributes(value)):
+                interned = self.intern(v)
+                if name == 'messages' and isinstance(interned, dict):
+                    # Messages are shared by types of the same class unless overridden
+                    interned = self.canonical.setdefault(self._token(interned), interned)
+                if interned is not v:
+                    setattr(value, name, interned)
+
+            if type(value) in _CANONICAL_CLASSES:
+                try:
+                    key = (type(value), frozenset(
+                        (name, self._token(v)) for name, v in _iter_attributes(value)
+                        # Validators are bound methods derived from the constraints
+                        if name != 'validators'
+                    ))
+                except TypeError:
+                    pass
+                else:
+                    result = self.canonical.setdefault(key, value)
+
+        self.memo[id(value)] = (value, result)
+        return result
+
+
+def _escape(template: str) -> str:
+    return re.sub(r'([*?\[])', r'[\1]', template)
+
+
+def _build_partition(
+        path: str,
+        templates: ty.Sequence[str],
+        components: ty.Sequence[ty.Tuple[str, str]],
+        handlers: ty.Optional[t.RefHandlers],
+        cache_dir: ty.Optional[str],
+        trusted_fingerprint: ty.Optional[str]
+) -> OpenAPIOperations:
+    openapi_object, _ = o.load_specification_subset(
+        path,
+        include_paths=[_escape(template) for template in templates],
+        include_components=components,
+        handlers=handlers,
+        cache_dir=cache_dir,
+        trusted_fingerprint=trusted_fingerprint
+    )
+    return OpenAPIOperations.from_openapi_object(openapi_object, compact=True)
+
+
+def _get_unreachable_components(ref_resolver: t.RefResolver) -> ty.List[ty.Tuple[str, str]]:
+    _, report = o.subset_specification(ref_resolver, include_paths=['*'])
+    components = ref_resolver.referrer.get('components') or {}
+    return [
+        (kind, name)
+        for kind, names in report.components.items()
+        for name in components[kind]
+        if name not in names
+    ]
+
+
+def _check_operation_ids(path: str, document: ty.Mapping) -> None:
+    """Checks uniqueness of operation identifiers across partitions"""
+    message = o.OperationObjectType.MESSAGES['operation_id']
+    seen: ty.Dict[str, t.Path] = {}
+    root = t.Path(path) / 'paths'
+    for template, path_item in (document.get('paths') or {}).items():
+        if not isinstance(path_item, Mapping):
+            continue
+        for method in o.HTTP_METHODS:
+            operation = path_item.get(method)
+            if not isinstance(operation, Mapping) or not isinstance(operation.get('operationId'), str):
+                continue
+            operation_id = operation['operationId']
+            current = root / template / method / 'operationId'
+            if operation_id in seen:
+                raise t.SchemaError(t.Error(current, message.format(operation_id, seen[operation_id])))
+            seen[operation_id] = current
+
+
+def build_operations(
+        path: str,
+        processes: ty.Optional[int] = None,
+        partitions: ty.Optional[int] = None,
+        handlers: ty.Optional[t.RefHandlers] = None,
+        cache_dir: ty.Optional[str] = None,
+        trusted_fingerprint: ty.Optional[str] = None
+) -> OpenAPIOperations:
+    """Builds operations of the specification in a pool of processes
+
+    Paths are split into partitions. Each partition is loaded, validated and
+    compiled in a separate process, just like a subset of the specification
+    (see :func:`~falcon_heavy.core.openapi.load_specification_subset`). Components
+    unreachable from paths are validated in one more process. Compiled partitions are merged in the order
+    of paths of the specification, and structurally equal types of different
+    partitions are replaced with a single instance.
+
+    The result is the same as of ``OpenAPIOperations.from_file(path, compact=True)``.
+
+    :param path: path of the specification file
+    :param processes: number of processes. Defaults to the number of CPUs
+    :param partitions: number of partitions. Defaults to twice the number of processes
+    :param handlers: a mapping from URI schemes to functions that retrieve referenced documents.
+        Must be picklable
+    :param cache_dir: a directory where parsed documents and documents retrieved
+        over HTTP(S) are kept
+    :param trusted_fingerprint: fingerprint of already validated specification
+    """
+    path = os.path.abspath(path)
+    ref_resolver = o.make_ref_resolver(path, handlers=handlers, cache_dir=cache_dir)
+    document = ref_resolver.referrer
+    _check_operation_ids(path, document)
+
+    templates = [template for template in (document.get('paths') or {})]
+    processes = processes or os.cpu_count() or 1
+    partitions = max(1, min(partitions or processes * 2, len(templates)))
+    tasks: ty.List[ty.Tuple[ty.List[str], ty.List[ty.Tuple[str, str]]]] = [
+        (templates[i::partitions], []) for i in range(partitions)]
+
+    unreachable = _get_unreachable_components(ref_resolver)
+    if unreachable:
+        tasks.append(([], unreachable))
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(_build_partition, path, chunk, components, handlers, cache_dir, trusted_fingerprint)
+            for chunk, components in tasks
+        ]
+        results: ty.List[OpenAPIOperations] = [future.result() for future in futures]
+
+    interner = _Interner()
+    compiled: ty.Dict[str, ty.Tuple[OpenAPIPath, ty.Dict]] = {}
+    generated: ty.List[ty.Any] = []
+    for partition in results:
+        for uri_template, mapping in partition.items():
+            compiled[uri_template.template] = (uri_template, interner.intern(mapping))
+        generated.extend(interner.intern(partition._generated))
+
+    result = OpenAPIOperations()
+    for template in templates:
+        template = OpenAPIPath(template).template
+        if template in compiled:
+            uri_template, mapping = compiled[template]
+            result[uri_template] = mapping
+    result._generated = tuple(generated)
+    return result
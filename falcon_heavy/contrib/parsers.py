@@ -12,15 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import codecs
 import typing as ty
 
 import mimeparse
 
+from falcon_heavy.core import types as t, make_request_conversion_context
+from falcon_heavy.core.encoders import get_json_backend
+from falcon_heavy.core.factories import MultiPartType
 from falcon_heavy.http.multipart_parser import MultiPartParser as _MultiPartParser, MultiPartParserError
+from falcon_heavy.http.upload_handlers import AbstractUploadHandler
 from falcon_heavy.http.exceptions import RequestDataError
-from falcon_heavy.http.datastructures import MultiValueDict
-from falcon_heavy.http.utils import limited_parse_qsl
+from falcon_heavy.http.utils import parse_form
 
 __all__ = (
     'ParseError',
@@ -42,6 +45,19 @@ class AbstractParser:
     def parse(self, stream: ty.IO, content_type: str, content_length: int) -> ty.Any:
         raise NotImplementedError()
 
+    def parse_media(
+            self,
+            stream: ty.IO,
+            content_type: str,
+            content_length: int,
+            media_type: ty.Optional[t.AbstractConvertible]
+    ) -> ty.Any:
+        """Parses content that will be converted by the type of the media
+
+        Parsers may check the content against the type while reading it.
+        """
+        return self.parse(stream, content_type, content_length)
+
 
 class JSONParser(AbstractParser):
 
@@ -52,14 +68,31 @@ class JSONParser(AbstractParser):
 
     def parse(self, stream: ty.IO, content_type: str, content_length: int) -> ty.Mapping:
         params = mimeparse.parse_mime_type(content_type)[2]
+        charset = params.get('charset', self.encoding)
         try:
-            return json.loads(stream.read().decode(params.get('charset', self.encoding)))
-        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            data = stream.read()
+            if codecs.lookup(charset).name != 'utf-8':
+                # Backends parse UTF-8 bytes without decoding them first
+                data = data.decode(charset)
+            return get_json_backend().loads(data)
+        except (LookupError, TypeError, ValueError) as e:
             raise ParseError("Couldn't parse JSON") from e
 
 
 class MultiPartParser(AbstractParser):
 
+    """Parser of multi-part data
+
+    In lazy mode parts aren't read in advance. The content of the request is
+    an iterator of pairs of a field name and a converted part, which reads
+    the request as the view iterates over it. A part must be read before
+    the next one is requested. Parse errors are raised by the iterator.
+
+    :param upload_handler: handler of uploaded files. Defaults to
+        :class:`~falcon_heavy.http.upload_handlers.TemporaryFileUploadHandler`
+    :param lazy: parse parts in order of their arrival while the view iterates over them
+    """
+
     media_types = ('multipart/form-data', )
 
     def __init__(
@@ -68,15 +101,40 @@ class MultiPartParser(AbstractParser):
             data_upload_max_memory_size: int = 2621440,
             file_upload_max_memory_size: int = 2621440,
             file_upload_temp_dir: ty.Optional[str] = None,
-            encoding: str = 'utf-8'
+            encoding: str = 'utf-8',
+            upload_handler: ty.Optional[AbstractUploadHandler] = None,
+            lazy: bool = False
     ) -> None:
         self.data_upload_max_number_fields = data_upload_max_number_fields
         self.data_upload_max_memory_size = data_upload_max_memory_size
         self.file_upload_max_memory_size = file_upload_max_memory_size
         self.file_upload_temp_dir = file_upload_temp_dir
         self.encoding = encoding
+        self.upload_handler = upload_handler
+        self.lazy = lazy
+
+    @staticmethod
+    def _iter_parts(parser: _MultiPartParser) -> ty.Iterator[ty.Tuple[str, ty.Any]]:
+        try:
+            yield from parser.iter_parts()
+        except (MultiPartParserError, RequestDataError) as e:
+            raise ParseError("Couldn't parse multi-part data") from e
+
+    def parse(self, stream: ty.IO, content_type: str, content_length: int) -> ty.Any:
+        return self.parse_media(stream, content_type, content_length, None)
+
+    def parse_media(
+            self,
+            stream: ty.IO,
+            content_type: str,
+            content_length: int,
+            media_type: ty.Optional[t.AbstractConvertible]
+    ) -> ty.Any:
+        part_checker = None
+        if isinstance(media_type, MultiPartType) and not self.lazy:
+            # Lazily converted parts are checked as they arrive anyway
+            part_checker = media_type.make_part_checker(t.Path() / 'content', **make_request_conversion_context())
 
-    def parse(self, stream: ty.IO, content_type: str, content_length: int) -> ty.Mapping[str, ty.List[ty.Any]]:
         parser = _MultiPartParser(
             stream,
             content_type,
@@ -85,9 +143,14 @@ class MultiPartParser(AbstractParser):
             data_upload_max_memory_size=self.data_upload_max_memory_size,
             file_upload_max_memory_size=self.file_upload_max_memory_size,
             file_upload_temp_dir=self.file_upload_temp_dir,
-            encoding=self.encoding
+            encoding=self.encoding,
+            upload_handler=self.upload_handler,
+            part_checker=part_checker
         )
 
+        if self.lazy:
+            return self._iter_parts(parser)
+
         try:
             form, files = parser.parse()
         except (MultiPartParserError, RequestDataError) as e:
@@ -113,12 +176,6 @@ class FormParser(AbstractParser):
         self.encoding = encoding
 
     def parse(self, stream: ty.IO, content_type: str, content_length: int) -> ty.Mapping[str, ty.Any]:
-        form = MultiValueDict()
-        parse_qsl_kwargs = {
-            'keep_blank_values': True,
-            'encoding': self.encoding,
-            'fields_limit': self.data_upload_max_number_fields
-        }
         query_string = stream.read()
 
         if isinstance(query_string, bytes):
@@ -130,9 +187,10 @@ class FormParser(AbstractParser):
                 query_string = query_string.decode('iso-8859-1')
 
         try:
-            for key, value in limited_parse_qsl(query_string, **parse_qsl_kwargs):
-                form.appendlist(key, value)
+            return parse_form(
+                query_string,
+                encoding=self.encoding,
+                fields_limit=self.data_upload_max_number_fields
+            )
         except (ValueError, TypeError, RequestDataError) as e:
             raise ParseError("Couldn't parse form data") from e
-
-        return form.dict()
@@ -0,0 +1,333 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import time
+import hashlib
+import warnings
+import threading
+import typing as ty
+from collections import Mapping
+from urllib.parse import urljoin, urldefrag, urlsplit, unquote
+
+from falcon_heavy.core import types as t, openapi as o, factories as f
+from falcon_heavy.core.types.ref_resolver import _iter_refs
+
+from .operations import OpenAPIOperations, OpenAPIOperation
+from .path import OpenAPIPath
+
+__all__ = (
+    'ReloadReport',
+    'OpenAPIOperationsReloader',
+)
+
+OperationKey = ty.Tuple[str, str]  # template and method
+FileStamps = ty.Dict[str, ty.Tuple[int, int]]
+
+
+def _update_hash(h: ty.Any, value: ty.Any) -> None:
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Mapping):
+            h.update(b'{')
+            items = sorted(node.items(), key=lambda item: str(item[0]))
+            for key, _ in items:
+                h.update(repr(key).encode('utf-8'))
+            h.update(b'}')
+            stack.extend(v for _, v in reversed(items))
+        elif isinstance(node, list):
+            h.update(b'[%d]' % len(node))
+            stack.extend(reversed(node))
+        else:
+            h.update(repr(node).encode('utf-8'))
+            h.update(b',')
+
+
+class _DependencyGraph:
+
+    """Digests of operations of a specification
+
+    A digest of an operation covers its own definition and all fragments
+    of documents it references, directly or through other fragments.
+    """
+
+    __slots__ = (
+        'ref_resolver',
+        '_fragments',
+    )
+
+    def __init__(self, ref_resolver: t.RefResolver) -> None:
+        self.ref_resolver = ref_resolver
+        self._fragments: ty.Dict[str, ty.Tuple[str, ty.List[str]]] = {}
+
+    def _get_fragment(self, url: str) -> ty.Tuple[str, ty.List[str]]:
+        """Returns digest of the fragment and URLs it references"""
+        try:
+            return self._fragments[url]
+        except KeyError:
+            pass
+
+        try:
+            fragment = self.ref_resolver.resolve_from_url(url)
+        except t.RefResolutionError:
+            result: ty.Tuple[str, ty.List[str]] = (url, [])
+
+        else:
+            h = hashlib.sha256()
+            _update_hash(h, fragment)
+            document_url, _ = urldefrag(url)
+            result = (h.hexdigest(), [urljoin(document_url, ref) for ref in _iter_refs(fragment)])
+
+        self._fragments[url] = result
+        return result
+
+    def digest(self, base_uri: str, *nodes: ty.Any) -> str:
+        h = hashlib.sha256()
+        pending: ty.List[str] = []
+        for node in nodes:
+            _update_hash(h, node)
+            pending.extend(urljoin(base_uri, ref) for ref in _iter_refs(node))
+
+        dependencies: ty.Set[str] = set()
+        while pending:
+            url = pending.pop()
+            if url in dependencies:
+                continue
+            dependencies.add(url)
+            pending.extend(self._get_fragment(url)[1])
+
+        for url in sorted(dependencies):
+            h.update(url.encode('utf-8'))
+            h.update(self._get_fragment(url)[0].encode('ascii'))
+
+        return h.hexdigest()
+
+    def operation_digests(self) -> ty.Dict[OperationKey, str]:
+        base_uri = self.ref_resolver.base_uri
+        root = self.ref_resolver.referrer
+        components = root.get('components') or {}
+        common = (
+            {k: v for k, v in root.items() if k not in ('paths', 'components')},
+            components.get('securitySchemes') if isinstance(components, Mapping) else None
+        )
+
+        result = {}
+        for template, path_item in (root.get('paths') or {}).items():
+            template = OpenAPIPath(template).template
+            for method in o.HTTP_METHODS:
+                if '$ref' in path_item:
+                    own = path_item
+                elif method in path_item:
+                    own = {k: v for k, v in path_item.items() if k == method or k not in o.HTTP_METHODS}
+                else:
+                    continue
+                result[(template, method)] = self.digest(base_uri, own, *common)
+
+        return result
+
+
+def _get_local_files(ref_resolver: t.RefResolver) -> ty.List[str]:
+    paths = []
+    for url in ref_resolver.store:
+        parts = urlsplit(url)
+        if parts.scheme == 'file':
+            paths.append(unquote(parts.path))
+    return paths
+
+
+def _stamp(paths: ty.Iterable[str]) -> FileStamps:
+    stamps = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps[path] = (-1, -1)
+        else:
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+class ReloadReport(ty.NamedTuple):
+    operations: int  # number of operations in the new version
+    reused: int  # number of operations taken from the previous version
+
+
+class OpenAPIOperationsReloader:
+
+    """Operations of a specification that are reloaded when its files change
+
+    The specification file and all local files it references are watched.
+    A changed specification is loaded anew, and operations which definitions
+    and referenced components are unchanged are taken from the previous
+    version along with their converters. Then the routing table is swapped
+    at once, so requests being processed finish with the previous version.
+
+    Can be passed to decorators in place of :class:`OpenAPIOperations`.
+
+    :param path: path of the specification file
+    :param handlers: a mapping from URI schemes to functions that retrieve referenced documents
+    :param cache_dir: a directory where parsed documents and documents retrieved
+        over HTTP(S) are kept
+    :param type_cache: cache of generated types. Versions of the specification share
+        a private cache by default. Pass :data:`~falcon_heavy.core.factories.shared_type_cache`
+        to share types with operations of other specifications in the process
+    :param warm_up: generate converters of new operations before the swap
+    :param on_reload: called with the report after each reload
+    :param on_error: called with the exception when a changed specification can't be
+        loaded. The previous version stays in use. Issues a warning by default
+    """
+
+    def __init__(
+            self,
+            path: str,
+            handlers: ty.Optional[t.RefHandlers] = None,
+            cache_dir: ty.Optional[str] = None,
+            type_cache: ty.Optional[f.TypeCache] = None,
+            warm_up: bool = True,
+            on_reload: ty.Optional[ty.Callable[[ReloadReport], None]] = None,
+            on_error: ty.Optional[ty.Callable[[Exception], None]] = None
+    ) -> None:
+        self.path = os.path.abspath(path)
+        self.handlers = handlers
+        self.cache_dir = cache_dir
+        # Versions of the specification share types with each other
+        self.type_cache = f.TypeCache() if type_cache is None else type_cache
+        self.warm_up = warm_up
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: ty.Optional[threading.Thread] = None
+        self._stamps: FileStamps = {}
+        self._digests: ty.Dict[OperationKey, str] = {}
+        self._operations = OpenAPIOperations()
+        self.reload()
+
+    @property
+    def operations(self) -> OpenAPIOperations:
+        """Current version of operations"""
+        return self._operations
+
+    @property
+    def files(self) -> ty.List[str]:
+        """Watched files"""
+        return list(self._stamps)
+
+    def find(self, path: str, method: str, return_first: bool = True) -> OpenAPIOperation:
+        return self._operations.find(path, method, return_first=return_first)
+
+    def iter_operations(self) -> ty.Iterator[OpenAPIOperation]:
+        return self._operations.iter_operations()
+
+    def is_changed(self) -> bool:
+        return _stamp(self._stamps) != self._stamps
+
+    def check(self) -> ty.Optional[ReloadReport]:
+        """Reloads the specification if any of watched files has changed
+
+        :return: report of the reload or None if nothing has changed or
+            the specification can't be loaded
+        """
+        if not self.is_changed():
+            return None
+
+        try:
+            return self.reload()
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(e)
+            else:
+                warnings.warn("Specification %s can't be reloaded: %s" % (self.path, e), RuntimeWarning)
+            return None
+
+    def reload(self) -> ReloadReport:
+        """Loads the specification and swaps operations"""
+        with self._lock:
+            # Files are stamped before they are read, so a change made while loading
+            # is found by the next check
+            started = time.time()
+            known = _stamp(set(self._stamps) | {self.path})
+            ref_resolver = o.make_ref_resolver(self.path, handlers=self.handlers, cache_dir=self.cache_dir)
+            stamps: FileStamps = {}
+            for path, stamp in _stamp(_get_local_files(ref_resolver)).items():
+                if path in known:
+                    stamps[path] = known[path]
+                elif stamp[0] < (started - 1) * 10 ** 9:
+                    stamps[path] = stamp
+                else:
+                    # A newly referenced file is stamped after it's read. It was modified
+                    # around that time, so it's reloaded by the next check to be sure
+                    stamps[path] = (-1, -1)
+
+            # Digests and operations are made of the same documents
+            digests = _DependencyGraph(ref_resolver).operation_digests()
+            openapi_object = o.convert_specification(ref_resolver)
+            operations = OpenAPIOperations.from_openapi_object(openapi_object, type_cache=self.type_cache)
+
+            previous = {
+                (uri_template.template, method): operation
+                for uri_template, mapping in self._operations.items()
+                for method, operation in mapping.items()
+            }
+
+            reused = 0
+            new = []
+            for uri_template, mapping in operations.items():
+                for method in list(mapping):
+                    key = (uri_template.template, method)
+                    if key in previous and key in digests and self._digests.get(key) == digests[key]:
+                        mapping[method] = previous[key]
+                        reused += 1
+                    else:
+                        new.append(mapping[method])
+
+            if self.warm_up:
+                for operation in new:
+                    operation.prepare()
+
+            self._operations = operations
+            self._stamps = stamps
+            self._digests = digests
+
+        report = ReloadReport(operations=reused + len(new), reused=reused)
+        if self.on_reload is not None:
+            self.on_reload(report)
+        return report
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.check()
+
+    def start(self, interval: float = 1.0) -> None:
+        """Starts watching files in a background thread
+
+        :param interval: interval between checks in seconds
+        """
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, args=(interval, ), name='openapi-reloader', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching files"""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
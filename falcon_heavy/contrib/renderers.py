@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import typing as ty
 
-from falcon_heavy.core.encoders import FalconHeavyJSONEncoder
+from falcon_heavy.core.encoders import get_json_backend
 
 __all__ = (
+    'RenderedContent',
     'RenderError',
     'AbstractRenderer',
     'JSONRenderer',
@@ -25,6 +25,10 @@ __all__ = (
 )
 
 
+# Renderers may return text, which is encoded by the framework
+RenderedContent = ty.Union[bytes, memoryview, str]
+
+
 class RenderError(Exception):
     pass
 
@@ -33,7 +37,7 @@ class AbstractRenderer:
 
     media_types: ty.ClassVar[ty.Tuple[str, ...]] = NotImplemented
 
-    def render(self, content: ty.Any) -> str:
+    def render(self, content: ty.Any) -> RenderedContent:
         raise NotImplementedError()
 
 
@@ -41,9 +45,9 @@ class JSONRenderer(AbstractRenderer):
 
     media_types = ('application/json', )
 
-    def render(self, content: ty.Any) -> str:
+    def render(self, content: ty.Any) -> RenderedContent:
         try:
-            return json.dumps(content, cls=FalconHeavyJSONEncoder, ensure_ascii=False)
+            return get_json_backend().dumpb(content)
         except (ValueError, TypeError) as e:
             raise RenderError("Couldn't render JSON") from e
 
@@ -52,8 +56,9 @@ class TextRenderer(AbstractRenderer):
 
     media_types = ('text/plain', )
 
-    def render(self, content: ty.Any) -> str:
+    def render(self, content: ty.Any) -> RenderedContent:
         try:
+            # Text is encoded by the charset of the response
             return str(content)
         except (ValueError, TypeError) as e:
             raise RenderError("Couldn't render text") from e
@@ -21,6 +21,7 @@ from pathlib import Path
 from urllib.parse import quote
 
 from falcon_heavy.core import types as t
+from falcon_heavy.http.multipart_encoder import MultiPartEncoder
 
 __all__ = (
     'Cookie',
@@ -31,6 +32,7 @@ __all__ = (
     'OpenAPITextResponse',
     'OpenAPIJSONResponse',
     'OpenAPIStreamingResponse',
+    'OpenAPIMultiPartResponse',
     'OpenAPIFileResponse',
 )
 
@@ -259,6 +261,50 @@ class OpenAPIStreamingResponse(OpenAPIResponse):
         )
 
 
+class OpenAPIMultiPartResponse(OpenAPIStreamingResponse):
+
+    """Response of multipart content that is encoded while it's sent
+
+    Parts are converted and serialized by encodings of the response content.
+    Content length is known if sizes of all files are known.
+
+    :param parts: parts of the content (see :class:`~falcon_heavy.http.MultiPartEncoder`)
+    :param subtype: subtype of the multipart media type
+    :param boundary: boundary of parts. Generated if not specified
+    """
+
+    def __init__(
+            self,
+            parts: ty.Any,
+            status_code: int = 200,
+            headers: ty.Optional[Headers] = None,
+            cookies: ty.Optional[Cookies] = None,
+            subtype: str = 'form-data',
+            boundary: ty.Optional[str] = None,
+            **context: ty.Any
+    ) -> None:
+        encoder = MultiPartEncoder(parts, subtype=subtype, boundary=boundary)
+        super(OpenAPIMultiPartResponse, self).__init__(
+            stream=ty.cast(ty.IO, encoder),
+            status_code=status_code,
+            headers=headers,
+            cookies=cookies,
+            content_type=encoder.content_type,
+            **context
+        )
+
+    @property
+    def content_length(self) -> ty.Optional[int]:
+        content_length = self.headers.get('content-length')
+        if content_length is None and isinstance(self.content, MultiPartEncoder):
+            content_length = self.content.content_length
+        return content_length
+
+    @content_length.setter
+    def content_length(self, value: int) -> None:
+        self.headers['content-length'] = value
+
+
 ENCODING_MAP = {
     'bzip2': 'application/x-bzip',
     'gzip': 'application/gzip',
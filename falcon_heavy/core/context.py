@@ -24,12 +24,18 @@ __all__ = (
 
 
 def make_specification_conversion_context(
-        base_uri: str, referrer: ty.Mapping, handlers: ty.Optional[t.RefHandlers] = None) -> ty.Mapping[str, ty.Any]:
+        base_uri: str,
+        referrer: ty.Mapping,
+        handlers: ty.Optional[t.RefHandlers] = None,
+        cache_dir: ty.Optional[str] = None,
+        trusted: bool = False
+) -> ty.Mapping[str, ty.Any]:
     return {
         'registry': {},
         'operation_ids': {},
         'entity': t.ConvertibleEntity.SPECIFICATION,
-        'ref_resolver': t.RefResolver(base_uri, referrer, handlers=handlers)
+        'ref_resolver': t.RefResolver(base_uri, referrer, handlers=handlers, cache_dir=cache_dir),
+        'trusted': trusted
     }
 
 
@@ -14,25 +14,217 @@
 
 import json
 import decimal
+import threading
 import typing as ty
 
 from falcon_heavy.core import types as t
 
 __all__ = (
     'FalconHeavyJSONEncoder',
+    'AbstractJSONBackend',
+    'StdlibJSONBackend',
+    'OrjsonBackend',
+    'RapidJSONBackend',
+    'UjsonBackend',
+    'get_json_backend',
+    'set_json_backend',
 )
 
 
+def _flatten(o: t.Object) -> ty.Mapping[str, ty.Any]:
+    # Usually all properties are in a single map, so it's encoded as is
+    maps = [mapping for mapping in o.maps if mapping]
+    if not maps:
+        return {}
+
+    if len(maps) == 1 and isinstance(maps[0], dict):
+        return maps[0]
+
+    result: ty.Dict[str, ty.Any] = {}
+    for mapping in reversed(maps):
+        result.update(mapping)
+    return result
+
+
+def _default(o: ty.Any) -> ty.Any:
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+
+    elif isinstance(o, t.Object):
+        return _flatten(o)
+
+    elif isinstance(o, t.Path):
+        return str(o)
+
+    raise TypeError("Object of type %s is not JSON serializable" % o.__class__.__name__)
+
+
 class FalconHeavyJSONEncoder(json.JSONEncoder):
 
     def default(self, o: ty.Any) -> ty.Any:
-        if isinstance(o, decimal.Decimal):
-            return str(o)
+        if isinstance(o, (decimal.Decimal, t.Object, t.Path)):
+            return _default(o)
 
-        elif isinstance(o, t.Object):
-            return dict(o)
+        return super(FalconHeavyJSONEncoder, self).default(o)
 
-        elif isinstance(o, t.Path):
-            return str(o)
 
-        return super(FalconHeavyJSONEncoder, self).default(o)
+class AbstractJSONBackend:
+
+    """Parses and serializes JSON
+
+    Serialized values may contain objects, decimals and paths.
+    Errors are instances of `ValueError` or `TypeError`.
+    """
+
+    __slots__ = ()
+
+    def loads(self, data: ty.Union[bytes, str]) -> ty.Any:
+        raise NotImplementedError()
+
+    def dumps(self, value: ty.Any) -> str:
+        raise NotImplementedError()
+
+    def dumpb(self, value: ty.Any) -> bytes:
+        """Serializes the value to UTF-8 encoded JSON"""
+        return self.dumps(value).encode('utf-8')
+
+
+class StdlibJSONBackend(AbstractJSONBackend):
+
+    """Backend of the standard :mod:`json` module"""
+
+    __slots__ = ('encoder', )
+
+    def __init__(self) -> None:
+        # Encoders are stateless, so a single one is reused
+        self.encoder = FalconHeavyJSONEncoder(ensure_ascii=False)
+
+    def loads(self, data: ty.Union[bytes, str]) -> ty.Any:
+        # Encoding of bytes is detected as the specification requires
+        return json.loads(data)
+
+    def dumps(self, value: ty.Any) -> str:
+        return self.encoder.encode(value)
+
+
+class _FallbackJSONBackend(AbstractJSONBackend):
+
+    # Values that the library can't serialize, e.g. big integers, are
+    # serialized by the standard module
+
+    __slots__ = ('fallback', )
+
+    def __init__(self) -> None:
+        self.fallback = StdlibJSONBackend()
+
+    def _dumps(self, value: ty.Any) -> str:
+        raise NotImplementedError()
+
+    def dumps(self, value: ty.Any) -> str:
+        try:
+            return self._dumps(value)
+        except (TypeError, OverflowError):
+            return self.fallback.dumps(value)
+
+    def _dumpb(self, value: ty.Any) -> bytes:
+        return self._dumps(value).encode('utf-8')
+
+    def dumpb(self, value: ty.Any) -> bytes:
+        try:
+            return self._dumpb(value)
+        except (TypeError, OverflowError):
+            return self.fallback.dumpb(value)
+
+
+class OrjsonBackend(_FallbackJSONBackend):
+
+    """Backend of `orjson <https://github.com/ijl/orjson>`_"""
+
+    __slots__ = ('orjson', )
+
+    def __init__(self) -> None:
+        super(OrjsonBackend, self).__init__()
+        import orjson
+        self.orjson = orjson
+
+    def loads(self, data: ty.Union[bytes, str]) -> ty.Any:
+        return self.orjson.loads(data)
+
+    def _dumps(self, value: ty.Any) -> str:
+        return self._dumpb(value).decode('utf-8')
+
+    def _dumpb(self, value: ty.Any) -> bytes:
+        return self.orjson.dumps(value, default=_default, option=self.orjson.OPT_NON_STR_KEYS)
+
+
+class RapidJSONBackend(_FallbackJSONBackend):
+
+    """Backend of `python-rapidjson <https://github.com/python-rapidjson/python-rapidjson>`_"""
+
+    __slots__ = ('rapidjson', )
+
+    def __init__(self) -> None:
+        super(RapidJSONBackend, self).__init__()
+        import rapidjson
+        self.rapidjson = rapidjson
+
+    def loads(self, data: ty.Union[bytes, str]) -> ty.Any:
+        return self.rapidjson.loads(data)
+
+    def _dumps(self, value: ty.Any) -> str:
+        return self.rapidjson.dumps(value, ensure_ascii=False, default=_default)
+
+
+class UjsonBackend(_FallbackJSONBackend):
+
+    """Backend of `ujson <https://github.com/ultrajson/ultrajson>`_ 5.0 or later"""
+
+    __slots__ = ('ujson', )
+
+    def __init__(self) -> None:
+        super(UjsonBackend, self).__init__()
+        import ujson
+        self.ujson = ujson
+
+    def loads(self, data: ty.Union[bytes, str]) -> ty.Any:
+        return self.ujson.loads(data)
+
+    def _dumps(self, value: ty.Any) -> str:
+        return self.ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False, default=_default)
+
+
+# The fastest installed library is preferred
+_BACKEND_CLASSES: ty.Tuple[ty.Type[AbstractJSONBackend], ...] = (
+    OrjsonBackend,
+    RapidJSONBackend,
+    UjsonBackend,
+    StdlibJSONBackend,
+)
+
+_backend: ty.Optional[AbstractJSONBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_json_backend() -> AbstractJSONBackend:
+    """Returns the JSON backend. The first available is selected on first use"""
+    global _backend
+    if _backend is not None:
+        return _backend
+
+    with _backend_lock:
+        if _backend is None:
+            for backend_class in _BACKEND_CLASSES:
+                try:
+                    _backend = backend_class()
+                except ImportError:
+                    continue
+                break
+
+        assert _backend is not None
+        return _backend
+
+
+def set_json_backend(backend: AbstractJSONBackend) -> None:
+    """Replaces the JSON backend, e.g. with :class:`StdlibJSONBackend` to get the same output everywhere"""
+    global _backend
+    _backend = backend
@@ -12,12 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import typing as ty
 
 import mimeparse
 
-from falcon_heavy.core.encoders import FalconHeavyJSONEncoder
+from falcon_heavy.core.encoders import get_json_backend
 
 __all__ = (
     'AbstractMediaHandler',
@@ -43,10 +42,10 @@ class JSONHandler(AbstractMediaHandler):
     __slots__ = ()
 
     def deserialize(self, value: str) -> ty.Any:
-        return json.loads(value)
+        return get_json_backend().loads(value)
 
     def serialize(self, value: ty.Mapping) -> str:
-        return json.dumps(value, cls=FalconHeavyJSONEncoder, ensure_ascii=False)
+        return get_json_backend().dumps(value)
 
 
 _handlers: ty.Dict[str, AbstractMediaHandler] = {
@@ -12,13 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import typing as ty
+from collections import Iterator
 
 import mimeparse
 
 from falcon_heavy.core import types as t, openapi as o
 from falcon_heavy.core.utils import comma_delimited
 from falcon_heavy.http.datastructures import FormStorage, FileStorage
+from falcon_heavy.http.multipart_encoder import MultiPartEncoder
 
 from .media_handlers import get_media_handler
 from .parameters import ParametersType, ParameterType, MediaParameterStyle
@@ -29,6 +32,11 @@ from .parameter_styles import BaseParameterStyle, PARAMETER_STYLES, IDENTITY_PAR
 __all__ = (
     'Part',
     'AnyStorage',
+    'PartChecker',
+    'PartIterator',
+    'MultiPartType',
+    'ResponsePartType',
+    'MultiPartResponseType',
     'AbstractMediaTypeFactory',
     'RequestMediaTypeFactory',
     'ResponseMediaTypeFactory',
@@ -137,6 +145,309 @@ class PartAdapter(t.BaseType[Part]):
         )
 
 
+class PartChecker:
+
+    """Checks parts of multipart content by their headers
+
+    Unknown and repeated fields, arrays with too many items, not allowed
+    content types and invalid headers of parts are reported before data
+    of a part are read.
+
+    :param subtype: type of the whole content
+    :param path: path of the content
+    :param context: conversion context
+    """
+
+    MESSAGES: ty.ClassVar[t.Messages] = {
+        'repeated': "Field must not be repeated"
+    }
+
+    __slots__ = (
+        'subtype',
+        'path',
+        'context',
+        'counts'
+    )
+
+    def __init__(self, subtype: t.ObjectType, path: t.Path, context: ty.Dict[str, ty.Any]) -> None:
+        self.subtype = subtype
+        self.path = path
+        self.context = context
+        self.counts: ty.Dict[str, int] = {}
+
+    def count(self, name: str) -> ty.Tuple[t.AbstractConvertible, t.Path]:
+        """Counts a part of the field
+
+        :return: type and path of the part
+        """
+        subtype = self.subtype
+        property_type = subtype.properties.get(name)
+        if property_type is None:
+            raise t.SchemaError(t.Error(self.path, subtype.messages['additional_properties'].format(name)))
+
+        path = self.path / name
+        index = self.counts.get(name, 0)
+        self.counts[name] = index + 1
+
+        if isinstance(property_type, t.ArrayType):
+            if property_type.max_items is not None and index >= property_type.max_items:
+                raise t.SchemaError(t.Error(
+                    path, property_type.messages['max_items'].format(property_type.max_items, index + 1)))
+
+            return property_type.item_type, path / index
+
+        if index:
+            raise t.SchemaError(t.Error(path, self.MESSAGES['repeated']))
+
+        return property_type, path
+
+    def __call__(self, name: str, filename: ty.Optional[str], headers: ty.Mapping[str, str]) -> None:
+        part_type, path = self.count(name)
+        if not isinstance(part_type, PartAdapter) or not isinstance(part_type.subtype, t.ObjectType):
+            return
+
+        properties = part_type.subtype.properties
+        content_type = headers.get('content-type') or part_type.default_content_type
+        context = dict(self.context, strict=False)
+        errors: ty.List[t.Error] = []
+        for property_name, value in (('contentType', content_type), ('headers', headers)):
+            if value is None:
+                continue
+
+            try:
+                properties[property_name].convert(value, path / property_name, **context)
+            except t.SchemaError as e:
+                errors.extend(e.errors)
+
+        if errors:
+            raise t.SchemaError(*errors)
+
+    def finish(self) -> None:
+        """Checks that required fields and enough array items were received"""
+        subtype = self.subtype
+        errors: ty.List[t.Error] = []
+
+        missed = sorted(name for name in subtype.required - subtype.read_only if name not in self.counts)
+        if missed:
+            errors.append(t.Error(self.path, subtype.messages['required'].format(comma_delimited(missed))))
+
+        for name, property_type in subtype.properties.items():
+            count = self.counts.get(name, 0)
+            if (
+                    isinstance(property_type, t.ArrayType) and
+                    property_type.min_items is not None and
+                    0 < count < property_type.min_items
+            ):
+                errors.append(t.Error(
+                    self.path / name, property_type.messages['min_items'].format(property_type.min_items, count)))
+
+        if errors:
+            raise t.SchemaError(*errors)
+
+
+class PartIterator(ty.Iterator[ty.Tuple[str, ty.Any]]):
+
+    """Converts parts of multipart content in order of their arrival
+
+    Yields pairs of a field name and the converted part. Unknown and repeated
+    fields, and arrays with too many items are reported as soon as a part
+    arrives; missed fields and arrays with too few items are reported at the end.
+    Uniqueness of array items is not checked.
+
+    :param subtype: type of the whole content
+    :param parts: pairs of a field name and a storage
+    :param path: path of the content
+    :param context: conversion context
+    """
+
+    __slots__ = (
+        'parts',
+        'checker',
+        'context'
+    )
+
+    def __init__(
+            self,
+            subtype: t.ObjectType,
+            parts: ty.Iterator[ty.Tuple[str, AnyStorage]],
+            path: t.Path,
+            context: ty.Dict[str, ty.Any]
+    ) -> None:
+        self.parts = parts
+        self.checker = PartChecker(subtype, path, context)
+        self.context = context
+
+    def __iter__(self) -> 'PartIterator':
+        return self
+
+    def __next__(self) -> ty.Tuple[str, ty.Any]:
+        try:
+            name, storage = next(self.parts)
+        except StopIteration:
+            self.checker.finish()
+            raise
+
+        part_type, path = self.checker.count(name)
+        return name, part_type.convert(storage, path, **self.context)
+
+
+class MultiPartType(t.AbstractConvertible):
+
+    """Type of multipart content
+
+    Converts a mapping of all fields at once, or an iterator of pairs of
+    a field name and a storage lazily (see :class:`PartIterator`).
+
+    :param subtype: type of the whole content
+    """
+
+    MESSAGES: ty.ClassVar[t.Messages] = {}
+
+    __slots__ = ('subtype', )
+
+    def __init__(self, subtype: t.ObjectType, **kwargs: ty.Any) -> None:
+        super(MultiPartType, self).__init__(**kwargs)
+        self.subtype = subtype
+
+    def make_part_checker(self, path: t.Path, **context: ty.Any) -> PartChecker:
+        """Makes a checker of parts of the content at the path"""
+        return PartChecker(self.subtype, path, context)
+
+    def convert(self, value: ty.Any, path: t.Path, *args: ty.Any, **context: ty.Any) -> ty.Any:
+        if isinstance(value, Iterator):
+            return PartIterator(self.subtype, value, path, context)
+
+        return self.subtype.convert(value, path, *args, **context)
+
+
+class ResponsePartType(t.AbstractConvertible):
+
+    """Type of a part of multipart response content
+
+    Converts a value of the part and serializes it by the content type.
+    Storages, bytes and file-like objects are sent as they are. Headers
+    of storages are converted by the headers of the encoding.
+
+    :param subtype: type of the value
+    :param content_type: content type of the part
+    :param headers: type of headers of the part
+    """
+
+    MESSAGES: ty.ClassVar[t.Messages] = {
+        'serialize': "Couldn't serialize"
+    }
+
+    __slots__ = (
+        'subtype',
+        'content_type',
+        'headers'
+    )
+
+    def __init__(
+            self,
+            subtype: t.AbstractConvertible,
+            content_type: ty.Optional[str] = None,
+            headers: ty.Optional[t.AbstractConvertible] = None,
+            **kwargs: ty.Any
+    ) -> None:
+        super(ResponsePartType, self).__init__(**kwargs)
+        self.subtype = subtype
+        self.content_type = content_type
+        self.headers = headers
+
+    def _convert_value(self, value: ty.Any, path: t.Path, *args: ty.Any, **context: ty.Any) -> AnyStorage:
+        content_type = self.content_type
+        if isinstance(value, (FormStorage, FileStorage)):
+            if value.content_type is None and content_type is not None:
+                value.headers['content-type'] = content_type
+            return value
+
+        if isinstance(value, (bytes, bytearray, memoryview)) or hasattr(value, 'read'):
+            return FileStorage(
+                stream=io.BytesIO(value) if isinstance(value, (bytes, bytearray, memoryview)) else value,
+                content_type=content_type
+            )
+
+        value = self.subtype.convert(value, path, *args, **context)
+
+        handler = get_media_handler(content_type) if content_type is not None else None
+        if handler is not None:
+            try:
+                value = handler.serialize(value)
+            except (ValueError, TypeError):
+                raise t.SchemaError(t.Error(path, self.messages['serialize']))
+
+        elif not isinstance(value, str):
+            value = str(value)
+
+        return FormStorage(value, content_type=content_type)
+
+    def convert(self, value: ty.Any, path: t.Path, *args: ty.Any, **context: ty.Any) -> ty.Any:
+        storage = self._convert_value(value, path, *args, **context)
+        if self.headers is None:
+            return storage
+
+        headers = self.headers.convert(storage.headers, path / 'headers', **context)
+        if headers:
+            # Serialized values replace the given ones regardless of case of names
+            for name in [name for name in storage.headers if name.lower() in headers]:
+                del storage.headers[name]
+            storage.headers.update(headers)
+
+        return storage
+
+
+class MultiPartResponseType(t.AbstractConvertible):
+
+    """Type of multipart response content
+
+    Converts parts of :class:`~falcon_heavy.http.MultiPartEncoder` before they are sent.
+    Values of arrays are sent as repeated parts. Other values, e.g. mappings
+    rendered by a renderer, are converted by the type of the schema.
+
+    :param subtype: type of the whole content. Its properties are :class:`ResponsePartType`
+        or arrays of them
+    :param fallback: type of values that aren't encoders
+    """
+
+    MESSAGES: ty.ClassVar[t.Messages] = {}
+
+    __slots__ = (
+        'subtype',
+        'fallback'
+    )
+
+    def __init__(self, subtype: t.ObjectType, fallback: t.AbstractConvertible, **kwargs: ty.Any) -> None:
+        super(MultiPartResponseType, self).__init__(**kwargs)
+        self.subtype = subtype
+        self.fallback = fallback
+
+    def convert(self, value: ty.Any, path: t.Path, *args: ty.Any, **context: ty.Any) -> ty.Any:
+        if not isinstance(value, MultiPartEncoder):
+            return self.fallback.convert(value, path, *args, **context)
+
+        checker = PartChecker(self.subtype, path, context)
+        errors: ty.List[t.Error] = []
+        parts = []
+        for name, part in value.parts:
+            try:
+                part_type, part_path = checker.count(name)
+                parts.append((name, part_type.convert(part, part_path, *args, **context)))
+            except t.SchemaError as e:
+                errors.extend(e.errors)
+
+        try:
+            checker.finish()
+        except t.SchemaError as e:
+            errors.extend(e.errors)
+
+        if errors:
+            raise t.SchemaError(*errors)
+
+        value.parts = parts
+        return value
+
+
 class AbstractRequestMediaTypeFactory:
 
     def __init__(self, type_factory: TypeFactory) -> None:
@@ -223,7 +534,7 @@ class MultiPartMediaTypeFactory(AbstractRequestMediaTypeFactory):
             self,
             schema: o.SchemaObject,
             encoding: ty.Optional[ty.Mapping[str, o.EncodingObject]] = None
-    ) -> t.ObjectType:
+    ) -> MultiPartType:
         properties = {}
         read_only = set()
         write_only = set()
@@ -243,7 +554,7 @@ class MultiPartMediaTypeFactory(AbstractRequestMediaTypeFactory):
                 properties[property_name] = self._generate_property(
                     property_schema, property_encoding=property_encoding)
 
-        return t.ObjectType(
+        return MultiPartType(t.ObjectType(
             properties=properties,
             required=schema.required,
             additional_properties=False,
@@ -255,7 +566,7 @@ class MultiPartMediaTypeFactory(AbstractRequestMediaTypeFactory):
                     "Additional properties are not supported for multi-part media."
                     " The following additional properties were found: {0}"
             }
-        )
+        ))
 
 
 class UrlencodedMediaTypeFactory(AbstractRequestMediaTypeFactory):
@@ -361,11 +672,70 @@ class RequestMediaTypeFactory(AbstractMediaTypeFactory):
 
 class ResponseMediaTypeFactory(AbstractMediaTypeFactory):
 
-    def __init__(self, type_factory: TypeFactory) -> None:
+    def __init__(self, type_factory: TypeFactory, headers_factory: HeadersFactory) -> None:
         self.type_factory = type_factory
+        self.headers_factory = headers_factory
+
+    def _generate_part(
+            self, schema: o.SchemaObject, property_encoding: ty.Optional[o.EncodingObject] = None) -> ResponsePartType:
+        content_type = schema.default_content_type
+        headers = None
+        if property_encoding is not None:
+            if property_encoding.content_type:
+                content_type = property_encoding.content_type[0]
+            if property_encoding.headers:
+                headers = self.headers_factory.generate(property_encoding.headers)
+
+        return ResponsePartType(self.type_factory.generate(schema), content_type=content_type, headers=headers)
+
+    def _generate_multipart(
+            self,
+            schema: o.SchemaObject,
+            encoding: ty.Optional[ty.Mapping[str, o.EncodingObject]] = None
+    ) -> MultiPartResponseType:
+        properties: ty.Dict[str, t.AbstractConvertible] = {}
+        write_only: ty.Set[str] = set()
+        for property_name, property_schema in (schema.properties_ or {}).items():
+            if property_schema.write_only:
+                write_only.add(property_name)
+                continue
+
+            property_encoding = None
+            if encoding is not None:
+                property_encoding = encoding.get(property_name)
+
+            if property_schema.type == o.SCHEMA_TYPE.ARRAY:
+                assert property_schema.items_ is not None
+                properties[property_name] = t.ArrayType(
+                    item_type=self._generate_part(property_schema.items_, property_encoding=property_encoding),
+                    min_items=property_schema.min_items,
+                    max_items=property_schema.max_items
+                )
+
+            else:
+                properties[property_name] = self._generate_part(
+                    property_schema, property_encoding=property_encoding)
+
+        return MultiPartResponseType(
+            t.ObjectType(
+                properties=properties,
+                required=(schema.required or set()) - write_only,
+                additional_properties=False,
+                messages={
+                    'additional_properties':
+                        "Additional properties are not supported for multi-part media."
+                        " The following additional properties were found: {0}"
+                }
+            ),
+            self.type_factory.generate(schema)
+        )
 
     def generate(self, content_type: str, media_type: o.MediaTypeObject) -> t.AbstractConvertible:
-        if media_type.schema is None:
+        schema = media_type.schema
+        if schema is None:
             return t.AnyType()
 
-        return self.type_factory.generate(media_type.schema)
+        if 'multipart/' in content_type and schema.type == o.SCHEMA_TYPE.OBJECT and not schema.subschemas:
+            return self._generate_multipart(schema, encoding=media_type.encoding)
+
+        return self.type_factory.generate(schema)
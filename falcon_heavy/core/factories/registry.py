@@ -21,21 +21,42 @@ from falcon_heavy.core import types as t
 __all__ = (
     'hashkey',
     'registered',
+    'release_registry',
 )
 
 
 class ProxyType(t.AbstractConvertible):
 
-    __slots__ = ('wrapped', )
+    """Refers to a type that is being generated
+
+    The reference is weak, since recursive types refer to themselves through the proxy.
+    """
+
+    __slots__ = ('_ref', )
 
     def __init__(self, wrapped: ty.Optional[t.AbstractConvertible] = None, **kwargs: ty.Any) -> None:
         self.wrapped = wrapped
         super(ProxyType, self).__init__(**kwargs)
 
+    @property
+    def wrapped(self) -> ty.Optional[t.AbstractConvertible]:
+        return None if self._ref is None else self._ref()
+
+    @wrapped.setter
+    def wrapped(self, wrapped: ty.Optional[t.AbstractConvertible]) -> None:
+        self._ref = None if wrapped is None else weakref.ref(wrapped)
+
+    def __getstate__(self) -> ty.Tuple[ty.Optional[t.AbstractConvertible]]:
+        return (self.wrapped, )
+
+    def __setstate__(self, state: ty.Tuple[ty.Optional[t.AbstractConvertible]]) -> None:
+        self.wrapped, = state
+
     def convert(self, value: ty.Any, path: t.Path, *args: ty.Any, **context: ty.Any) -> ty.Any:
-        assert self.wrapped is not None, "Wrapped type must be specified"
+        wrapped = self.wrapped
+        assert wrapped is not None, "Wrapped type must be specified"
 
-        return self.wrapped.convert(value, path, **context)
+        return wrapped.convert(value, path, **context)
 
 
 kwd_mark = (object(),)
@@ -71,8 +92,21 @@ def registered(key: ty.Callable = hashkey) -> ty.Callable:
             proxy = ProxyType()
             registry[k] = proxy
             result = method(self, *args, **kwargs)
-            proxy.wrapped = weakref.proxy(result)
+            proxy.wrapped = result
             registry[k] = result
             return result
         return wrapper
     return decorator
+
+
+def release_registry(obj: ty.Any) -> ty.List[ty.Any]:
+    """Drops the registry of generated types
+
+    Returns generated types. Keep them while generated types are in use,
+    because recursive types refer to themselves through weak proxies.
+    """
+    registry = obj.__dict__.pop('__registry', None)
+    if registry is None:
+        return []
+
+    return list(registry.values())
@@ -21,7 +21,8 @@ from .parameters import ParameterFactory, ParametersFactory
 from .headers import HeadersFactory
 from .media_type import RequestMediaTypeFactory
 from .content import ContentFactory
-from .request_body import RequestBodyFactory
+from .common import ContentTypeBestMatchedType
+from .request_body import RequestBodyType, RequestBodyFactory
 
 __all__ = (
     'RequestObject',
@@ -88,6 +89,18 @@ class RequestConverter:
 
         return self.subtype.convert(data, t.Path(), **make_request_conversion_context())
 
+    def get_media_type(self, content_type: str) -> ty.Optional[t.AbstractConvertible]:
+        """Returns type of the content of the content type if it's described"""
+        request_body_type = self.subtype.properties['content']
+        if not isinstance(request_body_type, RequestBodyType):
+            return None
+
+        content = request_body_type.subtype
+        if not isinstance(content, ContentTypeBestMatchedType):
+            return None
+
+        return content._get_best_matched(content_type)
+
 
 class RequestFactory:
 
@@ -65,10 +65,10 @@ class ResponsesFactory:
 
     def __init__(self, type_factory: TypeFactory) -> None:
         self.type_factory = type_factory
-        self.media_type_factory = ResponseMediaTypeFactory(self.type_factory)
-        self.content_factory = ContentFactory(self.media_type_factory)
         self.parameter_factory = ParameterFactory(self.type_factory)
         self.headers_factory = HeadersFactory(self.parameter_factory)
+        self.media_type_factory = ResponseMediaTypeFactory(self.type_factory, self.headers_factory)
+        self.content_factory = ContentFactory(self.media_type_factory)
         self.response_factory = ResponseFactory(self.content_factory, self.headers_factory)
 
     def generate(self, responses: ty.Mapping[str, o.ResponseObject]) -> ResponseConverter:
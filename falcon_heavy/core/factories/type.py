@@ -13,7 +13,10 @@
 # limitations under the License.
 
 import os
+import weakref
+import threading
 import typing as ty
+from collections import Mapping
 
 from falcon_heavy.core import types as t, openapi as o
 
@@ -23,6 +26,8 @@ from .utils import merge_schemas
 __all__ = (
     'FormatFactory',
     'register_format_factory',
+    'TypeCache',
+    'shared_type_cache',
     'TypeFactory',
 )
 
@@ -132,20 +137,160 @@ def register_format_factory(type_: str, format_: str, factory: FormatFactory) ->
     _format_factories[(type_, format_)] = factory
 
 
+_NUMBER_CONSTRAINTS = (
+    'nullable', 'default', 'minimum', 'maximum', 'exclusive_minimum', 'exclusive_maximum', 'multiple_of', 'enum')
+_STRING_CONSTRAINTS = ('nullable', 'default', 'min_length', 'max_length', 'enum', 'pattern')
+_ARRAY_CONSTRAINTS = ('nullable', 'default', 'unique_items', 'min_items', 'max_items', 'enum')
+_COMPOSITE_CONSTRAINTS = ('nullable', 'default', 'enum')
+_OBJECT_CONSTRAINTS = ('nullable', 'default', 'enum', 'required', 'min_properties', 'max_properties')
+
+# Schema attributes that fully determine a type generated by the built-in factory.
+# Types generated by other factories are never shared
+_canonical_constraints: ty.Dict[FormatFactory, ty.Tuple[str, ...]] = {
+    _generate_integer_type: _NUMBER_CONSTRAINTS,
+    _generate_int32_type: _NUMBER_CONSTRAINTS,
+    _generate_int64_type: _NUMBER_CONSTRAINTS,
+    _generate_number_type: _NUMBER_CONSTRAINTS,
+    _generate_string_type: _STRING_CONSTRAINTS,
+    _generate_date_type: _STRING_CONSTRAINTS,
+    _generate_datetime_type: _STRING_CONSTRAINTS,
+    _generate_byte_type: _STRING_CONSTRAINTS,
+    _generate_boolean_type: ('nullable', 'default', 'enum'),
+    _generate_binary_type: ('nullable', ),
+    _generate_any_type: ('nullable', 'default', 'enum'),
+}
+
+
+def _freeze(value: ty.Any) -> ty.Hashable:
+    """Returns hashable representation of the value
+
+    Values of different types never compare equal, so ``1``, ``1.0`` and ``True`` are distinct.
+    Raises ``TypeError`` if the value can't be represented.
+    """
+    if isinstance(value, Mapping):
+        return dict, frozenset((k, _freeze(v)) for k, v in value.items())
+
+    elif isinstance(value, (list, tuple)):
+        return list, tuple(_freeze(v) for v in value)
+
+    elif isinstance(value, (set, frozenset)):
+        return set, frozenset(_freeze(v) for v in value)
+
+    elif isinstance(value, ty.Pattern):
+        return ty.Pattern, value.pattern, value.flags
+
+    hash(value)
+    return type(value), value
+
+
+def _structural_key(
+        kind: ty.Hashable, schema: o.SchemaObject, constraints: ty.Iterable[str]) -> ty.Optional[ty.Hashable]:
+    try:
+        return (kind, ) + tuple(_freeze(getattr(schema, name)) for name in constraints)
+    except TypeError:
+        return None
+
+
+class TypeCache:
+    """Cache of canonical types
+
+    Can be shared by several type factories, so structurally identical schemas of
+    different specifications are generated once. Types are held weakly and are
+    evicted as soon as no converter refers to them.
+    """
+
+    __slots__ = (
+        '_types',
+        '_lock',
+    )
+
+    def __init__(self) -> None:
+        self._types: ty.MutableMapping[ty.Hashable, t.AbstractConvertible] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def get(
+            self,
+            key: ty.Hashable,
+            factory: ty.Callable[[], t.AbstractConvertible]
+    ) -> t.AbstractConvertible:
+        """Returns the type cached by the key. Creates it by the factory if it's missing"""
+        with self._lock:
+            result = self._types.get(key)
+            if result is None:
+                result = self._types[key] = factory()
+
+            return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._types.clear()
+
+
+shared_type_cache = TypeCache()
+
+
+_OBJECT_MESSAGES = {
+    'additional_properties': (
+        "When `additionalProperties` is False, no unspecified properties are "
+        "allowed. The following unspecified properties were found: {0}"
+    )
+}
+
+
 class TypeFactory:
+    """Generates types by schemas
+
+    Structurally identical schemas share a single generated type. Leaf types are
+    shared when their constraints are equal, arrays, objects and compositions when
+    their constraints are equal and they consist of the same subtypes.
+
+    :param canonicalize: share generated types between structurally identical schemas
+    :param cache: cache of canonical types. Pass :data:`shared_type_cache` to share
+        types with other factories. Each factory has its own cache by default
+    """
 
-    def _generate_array_type(self, schema: o.SchemaObject) -> t.ArrayType:
-        return t.ArrayType(
-            item_type=self.generate(schema.items_),
-            nullable=schema.nullable,
-            default=schema.default,
-            unique_items=schema.unique_items,
-            min_items=schema.min_items,
-            max_items=schema.max_items,
-            enum=schema.enum
+    def __init__(self, canonicalize: bool = True, cache: ty.Optional[TypeCache] = None) -> None:
+        self.canonicalize = canonicalize
+        self.cache = TypeCache() if cache is None else cache
+
+    def _get_canonical(
+            self,
+            key: ty.Optional[ty.Hashable],
+            factory: ty.Callable[[], t.AbstractConvertible]
+    ) -> t.AbstractConvertible:
+        if not self.canonicalize or key is None:
+            return factory()
+
+        return self.cache.get(key, factory)
+
+    def _generate_leaf_type(self, factory: FormatFactory, schema: o.SchemaObject) -> t.AbstractConvertible:
+        constraints = _canonical_constraints.get(factory)
+        if constraints is None:
+            return factory(schema)
+
+        return self._get_canonical(
+            _structural_key(factory, schema, constraints), lambda: factory(schema))
+
+    def _generate_array_type(self, schema: o.SchemaObject) -> t.AbstractConvertible:
+        item_type = self.generate(schema.items_)
+        return self._get_canonical(
+            # Subtypes are already canonical, so their identity is sufficient
+            _structural_key(('array', id(item_type)), schema, _ARRAY_CONSTRAINTS),
+            lambda: t.ArrayType(
+                item_type=item_type,
+                nullable=schema.nullable,
+                default=schema.default,
+                unique_items=schema.unique_items,
+                min_items=schema.min_items,
+                max_items=schema.max_items,
+                enum=schema.enum
+            )
         )
 
-    def _generate_object_type(self, schema: o.SchemaObject) -> t.ObjectType:
+    def _generate_object_type(self, schema: o.SchemaObject) -> t.AbstractConvertible:
         properties = {}
         read_only = set()
         write_only = set()
@@ -169,24 +314,31 @@ class TypeFactory:
             for pattern, property_schema in schema.x_pattern_properties.items():
                 pattern_properties[pattern] = self.generate(property_schema)
 
-        return t.ObjectType(
-            properties=properties,
-            required=schema.required,
-            additional_properties=additional_properties,
-            pattern_properties=pattern_properties,
-            read_only=read_only,
-            write_only=write_only,
-            nullable=schema.nullable,
-            default=schema.default,
-            enum=schema.enum,
-            min_properties=schema.min_properties,
-            max_properties=schema.max_properties,
-            messages={
-                'additional_properties': (
-                    "When `additionalProperties` is False, no unspecified properties are "
-                    "allowed. The following unspecified properties were found: {0}"
-                )
-            }
+        kind = (
+            'object',
+            frozenset((name, id(subtype)) for name, subtype in properties.items()),
+            frozenset((_freeze(pattern), id(subtype)) for pattern, subtype in pattern_properties.items()),
+            additional_properties if isinstance(additional_properties, bool) else id(additional_properties),
+            frozenset(read_only),
+            frozenset(write_only)
+        )
+
+        return self._get_canonical(
+            _structural_key(kind, schema, _OBJECT_CONSTRAINTS),
+            lambda: t.ObjectType(
+                properties=properties,
+                required=schema.required,
+                additional_properties=additional_properties,
+                pattern_properties=pattern_properties,
+                read_only=read_only,
+                write_only=write_only,
+                nullable=schema.nullable,
+                default=schema.default,
+                enum=schema.enum,
+                min_properties=schema.min_properties,
+                max_properties=schema.max_properties,
+                messages=_OBJECT_MESSAGES
+            )
         )
 
     def _generate_polymorphic_type(
@@ -245,39 +397,55 @@ class TypeFactory:
         assert schema.all_of is not None
         return self._generate_no_register(merge_schemas(schema.all_of))
 
-    def _generate_allof_type(self, schema: o.SchemaObject) -> t.AllOfType:
+    def _generate_allof_type(self, schema: o.SchemaObject) -> t.AbstractConvertible:
         assert schema.all_of is not None
-        return t.AllOfType(
-            subtypes=[self.generate(subschema, allow_model_level_polymorphic=bool(i))
-                      for i, subschema in enumerate(schema.all_of)],
-            nullable=schema.nullable,
-            default=schema.default,
-            enum=schema.enum
+        subtypes = [self.generate(subschema, allow_model_level_polymorphic=bool(i))
+                    for i, subschema in enumerate(schema.all_of)]
+        return self._get_canonical(
+            _structural_key(('all_of', ) + tuple(map(id, subtypes)), schema, _COMPOSITE_CONSTRAINTS),
+            lambda: t.AllOfType(
+                subtypes=subtypes,
+                nullable=schema.nullable,
+                default=schema.default,
+                enum=schema.enum
+            )
         )
 
-    def _generate_anyof_type(self, schema: o.SchemaObject) -> t.AnyOfType:
+    def _generate_anyof_type(self, schema: o.SchemaObject) -> t.AbstractConvertible:
         assert schema.any_of is not None
-        return t.AnyOfType(
-            subtypes=[self.generate(subschema) for subschema in schema.any_of],
-            nullable=schema.nullable,
-            default=schema.default,
-            enum=schema.enum
+        subtypes = [self.generate(subschema) for subschema in schema.any_of]
+        return self._get_canonical(
+            _structural_key(('any_of', ) + tuple(map(id, subtypes)), schema, _COMPOSITE_CONSTRAINTS),
+            lambda: t.AnyOfType(
+                subtypes=subtypes,
+                nullable=schema.nullable,
+                default=schema.default,
+                enum=schema.enum
+            )
         )
 
-    def _generate_oneof_type(self, schema: o.SchemaObject) -> t.OneOfType:
+    def _generate_oneof_type(self, schema: o.SchemaObject) -> t.AbstractConvertible:
         assert schema.one_of is not None
-        return t.OneOfType(
-            subtypes=[self.generate(subschema) for subschema in schema.one_of],
-            nullable=schema.nullable,
-            default=schema.default,
-            enum=schema.enum
+        subtypes = [self.generate(subschema) for subschema in schema.one_of]
+        return self._get_canonical(
+            _structural_key(('one_of', ) + tuple(map(id, subtypes)), schema, _COMPOSITE_CONSTRAINTS),
+            lambda: t.OneOfType(
+                subtypes=subtypes,
+                nullable=schema.nullable,
+                default=schema.default,
+                enum=schema.enum
+            )
         )
 
-    def _generate_not_type(self, schema: o.SchemaObject) -> t.NotType:
+    def _generate_not_type(self, schema: o.SchemaObject) -> t.AbstractConvertible:
         assert schema.not_ is not None
-        return t.NotType(
-            subtypes=[self.generate(subschema) for subschema in schema.not_],
-            nullable=schema.nullable
+        subtypes = [self.generate(subschema) for subschema in schema.not_]
+        return self._get_canonical(
+            _structural_key(('not', ) + tuple(map(id, subtypes)), schema, ('nullable', )),
+            lambda: t.NotType(
+                subtypes=subtypes,
+                nullable=schema.nullable
+            )
         )
 
     def _generate_no_register(
@@ -287,19 +455,19 @@ class TypeFactory:
             format_factory = _format_factories.get((schema.type, schema.format))
 
         if format_factory is not None:
-            return format_factory(schema)
+            return self._generate_leaf_type(format_factory, schema)
 
         elif schema.type == o.SCHEMA_TYPE.STRING:
-            return _generate_string_type(schema)
+            return self._generate_leaf_type(_generate_string_type, schema)
 
         elif schema.type == o.SCHEMA_TYPE.NUMBER:
-            return _generate_number_type(schema)
+            return self._generate_leaf_type(_generate_number_type, schema)
 
         elif schema.type == o.SCHEMA_TYPE.INTEGER:
-            return _generate_integer_type(schema)
+            return self._generate_leaf_type(_generate_integer_type, schema)
 
         elif schema.type == o.SCHEMA_TYPE.BOOLEAN:
-            return _generate_boolean_type(schema)
+            return self._generate_leaf_type(_generate_boolean_type, schema)
 
         elif schema.type == o.SCHEMA_TYPE.ARRAY:
             return self._generate_array_type(schema)
@@ -337,7 +505,7 @@ class TypeFactory:
             return self._generate_not_type(schema)
 
         else:
-            return _generate_any_type(schema)
+            return self._generate_leaf_type(_generate_any_type, schema)
 
     @registered(key=lambda schema, allow_model_level_polymorphic=True: hashkey(
         schema.path, allow_model_level_polymorphic=allow_model_level_polymorphic))
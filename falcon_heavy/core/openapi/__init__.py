@@ -29,6 +29,8 @@ from .media_type import *
 from .oauth_flow import *
 from .oauth_flows import *
 from .openapi import *
+from .bundle import *
+from .subset import *
 from .operation import *
 from .parameter import *
 from .path_item import *
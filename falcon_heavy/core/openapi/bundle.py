@@ -0,0 +1,252 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import posixpath
+import typing as ty
+from collections import Mapping
+from urllib.parse import urljoin, urldefrag, unquote, urlsplit
+
+from falcon_heavy.core import types as t
+
+from .openapi import LoadFunc, load_specification, _make_context
+
+__all__ = (
+    'bundle_specification',
+)
+
+_SCHEMA_KEYWORDS = frozenset((
+    'schema',
+    'items',
+    'not',
+    'additionalProperties',
+))
+
+_SCHEMA_CONTAINERS = frozenset((
+    'properties',
+    'x-patternProperties',
+    'allOf',
+    'oneOf',
+    'anyOf',
+))
+
+_COMPONENT_CONTAINERS = frozenset((
+    'parameters',
+    'responses',
+    'headers',
+    'examples',
+    'links',
+    'callbacks',
+))
+
+_INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z0-9\.\-_]')
+
+_DOCUMENT_EXTENSIONS = frozenset(('.json', '.yaml', '.yml'))
+
+Location = ty.Tuple[ty.Union[str, int], ...]
+
+
+def _get_component_kind(location: Location) -> str:
+    """Returns section of components where an object at the location belongs to"""
+    if len(location) >= 3 and location[-3] == 'components':
+        return ty.cast(str, location[-2])
+
+    last = location[-1] if location else None
+    parent = location[-2] if len(location) > 1 else None
+
+    if last in _SCHEMA_KEYWORDS or parent in _SCHEMA_CONTAINERS:
+        return 'schemas'
+
+    if last == 'requestBody':
+        return 'requestBodies'
+
+    if parent in _COMPONENT_CONTAINERS:
+        return ty.cast(str, parent)
+
+    return 'schemas'
+
+
+def _is_path_item(location: Location) -> bool:
+    """Checks that an object at the location is a path item, including path items of callbacks"""
+    if len(location) == 2 and location[0] == 'paths':
+        return True
+
+    return (
+        len(location) >= 3 and location[-3] == 'callbacks' and
+        (len(location) < 4 or location[-4] not in _SCHEMA_CONTAINERS)
+    )
+
+
+def _is_mapping_reference(value: str) -> bool:
+    # Values of a discriminator mapping are names of schemas or references
+    return (
+        _INVALID_NAME_CHARS.search(value) is not None or
+        posixpath.splitext(value)[1] in _DOCUMENT_EXTENSIONS
+    )
+
+
+def _escape(s: str) -> str:
+    return s.replace('~', '~0').replace('/', '~1')
+
+
+class _Bundler:
+
+    __slots__ = (
+        'ref_resolver',
+        'root_uri',
+        'components',
+        'pointers',
+        'inlined',
+    )
+
+    def __init__(self, ref_resolver: t.RefResolver, root_uri: str, root: ty.Mapping) -> None:
+        self.ref_resolver = ref_resolver
+        self.root_uri = root_uri
+        # Names of own components are reserved
+        self.components: ty.Dict[str, ty.Dict[str, ty.Any]] = {
+            kind: {name: None for name in section}
+            for kind, section in (root.get('components') or {}).items()
+            if isinstance(section, Mapping)
+        }
+        self.pointers: ty.Dict[str, str] = {}
+        # URLs of path items being inlined
+        self.inlined: ty.Set[str] = set()
+
+    def bundle(self, root: ty.Mapping) -> ty.Dict[str, ty.Any]:
+        result = self._walk(root, self.root_uri, ())
+        components = result.setdefault('components', {})
+        for kind, section in self.components.items():
+            target = components.setdefault(kind, {})
+            for name, value in section.items():
+                if name not in target:
+                    target[name] = value
+        if not components:
+            del result['components']
+        return result
+
+    def _walk(self, node: ty.Any, base_uri: str, location: Location) -> ty.Any:
+        if isinstance(node, Mapping):
+            ref = node.get('$ref')
+            if isinstance(ref, str):
+                if _is_path_item(location):
+                    return self._inline(ref, base_uri, location)
+
+                return {'$ref': self._rewrite(ref, base_uri, location)}
+
+            result = {k: self._walk(v, base_uri, location + (k, )) for k, v in node.items()}
+
+            mapping = node.get('mapping')
+            if location and location[-1] == 'discriminator' and isinstance(mapping, Mapping):
+                result['mapping'] = {
+                    k: self._rewrite(v, base_uri, location + ('mapping', k))
+                    if isinstance(v, str) and _is_mapping_reference(v) else v
+                    for k, v in mapping.items()
+                }
+
+            return result
+
+        elif isinstance(node, list):
+            return [self._walk(v, base_uri, location + (i, )) for i, v in enumerate(node)]
+
+        return node
+
+    def _make_name(self, kind: str, url: str, fragment: str) -> str:
+        parts = [part for part in unquote(fragment).split('/') if part]
+        if parts:
+            name = parts[-1].replace('~1', '/').replace('~0', '~')
+        else:
+            name = posixpath.splitext(posixpath.basename(urlsplit(url).path))[0]
+        name = _INVALID_NAME_CHARS.sub('_', name) or kind
+
+        section = self.components.setdefault(kind, {})
+        candidate, i = name, 1
+        while candidate in section:
+            i += 1
+            candidate = '%s_%d' % (name, i)
+        return candidate
+
+    def _resolve(self, url: str) -> ty.Any:
+        try:
+            return self.ref_resolver.resolve_from_url(url)
+        except t.RefResolutionError:
+            raise t.RefResolutionError("Unresolvable reference: %s" % url)
+
+    def _inline(self, ref: str, base_uri: str, location: Location) -> ty.Any:
+        """Inlines a referenced path item, since there are no components of path items"""
+        url = urljoin(base_uri, ref)
+        if url in self.inlined:
+            raise t.RefResolutionError("Recursive reference to path item: %s" % url)
+
+        self.inlined.add(url)
+        try:
+            return self._walk(self._resolve(url), urldefrag(url)[0], location)
+        finally:
+            self.inlined.discard(url)
+
+    def _rewrite(self, ref: str, base_uri: str, location: Location) -> str:
+        url = urljoin(base_uri, ref)
+        document_url, fragment = urldefrag(url)
+
+        if document_url == self.root_uri and fragment.startswith('/components/'):
+            return '#' + fragment
+
+        pointer = self.pointers.get(url)
+        if pointer is not None:
+            return pointer
+
+        kind = _get_component_kind(location)
+        name = self._make_name(kind, document_url, fragment)
+        pointer = '#/components/%s/%s' % (kind, _escape(name))
+
+        # Registered before descending, so recursive references point to the same component
+        self.pointers[url] = pointer
+        self.components[kind][name] = None
+
+        target = self._resolve(url)
+        self.components[kind][name] = self._walk(target, document_url, ('components', kind, name))
+
+        return pointer
+
+
+def bundle_specification(
+        path: str,
+        handlers: ty.Optional[t.RefHandlers] = None,
+        load_func: ty.Optional[LoadFunc] = None,
+        cache_dir: ty.Optional[str] = None,
+        validate: bool = True
+) -> ty.Dict[str, ty.Any]:
+    """Bundles OpenAPI specification into a single self-contained document
+
+    Referenced objects that are not components of the specification itself are
+    moved to its components. Referenced path items are inlined. All references in the result are local, so it
+    can be loaded by :func:`load_specification` without resolving anything
+    remote.
+
+    :param path: path of the specification file
+    :param handlers: a mapping from URI schemes to functions that retrieve referenced documents
+    :param load_func: function that loads the specification file
+    :param cache_dir: a directory where parsed documents and documents retrieved
+        over HTTP(S) are kept
+    :param validate: validate the specification before bundling
+    :return: bundled specification
+    """
+    if validate:
+        load_specification(path, handlers=handlers, load_func=load_func, cache_dir=cache_dir)
+
+    base_uri, referrer, context = _make_context(
+        path, handlers=handlers, load_func=load_func, cache_dir=cache_dir)
+    ref_resolver: t.RefResolver = context['ref_resolver']
+    ref_resolver.prefetch()
+
+    return _Bundler(ref_resolver, base_uri, referrer).bundle(referrer)
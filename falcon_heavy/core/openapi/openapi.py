@@ -15,11 +15,11 @@
 import re
 import os
 import pathlib
+import warnings
 import typing as ty
 from urllib.parse import urljoin
 
-import yaml
-
+from falcon_heavy.version import __version__
 from falcon_heavy.core.types import RefHandlers, Path
 from falcon_heavy.core import make_specification_conversion_context
 from falcon_heavy.core import types as t
@@ -38,7 +38,10 @@ from .constants import HTTP_METHODS
 
 __all__ = (
     'LoadFunc',
+    'make_ref_resolver',
+    'fingerprint_specification',
     'load_specification',
+    'convert_specification',
     'OpenAPIObject',
     'OpenAPIObjectType',
 )
@@ -110,8 +113,8 @@ class OpenAPIObjectType(BaseOpenAPIObjectType[OpenAPIObject], result_class=OpenA
     def convert(self, value: ty.Any, path: t.Path, *args: ty.Any, **context: ty.Any) -> ty.Optional[OpenAPIObject]:
         result: ty.Optional[OpenAPIObject] = super(OpenAPIObjectType, self).convert(value, path, **context)
 
-        if result is None:
-            return None
+        if result is None or context.get('trusted', False):
+            return result
 
         security_schemes: ty.Mapping[str, AnySecuritySchemeObject] = {}
         components: ty.Optional[ComponentsObject] = result.components
@@ -156,18 +159,132 @@ class OpenAPIObjectType(BaseOpenAPIObjectType[OpenAPIObject], result_class=OpenA
 LoadFunc = ty.Callable[[ty.IO], ty.Mapping]
 
 
+def _make_context(
+        path: str,
+        handlers: ty.Optional[RefHandlers] = None,
+        load_func: ty.Optional[LoadFunc] = None,
+        cache_dir: ty.Optional[str] = None
+) -> ty.Tuple[str, ty.Mapping, ty.Dict[str, ty.Any]]:
+    if load_func is None:
+        referrer = t.load_file(path, cache_dir=cache_dir)
+    else:
+        with open(path) as fh:
+            referrer = load_func(fh)
+    base_uri = urljoin('file://', pathlib.Path(os.path.abspath(path)).as_uri())
+    context = dict(make_specification_conversion_context(
+        base_uri, referrer, handlers=handlers, cache_dir=cache_dir))
+    return base_uri, referrer, context
+
+
+def make_ref_resolver(
+        path: str,
+        handlers: ty.Optional[RefHandlers] = None,
+        load_func: ty.Optional[LoadFunc] = None,
+        cache_dir: ty.Optional[str] = None
+) -> t.RefResolver:
+    """Makes a resolver of references of OpenAPI specification
+
+    All referenced documents are retrieved ahead, so they are in the store of the resolver.
+
+    :param path: path of the specification file
+    :param handlers: a mapping from URI schemes to functions that retrieve referenced documents
+    :param load_func: function that loads the specification file
+    :param cache_dir: a directory where parsed documents and documents retrieved
+        over HTTP(S) are kept
+    """
+    _, _, context = _make_context(path, handlers=handlers, load_func=load_func, cache_dir=cache_dir)
+    ref_resolver: t.RefResolver = context['ref_resolver']
+    ref_resolver.prefetch()
+    return ref_resolver
+
+
+def fingerprint_specification(
+        path: str,
+        handlers: ty.Optional[RefHandlers] = None,
+        load_func: ty.Optional[LoadFunc] = None,
+        cache_dir: ty.Optional[str] = None
+) -> str:
+    """Calculates fingerprint of OpenAPI specification
+
+    Fingerprint covers the specification file, all referenced documents and
+    the version of the library. Record it once the specification is validated
+    and pass it as ``trusted_fingerprint`` to :func:`load_specification`.
+
+    :param path: path of the specification file
+    :param handlers: a mapping from URI schemes to functions that retrieve referenced documents
+    :param load_func: function that loads the specification file
+    :param cache_dir: a directory where parsed documents and documents retrieved
+        over HTTP(S) are kept
+    """
+    return _fingerprint(make_ref_resolver(path, handlers=handlers, load_func=load_func, cache_dir=cache_dir))
+
+
+def _fingerprint(ref_resolver: t.RefResolver) -> str:
+    return '%s:%s' % (__version__, ref_resolver.fingerprint())
+
+
 def load_specification(
         path: str,
         handlers: ty.Optional[RefHandlers] = None,
-        load_func: LoadFunc = yaml.safe_load
+        load_func: ty.Optional[LoadFunc] = None,
+        prefetch: bool = False,
+        cache_dir: ty.Optional[str] = None,
+        trusted_fingerprint: ty.Optional[str] = None
 ) -> OpenAPIObject:
-    with open(path) as fh:
-        referrer = load_func(fh)
-    base_uri = urljoin('file://', pathlib.Path(os.path.abspath(path)).as_uri())
+    """Loads OpenAPI specification
+
+    :param path: path of the specification file
+    :param handlers: a mapping from URI schemes to functions that retrieve referenced documents
+    :param load_func: function that loads the specification file. By default
+        YAML and JSON files are supported
+    :param prefetch: retrieve all referenced documents concurrently before conversion,
+        including unused ones. Errors of retrieval are reported when a reference is resolved
+    :param cache_dir: a directory where parsed documents and documents retrieved
+        over HTTP(S) are kept
+    :param trusted_fingerprint: fingerprint of already validated specification
+        (see :func:`fingerprint_specification`). Validation is skipped when
+        the specification still has this fingerprint
+    """
+    base_uri, referrer, context = _make_context(
+        path, handlers=handlers, load_func=load_func, cache_dir=cache_dir)
+    ref_resolver: t.RefResolver = context['ref_resolver']
+    if prefetch or trusted_fingerprint is not None:
+        ref_resolver.prefetch()
+    if trusted_fingerprint is not None:
+        context['trusted'] = _check_fingerprint(ref_resolver, trusted_fingerprint)
+    return _convert_specification(base_uri, referrer, context)
+
+
+def convert_specification(ref_resolver: t.RefResolver) -> OpenAPIObject:
+    """Converts OpenAPI specification of the resolver
+
+    Documents in the store of the resolver aren't retrieved again, so the specification
+    is built from the same documents as ones made by :func:`make_ref_resolver`.
+
+    :param ref_resolver: resolver of references of the specification
+    """
+    base_uri, referrer = ref_resolver.base_uri, ref_resolver.referrer
+    context = dict(make_specification_conversion_context(base_uri, referrer))
+    context['ref_resolver'] = ref_resolver
+    return _convert_specification(base_uri, referrer, context)
+
+
+def _check_fingerprint(ref_resolver: t.RefResolver, trusted_fingerprint: str) -> bool:
+    fingerprint = _fingerprint(ref_resolver)
+    if fingerprint == trusted_fingerprint:
+        return True
+
+    warnings.warn(
+        "Specification fingerprint %s doesn't match the trusted one. "
+        "Specification will be validated" % fingerprint, RuntimeWarning)
+    return False
+
+
+def _convert_specification(base_uri: str, referrer: ty.Mapping, context: ty.Mapping[str, ty.Any]) -> OpenAPIObject:
     result = OpenAPIObjectType().convert(
         referrer,
         Path(base_uri),
-        **make_specification_conversion_context(base_uri, referrer, handlers=handlers)
+        **context
     )
     assert result is not None
     return result
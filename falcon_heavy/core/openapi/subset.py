@@ -0,0 +1,315 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing as ty
+from fnmatch import fnmatchcase
+from collections import Mapping
+from urllib.parse import urljoin, urldefrag, unquote
+
+from falcon_heavy.core import types as t
+from falcon_heavy.core.types.ref_resolver import _iter_refs
+
+from .constants import HTTP_METHODS
+from .openapi import (
+    LoadFunc,
+    OpenAPIObject,
+    _make_context,
+    _check_fingerprint,
+    _convert_specification
+)
+
+__all__ = (
+    'SubsetReport',
+    'subset_specification',
+    'load_specification_subset',
+)
+
+ComponentKey = ty.Tuple[str, str]  # kind and name
+
+
+class SubsetReport(ty.NamedTuple):
+    operations: ty.Tuple[ty.Tuple[str, str], ...]  # kept paths and methods
+    components: ty.Mapping[str, ty.Tuple[str, ...]]  # names of kept components by kind
+    removed_operations: int
+    removed_components: int
+
+
+def _parse_component_pointer(fragment: str) -> ty.Optional[ComponentKey]:
+    parts = unquote(fragment).lstrip('/').split('/')
+    if len(parts) < 3 or parts[0] != 'components':
+        return None
+    return parts[1], parts[2].replace('~1', '/').replace('~0', '~')
+
+
+class _Subset:
+
+    __slots__ = (
+        'ref_resolver',
+        'root',
+        'root_uri',
+        'kept',
+        'visited',
+    )
+
+    def __init__(self, ref_resolver: t.RefResolver) -> None:
+        self.ref_resolver = ref_resolver
+        self.root = ref_resolver.referrer
+        self.root_uri = ref_resolver.base_uri
+        self.kept: ty.Set[ComponentKey] = set()
+        self.visited: ty.Set[str] = set()
+
+    def _get_component(self, key: ComponentKey) -> ty.Any:
+        kind, name = key
+        components = self.root.get('components') or {}
+        return (components.get(kind) or {}).get(name)
+
+    def walk(self, node: ty.Any, base_uri: str) -> None:
+        """Marks components reachable from the node"""
+        pending = [urljoin(base_uri, ref) for ref in _iter_refs(node)]
+        while pending:
+            url = pending.pop()
+            if url in self.visited:
+                continue
+            self.visited.add(url)
+
+            document_url, fragment = urldefrag(url)
+            if document_url == self.root_uri:
+                key = _parse_component_pointer(fragment)
+                if key is not None:
+                    self.keep(key)
+                    continue
+
+            try:
+                target = self.ref_resolver.resolve_from_url(url)
+            except t.RefResolutionError:
+                # Will be reported by validation
+                continue
+
+            pending.extend(urljoin(document_url, ref) for ref in _iter_refs(target))
+
+    def keep(self, key: ComponentKey) -> None:
+        if key in self.kept:
+            return
+
+        component = self._get_component(key)
+        if component is None:
+            return
+
+        self.kept.add(key)
+        self.walk(component, self.root_uri)
+
+        discriminator = component.get('discriminator') if isinstance(component, Mapping) else None
+        mapping = discriminator.get('mapping') if isinstance(discriminator, Mapping) else None
+        if isinstance(mapping, Mapping):
+            for value in mapping.values():
+                if not isinstance(value, str):
+                    continue
+                if '#' in value or '/' in value:
+                    self.walk({'$ref': value}, self.root_uri)
+                else:
+                    self.keep(('schemas', value))
+
+    def keep_subschemas(self) -> None:
+        """Keeps schemas that extend kept polymorphic schemas
+
+        Such schemas are found by the discriminator, so nothing references them.
+        """
+        schemas = (self.root.get('components') or {}).get('schemas') or {}
+        changed = True
+        while changed:
+            changed = False
+            for name, schema in schemas.items():
+                if ('schemas', name) in self.kept or not isinstance(schema, Mapping) or 'type' in schema:
+                    continue
+
+                all_of = schema.get('allOf')
+                if not all_of or not isinstance(all_of[0], Mapping):
+                    continue
+
+                ref = all_of[0].get('$ref')
+                if not isinstance(ref, str):
+                    continue
+
+                document_url, fragment = urldefrag(urljoin(self.root_uri, ref))
+                key = _parse_component_pointer(fragment) if document_url == self.root_uri else None
+                if key is None or key not in self.kept:
+                    continue
+
+                parent = self._get_component(key)
+                if isinstance(parent, Mapping) and 'discriminator' in parent:
+                    self.keep(('schemas', name))
+                    changed = True
+
+
+def _is_included(
+        template: str,
+        operation: ty.Mapping,
+        include_tags: ty.Optional[ty.AbstractSet[str]],
+        include_paths: ty.Optional[ty.Sequence[str]],
+        include_operation_ids: ty.Optional[ty.AbstractSet[str]]
+) -> bool:
+    if include_tags is not None and not include_tags.isdisjoint(operation.get('tags') or ()):
+        return True
+
+    if include_paths is not None and any(fnmatchcase(template, pattern) for pattern in include_paths):
+        return True
+
+    if include_operation_ids is not None and operation.get('operationId') in include_operation_ids:
+        return True
+
+    return False
+
+
+def subset_specification(
+        ref_resolver: t.RefResolver,
+        include_tags: ty.Optional[ty.Iterable[str]] = None,
+        include_paths: ty.Optional[ty.Iterable[str]] = None,
+        include_operation_ids: ty.Optional[ty.Iterable[str]] = None,
+        include_components: ty.Optional[ty.Iterable[ComponentKey]] = None
+) -> ty.Tuple[ty.Dict[str, ty.Any], SubsetReport]:
+    """Makes a subset of OpenAPI specification document
+
+    An operation is kept if it matches any of the specified criteria. Components
+    of the specification are kept only if they are reachable from kept operations.
+    Security schemes are always kept.
+
+    :param ref_resolver: resolver of references of the specification
+    :param include_tags: tags of operations to keep
+    :param include_paths: path templates of operations to keep. Shell-style wildcards are supported
+    :param include_operation_ids: identifiers of operations to keep
+    :param include_components: kinds and names of components to keep along with reachable ones
+    :return: the subset document and report of what was kept
+    """
+    tags = None if include_tags is None else frozenset(include_tags)
+    paths = None if include_paths is None else tuple(include_paths)
+    operation_ids = None if include_operation_ids is None else frozenset(include_operation_ids)
+
+    subset = _Subset(ref_resolver)
+    root = subset.root
+
+    kept_paths: ty.Dict[str, ty.Any] = {}
+    kept_operations: ty.List[ty.Tuple[str, str]] = []
+    removed_operations = 0
+    for template, path_item in (root.get('paths') or {}).items():
+        if not isinstance(path_item, Mapping):
+            continue
+
+        resolved, base_uri = path_item, subset.root_uri
+        if '$ref' in path_item:
+            try:
+                url = urljoin(base_uri, path_item['$ref'])
+                resolved, base_uri = ref_resolver.resolve_from_url(url), urldefrag(url)[0]
+            except t.RefResolutionError:
+                continue
+
+        methods = [
+            method for method in HTTP_METHODS
+            if isinstance(resolved.get(method), Mapping) and _is_included(
+                template, resolved[method], tags, paths, operation_ids)
+        ]
+        removed_operations += sum(1 for method in HTTP_METHODS if method in resolved) - len(methods)
+        if not methods:
+            continue
+
+        if resolved is path_item:
+            path_item = {k: v for k, v in path_item.items() if k not in HTTP_METHODS or k in methods}
+        else:
+            # Operations of a referenced path item can't be removed
+            methods = [method for method in HTTP_METHODS if method in resolved]
+
+        kept_paths[template] = path_item
+        kept_operations.extend((template, method) for method in methods)
+        subset.walk(path_item, subset.root_uri)
+
+    subset.walk({k: v for k, v in root.items() if k not in ('paths', 'components')}, subset.root_uri)
+    for key in include_components or ():
+        subset.keep(key)
+    subset.keep_subschemas()
+
+    components = root.get('components') or {}
+    kept_components: ty.Dict[str, ty.Dict[str, ty.Any]] = {}
+    removed_components = 0
+    for kind, section in components.items():
+        if not isinstance(section, Mapping) or kind == 'securitySchemes' or kind.startswith('x-'):
+            kept_components[kind] = section
+            continue
+
+        kept_components[kind] = {name: value for name, value in section.items() if (kind, name) in subset.kept}
+        removed_components += len(section) - len(kept_components[kind])
+
+    document = dict(root)
+    document['paths'] = kept_paths
+    if 'components' in root:
+        document['components'] = kept_components
+
+    report = SubsetReport(
+        operations=tuple(kept_operations),
+        components={
+            kind: tuple(section) for kind, section in kept_components.items()
+            if isinstance(section, Mapping) and not kind.startswith('x-')
+        },
+        removed_operations=removed_operations,
+        removed_components=removed_components
+    )
+    return document, report
+
+
+def load_specification_subset(
+        path: str,
+        include_tags: ty.Optional[ty.Iterable[str]] = None,
+        include_paths: ty.Optional[ty.Iterable[str]] = None,
+        include_operation_ids: ty.Optional[ty.Iterable[str]] = None,
+        handlers: ty.Optional[t.RefHandlers] = None,
+        load_func: ty.Optional[LoadFunc] = None,
+        cache_dir: ty.Optional[str] = None,
+        trusted_fingerprint: ty.Optional[str] = None,
+        include_components: ty.Optional[ty.Iterable[ComponentKey]] = None
+) -> ty.Tuple[OpenAPIObject, SubsetReport]:
+    """Loads a subset of OpenAPI specification
+
+    Unreachable components are removed before validation, so they are neither
+    validated nor loaded. See :func:`subset_specification`.
+
+    :param path: path of the specification file
+    :param include_tags: tags of operations to keep
+    :param include_paths: path templates of operations to keep. Shell-style wildcards are supported
+    :param include_operation_ids: identifiers of operations to keep
+    :param handlers: a mapping from URI schemes to functions that retrieve referenced documents
+    :param load_func: function that loads the specification file
+    :param cache_dir: a directory where parsed documents and documents retrieved
+        over HTTP(S) are kept
+    :param trusted_fingerprint: fingerprint of already validated specification.
+        It's checked against the whole specification
+    :param include_components: kinds and names of components to keep along with reachable ones
+    :return: the specification and report of what was kept
+    """
+    base_uri, referrer, context = _make_context(
+        path, handlers=handlers, load_func=load_func, cache_dir=cache_dir)
+    ref_resolver: t.RefResolver = context['ref_resolver']
+    if trusted_fingerprint is not None:
+        ref_resolver.prefetch()
+        context['trusted'] = _check_fingerprint(ref_resolver, trusted_fingerprint)
+
+    document, report = subset_specification(
+        ref_resolver,
+        include_tags=include_tags,
+        include_paths=include_paths,
+        include_operation_ids=include_operation_ids,
+        include_components=include_components
+    )
+    ref_resolver.referrer = document
+    ref_resolver.store[base_uri] = document
+    ref_resolver.prefetch()
+
+    return _convert_specification(base_uri, document, context), report
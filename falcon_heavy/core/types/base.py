@@ -26,6 +26,7 @@ from .undefined import Undefined
 
 __all__ = (
     'Messages',
+    'ValidatorConstraints',
     'OverridableMessagesMeta',
     'AbstractConvertible',
     'ValidationResult',
@@ -38,6 +39,7 @@ __all__ = (
 )
 
 Messages = ty.MutableMapping[str, str]
+ValidatorConstraints = ty.Mapping[str, ty.Tuple[str, ...]]
 
 
 try:
@@ -73,6 +75,15 @@ class OverridableMessagesMeta(GenericMeta):
         return cls
 
 
+def _resolve_messages(defaults: Messages, overrides: ty.Optional[Messages]) -> ty.Mapping[str, str]:
+    # Instances share the class level table unless custom messages are passed,
+    # so it must never be modified through an instance
+    if not overrides:
+        return defaults
+
+    return dict(defaults, **overrides)
+
+
 class _Base:
 
     __slots__ = ('__weakref__', )
@@ -88,7 +99,7 @@ class AbstractConvertible(_Base, ty.Generic[T], metaclass=OverridableMessagesMet
     __slots__ = ('messages', )
 
     def __init__(self, messages: ty.Optional[Messages] = None) -> None:
-        self.messages = dict(self.MESSAGES, **(messages or {}))
+        self.messages: ty.Mapping[str, str] = _resolve_messages(self.MESSAGES, messages)
 
     def convert(self, value: ty.Any, path: Path, *args: ty.Any, **context: ty.Any) -> ty.Optional[T]:
         raise NotImplementedError()
@@ -104,7 +115,7 @@ class AbstractValidator(_Base, ty.Generic[T], metaclass=OverridableMessagesMeta)
     __slots__ = ('messages', )
 
     def __init__(self, messages: ty.Optional[Messages] = None) -> None:
-        self.messages = dict(self.MESSAGES, **(messages or {}))
+        self.messages: ty.Mapping[str, str] = _resolve_messages(self.MESSAGES, messages)
 
     def __call__(self, value: T, original: ty.Any, *args: ty.Any, **context: ty.Any) -> ValidationResult:
         raise NotImplementedError()
@@ -121,17 +132,30 @@ class TypeMeta(OverridableMessagesMeta):
             **kwargs: ty.Any
     ) -> ty.Any:
         validators: ty.Set[str] = set()
+        constraints: ty.Dict[str, ty.Tuple[str, ...]] = {}
 
         for base in reversed(bases):
             if hasattr(base, "VALIDATORS"):
                 validators.update(base.VALIDATORS)  # type: ignore
+            if hasattr(base, "VALIDATOR_CONSTRAINTS"):
+                constraints.update(base.VALIDATOR_CONSTRAINTS)  # type: ignore
 
         for attr_name, attr in namespace.items():
             if attr_name.startswith('validate_'):
                 validators.add(attr_name)
+                # Overridden validator may not depend on inherited constraints
+                constraints.pop(attr_name, None)
+
+        if 'VALIDATOR_CONSTRAINTS' in namespace:
+            constraints.update(namespace['VALIDATOR_CONSTRAINTS'])
 
         cls = super(TypeMeta, mcs).__new__(mcs, name, bases, namespace, *args, **kwargs)
         cls.VALIDATORS = validators  # type: ignore
+        cls.VALIDATOR_CONSTRAINTS = constraints  # type: ignore
+
+        # Overridden cast may not be a no-op in strict mode
+        if '_cast' in namespace and 'STRICT_CAST' not in namespace:
+            cls.STRICT_CAST = True  # type: ignore
 
         return cls
 
@@ -151,6 +175,10 @@ class BaseType(AbstractConvertible[T], metaclass=TypeMeta):
 
     """Base type
 
+    Only validators whose constraints are set get bound to an instance.
+    Constraints of validators are declared in ``VALIDATOR_CONSTRAINTS`` as names
+    of instance attributes; validators not listed there are always bound.
+
     :param default: default value
     :param nullable: invalidate when value is None
     :param enum: determines allowed values
@@ -166,6 +194,13 @@ class BaseType(AbstractConvertible[T], metaclass=TypeMeta):
 
     VALIDATORS: ty.ClassVar[ty.Set[str]]
 
+    VALIDATOR_CONSTRAINTS: ty.ClassVar[ValidatorConstraints] = {
+        'validate_enum': ('enum', )
+    }
+
+    # When False, `_cast` is skipped in strict mode
+    STRICT_CAST: ty.ClassVar[bool] = True
+
     __slots__ = (
         '_default',
         'nullable',
@@ -184,11 +219,26 @@ class BaseType(AbstractConvertible[T], metaclass=TypeMeta):
         self._default = default
         self.nullable = nullable
         self.enum = enum
-        self.validators: ty.List[Validator[T]] = [getattr(self, validator_name) for validator_name in self.VALIDATORS]
+        self.validators: ty.List[Validator[T]] = [
+            getattr(self, validator_name) for validator_name in self.VALIDATORS
+            if self._is_constrained(validator_name)
+        ]
         if validators:
             self.validators.extend(validators)
         super(BaseType, self).__init__(**kwargs)
 
+    def _is_constrained(self, validator_name: str) -> bool:
+        constraints = self.VALIDATOR_CONSTRAINTS.get(validator_name)
+        if constraints is None:
+            return True
+
+        for constraint in constraints:
+            value = getattr(self, constraint)
+            if value is not None and value is not False:
+                return True
+
+        return False
+
     @property
     def default(self) -> ty.Any:
         if callable(self._default):
@@ -200,7 +250,7 @@ class BaseType(AbstractConvertible[T], metaclass=TypeMeta):
         return value
 
     def _check_type(self, value: ty.Any, path: Path, *args: ty.Any, **context: ty.Any) -> bool:
-        return not self.TYPES or isinstance(value, self.TYPES)
+        return not self.TYPES or type(value) in self.TYPES or isinstance(value, self.TYPES)
 
     def _convert(self, value: ty.Any, path: Path, *args: ty.Any, **context: ty.Any) -> T:
         return value
@@ -241,15 +291,19 @@ class BaseType(AbstractConvertible[T], metaclass=TypeMeta):
             else:
                 value = default
 
-        value = original = self._cast(
-            value, path, entity=entity, **context)
+        if self.STRICT_CAST or not context.get('strict', True):
+            value = self._cast(value, path, entity=entity, **context)
+
+        original = value
 
         if not self._check_type(value, path, entity=entity, **context):
             raise SchemaError(Error(path, self.messages['type']))
 
         result = self._convert(value, path, entity=entity, **context)
 
-        self._validate(result, original, path, entity=entity, **context)
+        # Validation is skipped for specifications already validated before
+        if self.validators and not context.get('trusted', False):
+            self._validate(result, original, path, entity=entity, **context)
 
         return result
 
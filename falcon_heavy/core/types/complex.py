@@ -17,7 +17,7 @@ from collections import Mapping
 
 from falcon_heavy.utils import force_str, FalconHeavyUnicodeDecodeError
 
-from .base import AbstractConvertible, BaseType, ValidationResult, Messages, Types
+from .base import AbstractConvertible, BaseType, ValidationResult, Messages, Types, ValidatorConstraints
 from .enums import ConvertibleEntity
 from .exceptions import SchemaError
 from .errors import Error
@@ -53,6 +53,11 @@ class ArrayType(BaseType[ty.Sequence[ty.Optional[T_item]]]):
 
     TYPES: ty.ClassVar[Types] = (list, tuple)
 
+    VALIDATOR_CONSTRAINTS: ty.ClassVar[ValidatorConstraints] = {
+        'validate_length': ('min_items', 'max_items'),
+        'validate_uniqueness': ('unique_items', )
+    }
+
     __slots__ = (
         'item_type',
         'min_items',
@@ -144,7 +149,11 @@ class MapType(BaseType[ty.Mapping[str, ty.Optional[T_value]]]):
         'max_values': "Map must have no more than {0} values. It had {1} values",
     }
 
-    TYPES: ty.ClassVar[Types] = (Mapping, )
+    TYPES: ty.ClassVar[Types] = (dict, Mapping)
+
+    VALIDATOR_CONSTRAINTS: ty.ClassVar[ValidatorConstraints] = {
+        'validate_length': ('min_values', 'max_values')
+    }
 
     __slots__ = (
         'value_type',
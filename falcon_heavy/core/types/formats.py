@@ -14,17 +14,12 @@
 
 import io
 import re
-import uuid
+import sys
 import base64
 import binascii
 import datetime
 import typing as ty
 
-import rfc3987
-import rfc3339
-
-from strict_rfc3339 import rfc3339_to_timestamp, InvalidRFC3339Error
-
 from falcon_heavy.utils import force_str, force_bytes
 
 from .base import AbstractConvertible, BaseType, ValidationResult, Messages
@@ -121,6 +116,7 @@ class DateTimeType(AbstractConvertible[ty.Union[str, datetime.datetime]]):
             **context: ty.Any
     ) -> ty.Optional[ty.Union[str, datetime.datetime]]:
         if isinstance(value, datetime.datetime) and entity == ConvertibleEntity.RESPONSE and value is not None:
+            import rfc3339
             value = rfc3339.rfc3339(value)
 
         result = self.subtype.convert(value, path, *args, entity=entity, **context)
@@ -131,6 +127,9 @@ class DateTimeType(AbstractConvertible[ty.Union[str, datetime.datetime]]):
         if result is None:
             return None
 
+        # Imported on first use, as well as other format libraries
+        from strict_rfc3339 import rfc3339_to_timestamp, InvalidRFC3339Error
+
         try:
             return datetime.datetime.fromtimestamp(rfc3339_to_timestamp(value))
         except InvalidRFC3339Error:
@@ -187,6 +186,8 @@ class URIType(StringType):
     __slots__ = ()
 
     def validate_format(self, value: str, *args: ty.Any, **context: ty.Any) -> ValidationResult:
+        import rfc3987
+
         try:
             rfc3987.parse(value, rule='URI')
         except ValueError:
@@ -278,7 +279,9 @@ class UUIDType(StringType):
             entity: ty.Optional[ConvertibleEntity] = None,
             **context: ty.Any
     ) -> ty.Any:
-        if entity == ConvertibleEntity.RESPONSE and isinstance(value, uuid.UUID):
+        # A value can't be an UUID unless the module is already imported
+        uuid = sys.modules.get('uuid')
+        if entity == ConvertibleEntity.RESPONSE and uuid is not None and isinstance(value, uuid.UUID):
             return str(value)
 
         return value
@@ -19,7 +19,7 @@ import json
 
 from falcon_heavy.core.utils import comma_delimited
 
-from .base import AbstractConvertible, BaseType, TypeMeta, ValidationResult, Messages, Types
+from .base import AbstractConvertible, BaseType, TypeMeta, ValidationResult, Messages, Types, ValidatorConstraints
 from .enums import ConvertibleEntity
 from .exceptions import SchemaError, UndefinedResultError
 from .errors import Error
@@ -229,7 +229,11 @@ class ObjectType(BaseType[T], metaclass=ObjectTypeMeta, result_class=Object):
 
     WRITE_ONLY: ty.ClassVar[WriteOnly]
 
-    TYPES: ty.ClassVar[Types] = (Mapping, )
+    TYPES: ty.ClassVar[Types] = (dict, Mapping)
+
+    VALIDATOR_CONSTRAINTS: ty.ClassVar[ValidatorConstraints] = {
+        'validate_length': ('min_properties', 'max_properties')
+    }
 
     RESULT_CLASS: ty.ClassVar[ty.Type[T]]
 
@@ -48,7 +48,7 @@ class DiscriminatedType(BaseType):
         'not_match': "The discriminator value must be equal to one of the following values: {0}"
     }
 
-    TYPES: ty.ClassVar[Types] = (Mapping, )
+    TYPES: ty.ClassVar[Types] = (dict, Mapping)
 
     __slots__ = (
         'property_name',
@@ -13,11 +13,10 @@
 # limitations under the License.
 
 import typing as ty
-from distutils.util import strtobool
 
 from falcon_heavy.utils import force_str, FalconHeavyUnicodeDecodeError
 
-from .base import BaseType, ValidationResult, Messages, Types
+from .base import BaseType, ValidationResult, Messages, Types, ValidatorConstraints
 from .path import Path
 from .exceptions import SchemaError
 from .errors import Error
@@ -31,6 +30,12 @@ __all__ = (
     'BooleanType',
 )
 
+# Same values as of `distutils.util.strtobool`
+_BOOLEANS = {
+    'y': True, 'yes': True, 't': True, 'true': True, 'on': True, '1': True,
+    'n': False, 'no': False, 'f': False, 'false': False, 'off': False, '0': False
+}
+
 
 class StringType(BaseType[str]):
 
@@ -51,6 +56,13 @@ class StringType(BaseType[str]):
 
     TYPES: ty.ClassVar[Types] = (str, )
 
+    VALIDATOR_CONSTRAINTS: ty.ClassVar[ValidatorConstraints] = {
+        'validate_length': ('min_length', 'max_length'),
+        'validate_pattern': ('pattern', )
+    }
+
+    STRICT_CAST: ty.ClassVar[bool] = False
+
     __slots__ = (
         'min_length',
         'max_length',
@@ -124,6 +136,14 @@ class GenericNumberType(BaseType[T_num]):
 
     TYPES: ty.ClassVar[Types] = (int, float)
 
+    VALIDATOR_CONSTRAINTS: ty.ClassVar[ValidatorConstraints] = {
+        'validate_minimum': ('minimum', ),
+        'validate_maximum': ('maximum', ),
+        'validate_multiple_of': ('multiple_of', )
+    }
+
+    STRICT_CAST: ty.ClassVar[bool] = False
+
     __slots__ = (
         'minimum',
         'maximum',
@@ -161,6 +181,9 @@ class GenericNumberType(BaseType[T_num]):
             raise SchemaError(Error(path, self.messages['cast']))
 
     def _check_type(self, value: ty.Any, path: Path, *args: ty.Any, **context: ty.Any) -> bool:
+        if type(value) in self.TYPES:
+            return True
+
         # bool is subtype of int
         if isinstance(value, bool):
             return False
@@ -224,6 +247,8 @@ class IntegerType(GenericNumberType[int]):
 
     TYPES: ty.ClassVar[Types] = (int, )
 
+    STRICT_CAST: ty.ClassVar[bool] = False
+
     __slots__ = ()
 
     def _cast(self, value: ty.Any, path: Path, *args: ty.Any, strict: bool = True, **context: ty.Any) -> ty.Any:
@@ -247,6 +272,8 @@ class BooleanType(BaseType[bool]):
 
     TYPES: ty.ClassVar[Types] = (bool, )
 
+    STRICT_CAST: ty.ClassVar[bool] = False
+
     __slots__ = ()
 
     def _cast(self, value: ty.Any, path: Path, *args: ty.Any, strict: bool = True, **context: ty.Any) -> ty.Any:
@@ -255,8 +282,8 @@ class BooleanType(BaseType[bool]):
 
         if isinstance(value, str):
             try:
-                return bool(strtobool(value))
-            except ValueError:
+                return _BOOLEANS[value.lower()]
+            except KeyError:
                 pass
 
         elif isinstance(value, (int, float)):
@@ -12,24 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import yaml
+import os
 import json
+import hashlib
+import threading
 import contextlib
 import typing as ty
-from collections import Sequence
+from collections import Sequence, Mapping
 from functools import lru_cache
 from urllib.parse import urljoin, unquote, urldefrag, urlsplit as _urlsplit, urlparse, SplitResult
-from urllib.request import urlopen
-
-try:
-    import requests
-except ImportError:
-    requests = None  # type: ignore
 
 __all__ = (
     'RefResolutionError',
     'URIDict',
     'RefHandlers',
+    'get_safe_loader',
+    'load_document',
+    'load_file',
     'RefResolver',
 )
 
@@ -48,12 +47,17 @@ def urlsplit(url: str) -> SplitResult:
 VT = ty.TypeVar('VT')
 
 
+@lru_cache(4096)
+def _normalize_uri(uri: str) -> str:
+    return urlsplit(uri).geturl()
+
+
 class URIDict(ty.MutableMapping[str, VT]):
     """Dictionary which uses normalized URIs as keys."""
 
     @staticmethod
     def normalize(uri: str) -> str:
-        return urlsplit(uri).geturl()
+        return _normalize_uri(uri)
 
     def __init__(self, *args: ty.Any, **kwargs: ty.Any) -> None:
         self.store: ty.MutableMapping[str, VT] = dict()
@@ -81,6 +85,153 @@ class URIDict(ty.MutableMapping[str, VT]):
 RefHandlers = ty.Mapping[str, ty.Callable[[str], ty.Mapping]]
 
 
+@lru_cache(maxsize=None)
+def get_safe_loader() -> ty.Type:
+    """Returns the fastest available safe YAML loader
+
+    PyYAML is imported on first use, since JSON documents don't need it.
+    """
+    import yaml
+
+    try:
+        return yaml.CSafeLoader
+    except AttributeError:  # PyYAML built without libyaml
+        return yaml.SafeLoader
+
+
+def _parse(data: ty.Union[str, bytes]) -> ty.Mapping:
+    text = data.decode('utf-8') if isinstance(data, bytes) else data
+
+    # JSON documents don't need the YAML parser
+    is_json = text.lstrip()[:1] in ('{', '[')
+    if is_json:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+
+    import yaml
+
+    try:
+        return yaml.load(text, Loader=get_safe_loader())
+    except yaml.YAMLError:
+        if not is_json:
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                pass
+
+        raise RefResolutionError(
+            "Unknown file format. Expected YAML or JSON")
+
+
+def load_document(fh: ty.IO) -> ty.Mapping:
+    """Loads a YAML or JSON document from a file object"""
+    return _parse(fh.read())
+
+
+def _write_cache(cache_path: str, write: ty.Callable[[ty.IO], None]) -> None:
+    """Writes a cache file atomically. Processes and threads never share a temporary file"""
+    import tempfile
+
+    directory = os.path.dirname(cache_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with open(fd, 'w') as fh:
+            write(fh)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _is_json_compatible(document: ty.Any) -> bool:
+    """Returns True if the document is the same after a JSON round trip"""
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if not all(isinstance(key, str) for key in node):
+                return False
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif node is not None and not isinstance(node, (str, int, float)):
+            # E.g. timestamps and binary data of YAML documents
+            return False
+    return True
+
+
+def _load_cached(data: bytes, cache_dir: str) -> ty.Mapping:
+    # Parsed documents are kept as JSON. Unlike pickles, loading them
+    # can't run code put into the directory by someone else
+    cache_path = os.path.join(cache_dir, hashlib.sha256(data).hexdigest() + '.json')
+    try:
+        with open(cache_path) as fh:
+            return json.load(fh)
+    except Exception:
+        # Missed, truncated or corrupted documents are parsed again
+        pass
+
+    document = _parse(data)
+    if _is_json_compatible(document):
+        _write_cache(cache_path, lambda fh: json.dump(document, fh))
+
+    return document
+
+
+_files_cache: ty.Dict[str, ty.Tuple[ty.Tuple[int, int], ty.Mapping]] = {}
+_files_cache_lock = threading.Lock()
+
+
+def load_file(path: str, cache_dir: ty.Optional[str] = None) -> ty.Mapping:
+    """Loads a YAML or JSON document from a file
+
+    Parsed documents are cached until modification time or size of the file changes.
+    Returned documents are shared and must not be modified.
+
+    :param path: path of the file
+    :param cache_dir: a directory where parsed documents are kept between
+        runs. Documents are looked up by hash of the file content
+    :return: loaded document
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _files_cache_lock:
+        cached = _files_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(path, 'rb') as fh:
+        data = fh.read()
+
+    if cache_dir is not None:
+        document = _load_cached(data, cache_dir)
+    else:
+        document = _parse(data)
+
+    with _files_cache_lock:
+        _files_cache[path] = (stamp, document)
+
+    return document
+
+
+def _iter_refs(document: ty.Any) -> ty.Iterator[str]:
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Mapping):
+            ref = node.get('$ref')
+            if isinstance(ref, str):
+                yield ref
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
 class RefResolver:
     """
     Resolve JSON References.
@@ -96,6 +247,9 @@ class RefResolver:
         caching the results of joining the resolution scope to subscopes.
     :param remote_cache: A cache that will be used for
         caching the results of resolved remote URLs.
+    :param cache_dir: A directory where documents retrieved over
+        HTTP(S) are kept. Documents found there are never requested again.
+        Parsed local files are kept there too.
     """
 
     def __init__(
@@ -107,10 +261,12 @@ class RefResolver:
         handlers: ty.Optional[RefHandlers] = None,
         urljoin_cache: ty.Optional[ty.Callable] = None,
         remote_cache: ty.Optional[ty.Callable] = None,
+        cache_dir: ty.Optional[str] = None,
     ):
         self.referrer = referrer
         self.cache_remote = cache_remote
         self.handlers = handlers or {}
+        self.cache_dir = cache_dir
 
         self._scopes_stack: ty.List[str] = [base_uri]
         self.store = URIDict[ty.Mapping]()
@@ -220,6 +376,63 @@ class RefResolver:
 
         return document
 
+    def fingerprint(self) -> str:
+        """
+        Calculate a fingerprint of the referring document and all the documents
+        in the store. It doesn't depend on locations of the documents.
+
+        :return: The hex digest of SHA-256 hash.
+        """
+
+        digests = sorted(
+            hashlib.sha256(json.dumps(
+                document, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')).hexdigest()
+            for document in self.store.values()
+        )
+        return hashlib.sha256(':'.join(digests).encode('ascii')).hexdigest()
+
+    def prefetch(self, max_workers: ty.Optional[int] = None) -> int:
+        """
+        Retrieve all documents referenced from the referring document,
+        directly or through other documents, concurrently.
+
+        Retrieved documents are saved in the store, so the following
+        resolution never blocks on I/O.
+
+        :param max_workers: The maximum number of threads used to
+            retrieve documents.
+        :return: The number of retrieved documents.
+        """
+
+        documents = [(self.base_uri, self.referrer)]
+        count = 0
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while documents:
+                urls = set()
+                for base_uri, document in documents:
+                    for ref in _iter_refs(document):
+                        url, _ = urldefrag(self._urljoin_cache(base_uri, ref))
+                        if url and url not in self.store:
+                            urls.add(url)
+
+                documents = []
+                futures = {url: executor.submit(self.retrieve, url) for url in urls}
+                for url, future in futures.items():
+                    try:
+                        document = future.result()
+                    except Exception:
+                        # Will be reported when the reference is resolved
+                        continue
+
+                    self.store[url] = document
+                    documents.append((url, document))
+                    count += 1
+
+        return count
+
     def resolve_remote(self, uri: str) -> ty.Mapping:
         """
         Resolve a remote ``uri``.
@@ -228,6 +441,21 @@ class RefResolver:
         retrieving the document at the specified URI it will be saved in
         the store if :attr:`cache_remote` is True.
 
+        :param uri: The URI to resolve.
+        :return: The retrieved document.
+        """
+
+        result = self.retrieve(uri)
+
+        if self.cache_remote:
+            self.store[uri] = result
+
+        return result
+
+    def retrieve(self, uri: str) -> ty.Mapping:
+        """
+        Retrieve a document at the ``uri`` without using the store.
+
         If the requests_ library is present, ``jsonschema`` will use it to
         request the remote ``uri``, so that the correct encoding is
         detected and used.
@@ -235,18 +463,37 @@ class RefResolver:
         If it isn't, or if the scheme of the ``uri`` is not ``http`` or
         ``https``, UTF-8 is assumed.
 
-        :param uri: The URI to resolve.
+        :param uri: The URI to retrieve.
         :return: The retrieved document.
         """
 
         scheme = urlsplit(uri).scheme
 
         if scheme in self.handlers:
-            result = self.handlers[scheme](uri)
+            return self.handlers[scheme](uri)
+
+        elif scheme == 'file':
+            return load_file(urlparse(uri, 'file').path, cache_dir=self.cache_dir)
+
+        cache_dir = self.cache_dir
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = os.path.join(
+                cache_dir, hashlib.sha256(uri.encode('utf-8')).hexdigest() + '.json')
+            try:
+                with open(cache_path) as fh:
+                    return json.load(fh)
+            except (OSError, ValueError):
+                pass
+
+        try:
+            import requests
+        except ImportError:
+            requests = None  # type: ignore
 
-        elif (scheme in ['http', 'https'] and
-              requests and
-              getattr(requests.Response, 'json', None) is not None):
+        if (scheme in ['http', 'https'] and
+                requests and
+                getattr(requests.Response, 'json', None) is not None):
             # Requests has support for detecting the correct encoding of
             # json over http
             if callable(requests.Response.json):
@@ -254,25 +501,13 @@ class RefResolver:
             else:
                 result = requests.get(uri).json
 
-        elif scheme == 'file':
-            path = urlparse(uri, 'file').path
-
-            with open(path) as fh:
-                try:
-                    result = yaml.safe_load(fh)
-                except yaml.YAMLError:
-                    fh.seek(0)
-                    try:
-                        result = json.loads(fh.read())
-                    except json.JSONDecodeError:
-                        raise RefResolutionError(
-                            "Unknown file format. Expected YAML or JSON")
-
         else:
             # Otherwise, pass off to urllib and assume utf-8
+            from urllib.request import urlopen
+
             result = json.loads(urlopen(uri).read().decode('utf-8'))
 
-        if self.cache_remote:
-            self.store[uri] = result
+        if cache_dir is not None and cache_path is not None:
+            _write_cache(cache_path, lambda fh: json.dump(result, fh))
 
         return result
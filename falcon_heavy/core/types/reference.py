@@ -16,8 +16,6 @@ import weakref
 import typing as ty
 from collections import Mapping
 
-from wrapt import ObjectProxy
-
 from .base import AbstractConvertible, Messages
 from .ref_resolver import RefResolver, RefResolutionError
 from .exceptions import SchemaError
@@ -39,6 +37,14 @@ Bad = object()
 Dummy = object()
 
 
+def _make_proxy() -> ty.Any:
+    """Makes a proxy of the object that is being converted"""
+    # wrapt is imported on first use
+    from wrapt import ObjectProxy
+
+    return ObjectProxy(Dummy)
+
+
 Registry = ty.Dict[Path, ty.Any]
 VisitedRefs = ty.Set[Path]
 
@@ -98,7 +104,7 @@ class ReferenceType(AbstractConvertible[T]):
             elif result is not None:
                 return result
 
-            proxy = ObjectProxy(Dummy)
+            proxy = _make_proxy()
             registry[path] = proxy
             try:
                 result = self.subtype.convert(
@@ -146,7 +152,7 @@ class ReferenceType(AbstractConvertible[T]):
                 elif result is not None:
                     return result
 
-                proxy = ObjectProxy(Dummy)
+                proxy = _make_proxy()
                 registry[target_path] = proxy
                 visited_refs.add(target_path)
                 try:
@@ -36,6 +36,9 @@ class UndefinedType:
     def __ne__(self, other: ty.Any) -> bool:
         return self is not other
 
+    def __hash__(self) -> int:
+        return id(self)
+
     def __bool__(self) -> bool:
         return False
 
@@ -15,5 +15,7 @@
 from .datastructures import *
 from .exceptions import *
 from .multipart_parser import *
+from .multipart_encoder import *
+from .upload_handlers import *
 from .testing import *
 from .utils import *
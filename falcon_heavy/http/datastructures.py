@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
 import copy
+import stat
 import errno
 import typing as ty
+from contextlib import contextmanager
 
 __all__ = (
     'MultiValueDictKeyError',
@@ -235,6 +238,82 @@ class FormStorage:
         return self.headers.get('content-type')
 
 
+def _get_file(stream: ty.Any) -> ty.Any:
+    # Data of a spooled temporary file are in its underlying file
+    if hasattr(stream, '_rolled'):
+        return stream._file
+    return stream
+
+
+def _get_fileno(stream: ty.Any) -> ty.Optional[int]:
+    """Returns file descriptor of a stream backed by a file on disk"""
+    if getattr(stream, '_rolled', True) is False:
+        # Getting file descriptor rolls it over to disk
+        return None
+
+    try:
+        return _get_file(stream).fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _copy_fd(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copies data between files in the kernel. Returns number of copied bytes"""
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    sendfile = getattr(os, 'sendfile', None)
+    copied = 0
+    while copied < count:
+        try:
+            if copy_file_range is not None:
+                sent = copy_file_range(src_fd, dst_fd, count - copied, offset + copied)
+            elif sendfile is not None:
+                sent = sendfile(dst_fd, src_fd, offset + copied, count - copied)
+            else:
+                break
+        except OSError:
+            # Not supported for the files. Try the next way
+            if copy_file_range is not None:
+                copy_file_range = None
+                continue
+            break
+
+        if not sent:
+            break
+        copied += sent
+
+    return copied
+
+
+def _copy_stream(src: ty.Any, dst: ty.Any, buffer_size: int) -> None:
+    """Copies the rest of the source stream to the destination stream"""
+    getbuffer = getattr(_get_file(src), 'getbuffer', None)
+    if getbuffer is not None:
+        position = src.tell()
+        with getbuffer() as buffer, buffer[position:] as data:
+            dst.write(data)
+        src.seek(0, io.SEEK_END)
+        return
+
+    src_fd = _get_fileno(src)
+    dst_fd = _get_fileno(dst)
+    if src_fd is not None and dst_fd is not None:
+        try:
+            dst.flush()
+            dst_position = dst.tell()
+            position = src.tell()
+        except (AttributeError, OSError, ValueError):
+            pass
+        else:
+            src.flush()
+            copied = _copy_fd(src_fd, dst_fd, position, os.fstat(src_fd).st_size - position)
+            src.seek(position + copied)
+            # Buffered file objects must know about the new position
+            dst.seek(dst_position + copied)
+
+    from shutil import copyfileobj
+    copyfileobj(src, dst, buffer_size)
+
+
 class FileStorage:
 
     def __init__(
@@ -247,6 +326,8 @@ class FileStorage:
     ) -> None:
         self.stream = stream
         self._filename = filename
+        # Checksums computed while the file was uploaded by names of algorithms
+        self.checksums: ty.Dict[str, str] = {}
         if headers is None:
             headers = {}
         self.headers = headers
@@ -286,12 +367,36 @@ class FileStorage:
     def read(self, size: int = -1) -> ty.AnyStr:
         return self.stream.read(size)
 
+    def get_size(self) -> ty.Optional[int]:
+        """Return size of the rest of the file if it's known without reading it."""
+        stream = self.stream
+        try:
+            getbuffer = getattr(_get_file(stream), 'getbuffer', None)
+            if getbuffer is not None:
+                with getbuffer() as buffer:
+                    return buffer.nbytes - stream.tell()
+
+            fileno = _get_fileno(stream)
+            if fileno is not None:
+                stream.flush()
+                result = os.fstat(fileno)
+                if stat.S_ISREG(result.st_mode):
+                    return result.st_size - stream.tell()
+        except (OSError, ValueError):
+            pass
+
+        return None
+
     def save(self, dst: ty.Union[str, ty.IO], buffer_size: int = 16 * 1024) -> None:
         """Save the file to a destination path or file object.  If the
         destination is a file object you have to close it yourself after the
         call.  The buffer size is the number of bytes held in memory during
         the copy process.  It defaults to 16KB.
 
+        Data of a file kept in memory are written at once. Data of a file
+        on disk are copied to another file by the kernel where possible
+        (see :func:`os.copy_file_range` and :func:`os.sendfile`).
+
         For secure file saving also have a look at :func:`secure_filename`.
 
         :param dst: a filename or open file object the uploaded file
@@ -299,17 +404,107 @@ class FileStorage:
         :param buffer_size: the size of the buffer.  This works the same as
             the `length` parameter of :func:`shutil.copyfileobj`.
         """
-        from shutil import copyfileobj
         close_dst = False
         if isinstance(dst, str):
             dst = open(dst, 'wb')
             close_dst = True
         try:
-            copyfileobj(self.stream, dst, buffer_size)
+            _copy_stream(self.stream, dst, buffer_size)
         finally:
             if close_dst:
                 dst.close()
 
+    def move(self, dst: str, buffer_size: int = 16 * 1024) -> None:
+        """Move the whole file to a destination path atomically.
+
+        A named file on disk is renamed. Otherwise the file is saved to
+        a temporary file next to the destination which then replaces it,
+        and a named file is removed. The stream stays open at the same position.
+
+        :param dst: a filename the uploaded file is moved to.
+        :param buffer_size: the size of the buffer used if the file is copied.
+        """
+        stream = self.stream
+        flush = getattr(stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+        name = getattr(_get_file(stream), 'name', None)
+        fileno = _get_fileno(stream)
+        if not isinstance(name, str) or fileno is None or not os.path.exists(name) or \
+                not os.path.samestat(os.fstat(fileno), os.stat(name)):
+            name = None
+
+        if name is not None:
+            try:
+                os.replace(name, dst)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+
+        import tempfile
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(dst)))
+        try:
+            try:
+                position: ty.Optional[int] = stream.tell()
+                stream.seek(0)
+            except (OSError, ValueError):
+                # Not seekable, the rest of data is moved
+                position = None
+            try:
+                with open(fd, 'wb') as f:
+                    _copy_stream(stream, f, buffer_size)
+            finally:
+                if position is not None:
+                    stream.seek(position)
+            os.replace(tmp, dst)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+        if name is not None:
+            os.unlink(name)
+
+    @contextmanager
+    def view(self) -> ty.Iterator[memoryview]:
+        """Provide read-only memory of the whole file.
+
+        Data of a file on disk are mapped into memory rather than read, so
+        large files may be hashed or inspected without copying::
+
+            with storage.view() as data:
+                digest = hashlib.sha256(data).hexdigest()
+
+        Data of other streams are read to the end. The memory must not be
+        referenced after the block.
+        """
+        stream = self.stream
+        file = _get_file(stream)
+        if isinstance(file, io.BytesIO):
+            # Bytes of the buffer are shared rather than copied while it isn't changed
+            with memoryview(file.getvalue()) as data:
+                yield data
+            return
+
+        fileno = _get_fileno(stream)
+        if fileno is None:
+            with memoryview(stream.read()) as data:
+                yield data
+            return
+
+        stream.flush()
+        if not os.fstat(fileno).st_size:
+            yield memoryview(b'')
+            return
+
+        import mmap
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as data:
+            yield data
+
     def close(self) -> None:
         """Close the underlying file if possible."""
         try:
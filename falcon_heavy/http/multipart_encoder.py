@@ -0,0 +1,243 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import secrets
+import mimetypes
+import typing as ty
+from collections import Mapping
+from urllib.parse import quote
+
+from .datastructures import MultiValueDict, FormStorage, FileStorage
+
+__all__ = (
+    'MultiPartEncoder',
+)
+
+AnyStorage = ty.Union[FormStorage, FileStorage]
+
+
+def _to_storage(value: ty.Any) -> AnyStorage:
+    if isinstance(value, (FormStorage, FileStorage)):
+        return value
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return FileStorage(stream=io.BytesIO(value))
+
+    if hasattr(value, 'read'):
+        return FileStorage(stream=value)
+
+    if isinstance(value, str):
+        return FormStorage(value)
+
+    if isinstance(value, (Mapping, list)):
+        # Imported here, so the package doesn't import the core on start
+        from falcon_heavy.core.encoders import get_json_backend
+        return FormStorage(get_json_backend().dumps(value), content_type='application/json')
+
+    return FormStorage(str(value))
+
+
+def _iter_pairs(parts: ty.Any) -> ty.Iterator[ty.Tuple[str, ty.Any]]:
+    if isinstance(parts, MultiValueDict):
+        for name, values in parts.lists():
+            for value in values:
+                yield name, value
+
+    elif isinstance(parts, Mapping):
+        for name, value in parts.items():
+            if isinstance(value, (list, tuple)):
+                for item in value:
+                    yield name, item
+            else:
+                yield name, value
+
+    else:
+        yield from parts
+
+
+def _drop_line_breaks(value: str) -> str:
+    # Line breaks in names would end the header and let the value inject headers or parts
+    return value.replace('\r', '').replace('\n', '')
+
+
+def _quote(value: str) -> str:
+    # Quotes are percent-encoded as browsers do, since parsers seldom unescape them
+    return _drop_line_breaks(value).replace('"', '%22')
+
+
+def _check_header(name: str, value: str) -> None:
+    if any(c in name or c in value for c in '\r\n'):
+        raise ValueError("Header '%s' of a part must not contain line breaks" % name.strip())
+
+
+class MultiPartEncoder(io.RawIOBase):
+
+    """Encodes parts as a multipart body while it's read
+
+    The encoder is a readable stream and an iterable of chunks, so it may be
+    the stream of a streaming response. Data of files are read only when
+    they are sent.
+
+    :param parts: pairs of a name and a value, or a mapping. Values are
+        :class:`FormStorage` and :class:`FileStorage` instances, strings,
+        bytes, file-like objects, or objects and arrays sent as JSON
+    :param subtype: subtype of the multipart media type, e.g. ``form-data`` or ``mixed``
+    :param boundary: boundary of parts. Generated if not specified
+    :param charset: charset of headers and form values
+    :param chunk_size: the number of bytes read from a file at a time
+    """
+
+    def __init__(
+            self,
+            parts: ty.Any,
+            subtype: str = 'form-data',
+            boundary: ty.Optional[str] = None,
+            charset: str = 'utf-8',
+            chunk_size: int = 64 * 1024
+    ) -> None:
+        super(MultiPartEncoder, self).__init__()
+        self.parts: ty.List[ty.Tuple[str, ty.Any]] = list(_iter_pairs(parts))
+        self.subtype = subtype
+        if boundary is None:
+            boundary = secrets.token_hex(15)
+        self.boundary = boundary
+        self.charset = charset
+        self.chunk_size = chunk_size
+        self._chunks: ty.Optional[ty.Iterator[bytes]] = None
+        self._pending = memoryview(b'')
+
+    @property
+    def content_type(self) -> str:
+        return 'multipart/%s; boundary=%s' % (self.subtype, self.boundary)
+
+    def _get_storages(self) -> ty.List[ty.Tuple[str, AnyStorage]]:
+        # Values are kept as they are until sent, so they may be converted
+        # by the type of the response content
+        storages = [(name, _to_storage(value)) for name, value in self.parts]
+        self.parts = storages  # type: ignore
+        return storages
+
+    @property
+    def content_length(self) -> ty.Optional[int]:
+        """Length of the body if sizes of all files are known"""
+        result = len(self._encode_end())
+        for name, storage in self._get_storages():
+            if isinstance(storage, FileStorage):
+                size = storage.get_size()
+                if size is None:
+                    return None
+            else:
+                size = len(self._encode_value(storage))
+
+            result += len(self._encode_head(name, storage)) + size + 2
+
+        return result
+
+    def _encode_head(self, name: str, storage: AnyStorage) -> bytes:
+        filename = storage.filename if isinstance(storage, FileStorage) else None
+        if self.subtype == 'form-data':
+            disposition: ty.Optional[str] = 'form-data; name="%s"' % _quote(name)
+        else:
+            disposition = 'attachment' if filename else None
+
+        if filename:
+            filename = _drop_line_breaks(filename)
+
+        if disposition is not None and filename:
+            disposition += '; filename="%s"' % _quote(filename)
+            try:
+                filename.encode('ascii')
+            except UnicodeEncodeError:
+                disposition += "; filename*=%s''%s" % (self.charset, quote(filename, encoding=self.charset))
+
+        lines = ['--' + self.boundary]
+        if disposition is not None:
+            lines.append('Content-Disposition: ' + disposition)
+
+        headers = {k.lower(): v for k, v in storage.headers.items()}
+        headers.pop('content-disposition', None)
+        if isinstance(storage, FileStorage) and not headers.get('content-type'):
+            headers['content-type'] = filename and mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+        for header_name, value in headers.items():
+            value = str(value)
+            _check_header(header_name, value)
+            lines.append('%s: %s' % ('-'.join(word.capitalize() for word in header_name.split('-')), value))
+
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode(self.charset)
+
+    def _encode_value(self, storage: FormStorage) -> bytes:
+        return storage.value.encode(self.charset)
+
+    def _encode_end(self) -> bytes:
+        return ('--%s--\r\n' % self.boundary).encode(self.charset)
+
+    def _iter_chunks(self) -> ty.Iterator[bytes]:
+        for name, storage in self._get_storages():
+            yield self._encode_head(name, storage)
+
+            if isinstance(storage, FileStorage):
+                while True:
+                    chunk = storage.read(self.chunk_size)
+                    if not chunk:
+                        break
+
+                    yield chunk.encode(self.charset) if isinstance(chunk, str) else chunk
+
+            else:
+                yield self._encode_value(storage)
+
+            yield b'\r\n'
+
+        yield self._encode_end()
+
+    def _get_chunks(self) -> ty.Iterator[bytes]:
+        if self._chunks is None:
+            self._chunks = self._iter_chunks()
+        return self._chunks
+
+    def __iter__(self) -> ty.Iterator[bytes]:  # type: ignore
+        if self._pending:
+            yield self._pending.tobytes()
+            self._pending = memoryview(b'')
+
+        for chunk in self._get_chunks():
+            if chunk:
+                yield chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: ty.Any) -> int:
+        pending = self._pending
+        while not pending:
+            chunk = next(self._get_chunks(), None)
+            if chunk is None:
+                return 0
+            pending = memoryview(chunk)
+
+        size = min(len(buffer), len(pending))
+        buffer[:size] = pending[:size]
+        self._pending = pending[size:]
+        return size
+
+    def close(self) -> None:
+        """Closes files of parts"""
+        if not self.closed:
+            for _, value in self.parts:
+                close = getattr(value, 'close', None)
+                if close is not None:
+                    close()
+        super(MultiPartEncoder, self).close()
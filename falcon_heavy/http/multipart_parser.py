@@ -13,32 +13,24 @@
 # limitations under the License.
 
 import io
-import base64
+import re
 import binascii
-import cgi
 import typing as ty
-from collections import Iterator
 
 from falcon_heavy.utils import force_str, force_bytes
 
 from .datastructures import MultiValueDict, FormStorage, FileStorage
+from .upload_handlers import TemporaryFileUploadHandler
 from .utils import parse_header, parse_options_header, unescape_entities
 from .exceptions import (
     RequestDataTooBig,
     TooManyFieldsSent
 )
 
-SpooledTemporaryFile: ty.Any
-
-try:
-    from tempfile import SpooledTemporaryFile
-except ImportError:
-    from tempfile import TemporaryFile
-    SpooledTemporaryFile = None
-
 __all__ = (
     'MultiPartParserError',
     'MultiPartParser',
+    'Base64Decoder',
 )
 
 
@@ -46,7 +38,17 @@ class MultiPartParserError(Exception):
     pass
 
 
-_BASE64_DECODE_ERROR = binascii.Error
+_BASE64_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# Same as `cgi.valid_boundary`. The `cgi` module imports the whole `email` package
+_BOUNDARY_PATTERN = re.compile('^[ -~]{0,200}[!-~]$')
+_BYTES_BOUNDARY_PATTERN = re.compile(b'^[ -~]{0,200}[!-~]$')
+
+
+def _is_valid_boundary(boundary: ty.AnyStr) -> bool:
+    if isinstance(boundary, bytes):
+        return _BYTES_BOUNDARY_PATTERN.match(boundary) is not None
+    return _BOUNDARY_PATTERN.match(boundary) is not None
 
 
 class MultiPartParser:
@@ -71,6 +73,11 @@ class MultiPartParser:
         temporary directory (i.e. "/tmp" on *nix systems)
     :param chunk_size: the number of bytes that will be read at a time
     :param encoding: the encoding with which to treat the incoming data
+    :param upload_handler: handler that receives data of files as they are read.
+        Files are kept in spooled temporary files by default
+    :param part_checker: function that takes field name, file name and headers
+        of each part before its data are read. It may raise an exception to stop
+        reading the request
     """
 
     def __init__(self,
@@ -82,7 +89,9 @@ class MultiPartParser:
                  file_upload_max_memory_size=2621440,
                  file_upload_temp_dir=None,
                  chunk_size=64 * 1024,
-                 encoding='utf-8'):
+                 encoding='utf-8',
+                 upload_handler=None,
+                 part_checker=None):
         # Content-Type should contain multipart and the boundary information.
         if not content_type.startswith('multipart/'):
             raise MultiPartParserError('Invalid Content-Type: %s' % content_type)
@@ -90,7 +99,7 @@ class MultiPartParser:
         # Parse the header to get the boundary to split the parts.
         boundary = parse_options_header(force_bytes(
             content_type, encoding='ascii')).params.get('boundary')
-        if not boundary or not cgi.valid_boundary(boundary):
+        if not boundary or not _is_valid_boundary(boundary):
             raise MultiPartParserError('Invalid boundary in multipart: %s' % boundary)
 
         if content_length < 0:
@@ -105,34 +114,18 @@ class MultiPartParser:
         self._data_upload_max_number_fields = data_upload_max_number_fields
         self._data_upload_max_memory_size = data_upload_max_memory_size
 
-        self._file_upload_temp_dir = file_upload_temp_dir
-        self._file_upload_max_memory_size = file_upload_max_memory_size
+        if upload_handler is None:
+            upload_handler = TemporaryFileUploadHandler(
+                max_memory_size=file_upload_max_memory_size,
+                temp_dir=file_upload_temp_dir
+            )
+        self._upload_handler = upload_handler.new_request()
+        self._part_checker = part_checker
 
         self._encoding = encoding
 
         self._content_length = content_length
 
-    def new_file_stream(self, total_content_length):
-        if SpooledTemporaryFile is not None:
-            return SpooledTemporaryFile(
-                max_size=self._file_upload_max_memory_size,
-                suffix='.upload',
-                mode='wb+',
-                dir=self._file_upload_temp_dir
-            )
-
-        if (
-                total_content_length is None or
-                total_content_length > self._file_upload_max_memory_size
-        ):
-            return TemporaryFile(
-                suffix='.upload',
-                mode='wb+',
-                dir=self._file_upload_temp_dir
-            )
-
-        return io.BytesIO()
-
     def parse(self):
         """
         Parse the POST data and break it into a FILES MultiValueDict and a POST
@@ -140,144 +133,148 @@ class MultiPartParser:
 
         Return a tuple containing the POST and FILES dictionary, respectively.
         """
-        encoding = self._encoding
+        # Create the data structures to be used later.
+        form = MultiValueDict()
+        files = MultiValueDict()
 
         # HTTP spec says that Content-Length >= 0 is valid
         # handling content-length == 0 before continuing
         if self._content_length == 0:
-            return MultiValueDict(), MultiValueDict()
+            return form, files
 
-        # Create the data structures to be used later.
-        form = MultiValueDict()
-        files = MultiValueDict()
+        # Uploads of files that were already read. They are aborted
+        # if a later part fails, so no file is left behind
+        uploads = []
+        try:
+            for field_name, storage in self._iter_parts(lazy=False, uploads=uploads):
+                if isinstance(storage, FileStorage):
+                    files.appendlist(field_name, storage)
+                else:
+                    form.appendlist(field_name, storage)
+        except BaseException:
+            for upload in uploads:
+                upload.abort()
+            raise
 
-        # Instantiate the parser and stream:
-        stream = LazyStream(chunk_iter(self._stream, self._chunk_size))
+        # Make sure that the request data is all fed
+        exhaust(self._stream)
 
-        # Number of bytes that have been read.
-        num_bytes_read = 0
-        # To count the number of keys in the request.
-        num_post_keys = 0
-        # To limit the amount of data read from the request.
-        read_size = None
+        return form, files
 
-        parts = part_iter(stream, self._boundary)
+    def iter_parts(self):
+        """
+        Iterate over parts of the POST data in order of arrival.
 
-        # Find first boundary
-        try:
-            exhaust(next(parts))
-        except MultiPartParserError as e:
-            raise MultiPartParserError("Expected boundary at start of multipart data") from e
+        Yields pairs of field name and ``FormStorage`` or ``FileStorage``.
+        Files aren't stored: the stream of a file storage reads the file right
+        from the request, and it's closed once the next part is requested.
+        """
+        if self._content_length == 0:
+            return
 
-        for part in parts:
-            # Stream at beginning of header, look for end of header
-            # and parse it if found.
-            chunks = []
-            previous = b''
-            for chunk in part:
-                # 'find' returns the top of these four bytes, so we'll
-                # need to munch them later to prevent them from polluting
-                # the payload.
-                if previous:
-                    chunk = previous + chunk
-
-                header_end = chunk.find(b'\r\n\r\n')
-
-                if header_end < 0:
-                    # We find no header
-                    previous = chunk[-4:]
-                    chunks.append(chunk[:-4])
-                    continue
+        yield from self._iter_parts(lazy=True)
 
-                else:
-                    chunks.append(chunk[:header_end])
-                    # here we place any excess chunk back onto the stream, as
-                    # well as throwing away the CRLFCRLF bytes from above.
-                    part.unget(chunk[header_end + 4:])
-                    break
+        # Make sure that the request data is all fed
+        exhaust(self._stream)
 
-            header = b''.join(chunks)
+    def _parse_header(self, header):
+        """Returns field name, file name and headers of the part"""
+        encoding = self._encoding
 
-            if not header:
+        content_disposition = None
+        content_type = None
+
+        headers = {}
+        for line in header.split(b'\r\n'):
+            try:
+                name, value = parse_header(line)
+            except ValueError:
                 continue
 
-            content_disposition = None
-            content_type = None
+            if name in 'content-disposition':
+                content_disposition = parse_options_header(
+                    value, encoding=encoding, errors='replace')
 
-            headers = {}
-            for line in header.split(b'\r\n'):
-                try:
-                    name, value = parse_header(line)
-                except ValueError:
-                    continue
+            elif name == 'content-type':
+                content_type = parse_options_header(
+                    value, encoding=encoding, errors='replace')
 
-                if name in 'content-disposition':
-                    content_disposition = parse_options_header(
-                        value, encoding=encoding, errors='replace')
+            else:
+                headers[name] = force_str(
+                    value, encoding=encoding, errors='replace')
 
-                elif name == 'content-type':
-                    content_type = parse_options_header(
-                        value, encoding=encoding, errors='replace')
+        if content_disposition is None:
+            return None
 
-                else:
-                    headers[name] = force_str(
-                        value, encoding=encoding, errors='replace')
+        headers['content-disposition'] = str(content_disposition)
 
-            if content_disposition is None:
-                continue
+        if content_type is not None:
+            headers['content-type'] = str(content_type)
 
-            headers['content-disposition'] = str(content_disposition)
+        field_name = content_disposition.params.get('name')
+        if field_name is None:
+            return None
 
-            if content_type is not None:
-                headers['content-type'] = str(content_type)
+        return field_name, content_disposition.params.get('filename'), headers
+
+    def _iter_parts(self, lazy, uploads=None):
+        encoding = self._encoding
+
+        # Instantiate the reader of parts:
+        reader = MultipartReader(self._stream, self._boundary, self._chunk_size)
+
+        # Number of bytes that have been read.
+        num_bytes_read = 0
+        # To count the number of keys in the request.
+        num_post_keys = 0
+        # To limit the amount of data read from the request.
+        read_size = None
 
-            field_name = content_disposition.params.get('name')
-            if field_name is None:
+        for part in reader:
+            # Reader at beginning of header, look for end of header
+            # and parse it if found.
+            header = part.read_header()
+
+            if not header:
+                continue
+
+            parsed = self._parse_header(header)
+            if parsed is None:
                 continue
 
+            field_name, filename, headers = parsed
+
             transfer_encoding = headers.get('content-transfer-encoding')
 
-            filename = content_disposition.params.get('filename')
             if filename:
                 filename = self.ie_sanitize(unescape_entities(filename))
 
                 if not filename:
                     continue
 
-                stream = self.new_file_stream(self._content_length)
-
-                for chunk in part:
-                    if transfer_encoding == 'base64':
-                        # We only special-case base64 transfer encoding
-                        # We should always decode base64 chunks by multiple of 4,
-                        # ignoring whitespace
-
-                        stripped_chunk = b''.join(chunk.split())
+                if self._part_checker is not None:
+                    self._part_checker(field_name, filename, headers)
 
-                        remaining = len(stripped_chunk) % 4
-                        while remaining != 0:
-                            over_chunk = part.read(4 - remaining)
-                            if not over_chunk:
-                                break
-                            stripped_chunk += b''.join(over_chunk.split())
-                            remaining = len(stripped_chunk) % 4
+                chunks = self._iter_file_chunks(part, transfer_encoding)
 
-                        try:
-                            chunk = base64.b64decode(stripped_chunk)
-                        except Exception as e:
-                            # Since this is only a chunk, any error is an unfixable error
-                            raise MultiPartParserError("Could not decode base64 data: %s" % e) from e
-
-                    stream.write(chunk)
+                if not lazy:
+                    yield field_name, self._upload(field_name, filename, headers, chunks, uploads)
+                    continue
 
-                stream.seek(0)
-                files.appendlist(field_name, FileStorage(
-                    stream=stream,
-                    filename=filename,
-                    headers=headers
-                ))
+                stream = PartStream(chunks)
+                try:
+                    yield field_name, FileStorage(
+                        stream=stream,
+                        filename=filename,
+                        headers=headers
+                    )
+                finally:
+                    stream.close()
 
             else:
+                if self._part_checker is not None:
+                    self._part_checker(field_name, None, headers)
+
                 num_post_keys += 1
                 if (self._data_upload_max_number_fields is not None and
                         self._data_upload_max_number_fields < num_post_keys):
@@ -290,9 +287,10 @@ class MultiPartParser:
                 if transfer_encoding == 'base64':
                     raw_data = part.read(size=read_size)
                     num_bytes_read += len(raw_data)
+                    decoder = Base64Decoder()
                     try:
-                        data = base64.b64decode(raw_data)
-                    except _BASE64_DECODE_ERROR:
+                        data = decoder.decode(raw_data) + decoder.finish()
+                    except MultiPartParserError:
                         data = raw_data
 
                 else:
@@ -306,15 +304,40 @@ class MultiPartParser:
                         num_bytes_read > self._data_upload_max_memory_size):
                     raise RequestDataTooBig('Too big request body')
 
-                form.appendlist(field_name, FormStorage(
+                yield field_name, FormStorage(
                     value=force_str(data, encoding, errors='replace'),
                     headers=headers
-                ))
+                )
 
-        # Make sure that the request data is all fed
-        exhaust(self._stream)
+    def _iter_file_chunks(self, part, transfer_encoding):
+        """Yields data of the file part"""
+        if transfer_encoding != 'base64':
+            yield from part.iter_chunks()
+            return
 
-        return form, files
+        decoder = Base64Decoder()
+        for chunk in part.iter_chunks():
+            data = decoder.decode(chunk)
+            if data:
+                yield data
+
+        data = decoder.finish()
+        if data:
+            yield data
+
+    def _upload(self, field_name, filename, headers, chunks, uploads=None):
+        upload = self._upload_handler.new_upload(field_name, filename, headers)
+        try:
+            for chunk in chunks:
+                upload.write(chunk)
+            result = upload.complete()
+        except BaseException:
+            upload.abort()
+            raise
+
+        if uploads is not None:
+            uploads.append(upload)
+        return result
 
     @staticmethod
     def ie_sanitize(filename):
@@ -322,197 +345,300 @@ class MultiPartParser:
         return filename and filename[filename.rfind('\\') + 1:].strip()
 
 
-class LazyStream(Iterator):
+class Base64Decoder:
     """
-    The LazyStream wrapper allows one to get and "unget" bytes from a stream.
+    Incremental decoder of base64 data.
 
-    Given a producer object (an iterator that yields bytestrings), the
-    LazyStream object will support iteration, reading, and keeping a "look-back"
-    variable in case you need to "unget" some bytes.
+    Whitespace is ignored. Characters that don't make a whole quantum of
+    four are carried over to the next chunk.
     """
-    def __init__(self, producer, length=None):
-        """
-        Every LazyStream must have a producer when instantiated.
-
-        A producer is an iterable that returns a string each time it
-        is called.
-        """
-        self._producer = producer
-        self._empty = False
-        self._leftover = b''
-        self.length = length
-        self.position = 0
-        self._remaining = length
 
-    def tell(self):
-        return self.position
+    __slots__ = ('_carry', '_lines')
 
-    def read(self, size=None):
-        def parts():
-            remaining = self._remaining if size is None else size
-            # do the whole thing in one shot if no limit was provided.
-            if remaining is None:
-                yield b''.join(self)
-                return
-
-            # otherwise do some bookkeeping to return exactly enough
-            # of the stream and stashing any extra content we get from
-            # the producer
-            while remaining != 0:
-                assert remaining > 0, 'remaining bytes to read should never go negative'
+    def __init__(self):
+        self._carry = b''
+        # Lines of base64 data are usually a multiple of 4 characters long
+        self._lines = True
 
+    @staticmethod
+    def _decode(data):
+        try:
+            return binascii.a2b_base64(data)
+        except (binascii.Error, ValueError) as e:
+            # Since this is only a chunk, any error is an unfixable error
+            raise MultiPartParserError("Could not decode base64 data: %s" % e) from e
+
+    def decode(self, chunk):
+        """Decodes the chunk, keeping the incomplete quantum at its end"""
+        data = bytearray(self._carry)
+        data += chunk
+
+        if self._lines:
+            # Whitespace is skipped by the decoder, so whole lines
+            # are decoded without being stripped
+            end = data.rfind(b'\n') + 1
+            if end and data.find(b'=', 0, end) == -1:
                 try:
-                    chunk = next(self)
-                except StopIteration:
-                    return
+                    result = binascii.a2b_base64(memoryview(data)[:end])
+                except binascii.Error:
+                    self._lines = False
                 else:
-                    emitting = chunk[:remaining]
-                    self.unget(chunk[remaining:])
-                    remaining -= len(emitting)
-                    yield emitting
+                    self._carry = bytes(data[end:])
+                    return result
 
-        out = b''.join(parts())
-        return out
+        data = data.translate(None, _BASE64_WHITESPACE)
+        aligned = len(data) - len(data) % 4
+        self._carry = bytes(data[aligned:])
+        if not aligned:
+            return b''
+        return self._decode(memoryview(data)[:aligned])
 
-    def __next__(self):
-        """
-        Used when the exact number of bytes to read is unimportant.
+    def finish(self):
+        """Decodes the rest of data"""
+        carry, self._carry = self._carry.translate(None, _BASE64_WHITESPACE), b''
+        if not carry:
+            return b''
+        return self._decode(carry)
 
-        This procedure just returns whatever is chunk is conveniently returned
-        from the iterator instead. Useful to avoid unnecessary bookkeeping if
-        performance is an issue.
-        """
-        if self._leftover:
-            output = self._leftover
-            self._leftover = b''
-        else:
-            output = next(self._producer)
-        self.position += len(output)
-        return output
 
-    def close(self):
-        """
-        Used to invalidate/disable this lazy stream.
+class MultipartReader:
+    """
+    Reads parts of multipart data from a stream.
 
-        Replaces the producer with an empty list. Any leftover bytes that have
-        already been read will still be reported upon read() and/or next().
-        """
-        self._producer = []
+    Data are read into a ``bytearray`` buffer of fixed capacity and are
+    handed out as ``memoryview`` slices of it, so the payload of parts is
+    copied only when it's read from the stream. Delimiters and headers are
+    searched right in the buffer. Unread data are moved to the beginning of
+    the buffer when there is no room for one more chunk at its end, i.e.
+    once per few chunks. Unless a header is being read, those are only a few
+    bytes that may belong to a delimiter.
 
-    def __iter__(self):
-        return self
+    Iterating over the reader positions it at the beginning of each part.
 
-    def unget(self, chunk):
-        """
-        Places bytes back onto the front of the lazy stream.
+    :param stream: the raw post data, as a file-like object
+    :param boundary: boundary of parts
+    :param chunk_size: the number of bytes that will be read at a time
+    """
 
-        Future calls to read() will return those bytes first. The
-        stream position and thus tell() will be rewound.
-        """
-        if not chunk:
-            return
-        self.position -= len(chunk)
-        self._leftover = b''.join([chunk, self._leftover])
+    __slots__ = (
+        '_stream',
+        '_readinto',
+        '_delimiter',
+        '_chunk_size',
+        '_buffer',
+        '_view',
+        '_start',
+        '_end',
+        '_eof',
+    )
+
+    def __init__(self, stream, boundary, chunk_size=64 * 1024):
+        self._stream = stream
+        self._readinto = getattr(stream, 'readinto', None)
+        self._delimiter = b'--' + boundary
+        self._chunk_size = chunk_size
+        self._buffer = bytearray(4 * chunk_size + len(self._delimiter))
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self._eof = False
+
+    def _compact(self):
+        """Moves unread data to the beginning of the buffer"""
+        start, end = self._start, self._end
+        if len(self._buffer) - (end - start) < self._chunk_size:
+            # Only a header may not fit. Views given out before
+            # keep the previous buffer alive
+            self._buffer = bytearray(2 * len(self._buffer))
+            self._buffer[:end - start] = self._view[start:end]
+            self._view = memoryview(self._buffer)
+        else:
+            # A copy is made, since unread data may overlap its destination
+            self._buffer[:end - start] = bytes(self._view[start:end])
+        self._start, self._end = 0, end - start
+
+    def _fill(self):
+        """Reads the next chunk into the buffer. Returns False at the end of the stream"""
+        if self._eof:
+            return False
+
+        size = self._chunk_size
+        if self._end + size > len(self._buffer):
+            self._compact()
+
+        end = self._end
+        if self._readinto is not None:
+            count = self._readinto(self._view[end:end + size])
+        else:
+            chunk = self._stream.read(size)
+            count = len(chunk)
+            self._view[end:end + count] = chunk
+
+        if not count:
+            self._eof = True
+            return False
+
+        self._end = end + count
+        return True
+
+    def _strip(self, start, index):
+        """Backs up over CRLF before the delimiter at the index"""
+        buffer = self._buffer
+        if index > start and buffer[index - 1] == 0x0a:  # \n
+            index -= 1
+        if index > start and buffer[index - 1] == 0x0d:  # \r
+            index -= 1
+        return index
 
+    def __iter__(self):
+        try:
+            more = self._next_part()
+        except MultiPartParserError as e:
+            raise MultiPartParserError("Expected boundary at start of multipart data") from e
 
-def chunk_iter(flo, chunk_size=64 * 1024):
-    """An iterable that will yield chunks of data."""
-    while True:
-        chunk = flo.read(chunk_size)
+        while more:
+            yield self
+            more = self._next_part()
 
-        if not chunk:
-            break
-
-        yield chunk
+    def _next_part(self):
+        """
+        Skips the rest of the current part and the following delimiter.
 
+        Returns False if the delimiter is the closing one.
+        """
+        for _ in self.iter_chunks():
+            pass
+
+        delimiter_length = len(self._delimiter)
+        while self._end - self._start < delimiter_length + 2:
+            if not self._fill():
+                raise MultiPartParserError("Unexpected end of multipart data")
+
+        index = self._start + delimiter_length
+        suffix = self._buffer[index:index + 2]
+        if suffix == b'--':
+            self._start = self._end
+            return False
+
+        self._start = index + 2 if suffix == b'\r\n' else index
+        if self._start == self._end and not self._fill():
+            raise MultiPartParserError("Unexpected end of multipart data")
 
-def part_iter(stream, boundary):
-    """
-    A Producer that will iterate over boundaries.
-    """
-    delimiter = b'--' + boundary
-    delimiter_length = len(delimiter)
+        return True
 
-    while True:
-        # Check that the stream is already exhausted
-        unused_char = stream.read(1)
+    def read_header(self):
+        """
+        Reads the header of the current part up to the blank line.
 
-        if not unused_char:
-            raise MultiPartParserError("Unexpected end of multipart data")
+        Returns None if the part has no blank line.
+        """
+        delimiter = self._delimiter
+        scanned = 0
+        while True:
+            buffer, start, end = self._buffer, self._start, self._end
+            limit = buffer.find(delimiter, start + max(0, scanned - len(delimiter) + 1), end)
+            index = buffer.find(b'\r\n\r\n', start + max(0, scanned - 3), end if limit < 0 else limit)
+            if index >= 0:
+                self._start = index + 4
+                return bytes(buffer[start:index])
+
+            if limit >= 0:
+                return None
+
+            scanned = end - start
+            if not self._fill():
+                raise MultiPartParserError("Unexpected end of part")
 
-        stream.unget(unused_char)
+    def iter_chunks(self):
+        """
+        Yields data of the current part as ``memoryview`` slices of the buffer.
 
-        part = LazyStream(boundary_iter(stream, delimiter))
+        A slice is valid until the next one is requested.
+        """
+        delimiter = self._delimiter
+        # A part of the delimiter and CRLF before it are kept in the buffer
+        reserve = len(delimiter) + 1
+        while True:
+            start, end = self._start, self._end
+            index = self._buffer.find(delimiter, start, end)
+            if index >= 0:
+                self._start = index
+                stop = self._strip(start, index)
+                if stop > start:
+                    yield self._view[start:stop]
+                return
 
-        try:
-            yield part
-        finally:
-            exhaust(part)
+            stop = end - reserve
+            if stop > start:
+                self._start = stop
+                yield self._view[start:stop]
 
-        data = stream.read(delimiter_length + 2)
+            if not self._fill():
+                raise MultiPartParserError("Unexpected end of part")
 
-        if data[-2:] == b'--':
-            exhaust(stream)
-            break
+    def read(self, size=None):
+        """
+        Reads at most ``size`` bytes of data of the current part.
 
-        if data[-2:] != b'\r\n':
-            stream.unget(data[-2:])
+        The rest of the part is skipped.
+        """
+        chunks = []
+        remaining = size
+        for chunk in self.iter_chunks():
+            if remaining is None:
+                chunks.append(bytes(chunk))
+            elif remaining > 0:
+                chunks.append(bytes(chunk[:remaining]))
+                remaining -= len(chunks[-1])
+        return b''.join(chunks)
 
 
-def boundary_iter(stream, delimiter):
+class PartStream(io.RawIOBase):
     """
-    A Producer that is sensitive to boundaries.
+    Reads data of a part right from the request.
 
-    Will happily yield bytes until a boundary is found. Will yield
-    the bytes before the boundary and push the boundary and the
-    post-boundary bytes back on the stream.
+    :param chunks: an iterator of data chunks of the part
+    """
 
-    The future calls to next() after locating the boundary will raise a
-    `StopIteration` exception.
+    def __init__(self, chunks):
+        super(PartStream, self).__init__()
+        self._chunks = chunks
+        self._chunk = memoryview(b'')
 
-    Raises `MultiPartParserError` if unexpected end of part will found.
-    """
-    delimiter_length = len(delimiter)
+    def readable(self):
+        return True
 
-    while True:
-        bytes_read = 0
-        chunks = []
-        for chunk in stream:
-            if not chunk:
-                break
+    def readinto(self, buffer):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
 
-            bytes_read += len(chunk)
-            chunks.append(chunk)
+        while not self._chunk:
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
 
-            if bytes_read > delimiter_length:
-                break
+        size = min(len(buffer), len(self._chunk))
+        memoryview(buffer).cast('B')[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
 
-        data = b''.join(chunks)
+    def close(self):
+        self._chunks = iter(())
+        self._chunk = memoryview(b'')
+        super(PartStream, self).close()
 
-        # Find a parts delimiter in data
-        index = data.find(delimiter)
-        if index < 0:
-            output = data[:-delimiter_length]
-            if not output:
-                raise MultiPartParserError("Unexpected end of part")
-            else:
-                # Make sure we don't treat a partial delimiter as data
-                stream.unget(data[-delimiter_length:])
-                yield output
-        else:
-            stream.unget(data[index:])
 
-            # Backup over CRLF
-            last = max(0, index - 1)
-            if data[last:last + 1] == b'\n':
-                index -= 1
-            last = max(0, index - 1)
-            if data[last:last + 1] == b'\r':
-                index -= 1
+def chunk_iter(flo, chunk_size=64 * 1024):
+    """An iterable that will yield chunks of data."""
+    while True:
+        chunk = flo.read(chunk_size)
 
-            yield data[:index]
+        if not chunk:
             break
 
+        yield chunk
+
 
 def exhaust(stream, chunk_size=16 * 1024):
     """Exhaust a stream."""
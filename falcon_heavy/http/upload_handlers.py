@@ -0,0 +1,387 @@
+# Copyright 2019-2020 Not Just A Toy Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import hashlib
+import tempfile
+import threading
+import typing as ty
+
+from .datastructures import FileStorage
+
+__all__ = (
+    'MemoryBudgetStats',
+    'MemoryBudget',
+    'AbstractUpload',
+    'AbstractUploadHandler',
+    'FileUpload',
+    'TemporaryFileUploadHandler',
+    'LocalFileUploadHandler',
+    'StreamUploadHandler',
+    'HashingUploadHandler',
+)
+
+Headers = ty.MutableMapping[str, str]
+
+
+class MemoryBudgetStats(ty.NamedTuple):
+    limit: int
+    used: int  # bytes of uploads kept in memory
+    peak: int
+    spills: int  # number of uploads moved to disk
+
+
+class MemoryBudget:
+
+    """Memory shared by uploads kept in memory
+
+    A budget may be a part of another one, e.g. a budget of a request may be
+    a part of a budget of the process. Memory is reserved in both then.
+    Budgets are thread-safe.
+
+    :param limit: maximum size in bytes of uploads kept in memory
+    :param parent: budget that this one is a part of
+    """
+
+    __slots__ = (
+        'limit',
+        'parent',
+        '_lock',
+        '_used',
+        '_peak',
+        '_spills'
+    )
+
+    def __init__(self, limit: int, parent: ty.Optional['MemoryBudget'] = None) -> None:
+        self.limit = limit
+        self.parent = parent
+        self._lock = threading.Lock()
+        self._used = 0
+        self._peak = 0
+        self._spills = 0
+
+    def reserve(self, size: int) -> bool:
+        """Reserves memory if the budget and its parents allow"""
+        with self._lock:
+            if self._used + size > self.limit:
+                return False
+
+            if self.parent is not None and not self.parent.reserve(size):
+                return False
+
+            self._used += size
+            self._peak = max(self._peak, self._used)
+            return True
+
+    def release(self, size: int) -> None:
+        with self._lock:
+            self._used -= size
+
+        if self.parent is not None:
+            self.parent.release(size)
+
+    def record_spill(self) -> None:
+        with self._lock:
+            self._spills += 1
+
+        if self.parent is not None:
+            self.parent.record_spill()
+
+    def stats(self) -> MemoryBudgetStats:
+        with self._lock:
+            return MemoryBudgetStats(limit=self.limit, used=self._used, peak=self._peak, spills=self._spills)
+
+
+class AbstractUpload:
+
+    """Receives data of an uploaded file as it's read from the request"""
+
+    __slots__ = ()
+
+    def write(self, chunk: ty.Union[bytes, memoryview]) -> None:
+        """Receives the next chunk of data. A ``memoryview`` chunk is valid only during the call"""
+        raise NotImplementedError()
+
+    def complete(self) -> FileStorage:
+        """Returns the storage of the file once all data are received"""
+        raise NotImplementedError()
+
+    def abort(self) -> None:
+        """Releases resources of the upload if the request can't be parsed"""
+
+
+class AbstractUploadHandler:
+
+    """Makes uploads for file parts of multipart requests"""
+
+    def new_request(self) -> 'AbstractUploadHandler':
+        """Returns the handler of uploads of a single request"""
+        return self
+
+    def new_upload(self, field_name: str, filename: str, headers: Headers) -> AbstractUpload:
+        raise NotImplementedError()
+
+
+class FileUpload(AbstractUpload):
+
+    """Writes data of the uploaded file to a file-like object
+
+    The object becomes the stream of the file storage. It's rewound if it's seekable.
+
+    :param file: a writable file-like object
+    :param filename: name of the uploaded file
+    :param headers: headers of the part
+    """
+
+    __slots__ = ('file', 'filename', 'headers')
+
+    def __init__(self, file: ty.Any, filename: str, headers: Headers) -> None:
+        self.file = file
+        self.filename = filename
+        self.headers = headers
+
+    def write(self, chunk: ty.Union[bytes, memoryview]) -> None:
+        self.file.write(chunk)
+
+    def complete(self) -> FileStorage:
+        flush = getattr(self.file, 'flush', None)
+        if flush is not None:
+            flush()
+
+        # Spooled temporary files have no `seekable` before Python 3.11
+        seek = getattr(self.file, 'seek', None)
+        if seek is not None:
+            try:
+                seek(0)
+            except (OSError, ValueError):
+                # Not seekable
+                pass
+
+        return FileStorage(stream=self.file, filename=self.filename, headers=self.headers)
+
+    def abort(self) -> None:
+        close = getattr(self.file, 'close', None)
+        if close is not None:
+            close()
+
+
+class _BudgetedBytesIO(io.BytesIO):
+
+    def __init__(self, budget: MemoryBudget) -> None:
+        super(_BudgetedBytesIO, self).__init__()
+        self.budget = budget
+        self.reserved = 0
+
+    def close(self) -> None:
+        reserved, self.reserved = self.reserved, 0
+        if reserved:
+            self.budget.release(reserved)
+        super(_BudgetedBytesIO, self).close()
+
+
+class _BudgetedUpload(FileUpload):
+
+    __slots__ = ('budget', 'max_memory_size', 'temp_dir')
+
+    def __init__(
+            self,
+            budget: MemoryBudget,
+            max_memory_size: int,
+            temp_dir: ty.Optional[str],
+            filename: str,
+            headers: Headers
+    ) -> None:
+        super(_BudgetedUpload, self).__init__(_BudgetedBytesIO(budget), filename, headers)
+        self.budget = budget
+        self.max_memory_size = max_memory_size
+        self.temp_dir = temp_dir
+
+    def _spill(self) -> None:
+        file = tempfile.TemporaryFile(mode='w+b', suffix='.upload', dir=self.temp_dir)
+        with self.file.getbuffer() as data:
+            file.write(data)
+        self.file.close()
+        self.file = file
+        self.budget.record_spill()
+
+    def write(self, chunk: ty.Union[bytes, memoryview]) -> None:
+        file = self.file
+        if isinstance(file, _BudgetedBytesIO):
+            size = len(chunk)
+            if file.reserved + size <= self.max_memory_size and self.budget.reserve(size):
+                file.reserved += size
+            else:
+                self._spill()
+
+        self.file.write(chunk)
+
+
+class TemporaryFileUploadHandler(AbstractUploadHandler):
+
+    """Keeps uploaded files in memory until they get too big, and in temporary files then
+
+    Memory of files may be limited across all parts of a request and across
+    requests by a shared budget. A file that doesn't fit into the budget is moved
+    to a temporary file. Memory is returned to the budget when the storage of
+    the file is closed or garbage collected.
+
+    :param max_memory_size: maximum size in bytes of a file kept in memory
+    :param temp_dir: directory of temporary files. If `None` then used the operating
+        system's default temporary directory
+    :param budget: memory budget shared by requests, e.g. of the process
+    :param max_request_memory_size: maximum size in bytes of files of a request kept in memory
+    """
+
+    def __init__(
+            self,
+            max_memory_size: int = 2621440,
+            temp_dir: ty.Optional[str] = None,
+            budget: ty.Optional[MemoryBudget] = None,
+            max_request_memory_size: ty.Optional[int] = None
+    ) -> None:
+        self.max_memory_size = max_memory_size
+        self.temp_dir = temp_dir
+        self.budget = budget
+        self.max_request_memory_size = max_request_memory_size
+
+    def new_request(self) -> AbstractUploadHandler:
+        if self.max_request_memory_size is None:
+            return self
+
+        return TemporaryFileUploadHandler(
+            max_memory_size=self.max_memory_size,
+            temp_dir=self.temp_dir,
+            budget=MemoryBudget(self.max_request_memory_size, parent=self.budget)
+        )
+
+    def new_upload(self, field_name: str, filename: str, headers: Headers) -> AbstractUpload:
+        if self.budget is not None:
+            return _BudgetedUpload(self.budget, self.max_memory_size, self.temp_dir, filename, headers)
+
+        return FileUpload(tempfile.SpooledTemporaryFile(
+            max_size=self.max_memory_size,
+            suffix='.upload',
+            mode='wb+',
+            dir=self.temp_dir
+        ), filename, headers)
+
+
+class _LocalFileUpload(FileUpload):
+
+    __slots__ = ()
+
+    def abort(self) -> None:
+        super(_LocalFileUpload, self).abort()
+        try:
+            os.unlink(self.file.name)
+        except OSError:
+            pass
+
+
+class LocalFileUploadHandler(AbstractUploadHandler):
+
+    """Writes uploaded files to the directory
+
+    Files get unique names and are kept after the request. The path of a file
+    is the ``name`` of the storage stream.
+
+    :param directory: directory of uploaded files
+    :param suffix: suffix of names of uploaded files
+    """
+
+    def __init__(self, directory: str, suffix: str = '.upload') -> None:
+        self.directory = directory
+        self.suffix = suffix
+
+    def new_upload(self, field_name: str, filename: str, headers: Headers) -> AbstractUpload:
+        return _LocalFileUpload(tempfile.NamedTemporaryFile(
+            mode='wb+',
+            suffix=self.suffix,
+            dir=self.directory,
+            delete=False
+        ), filename, headers)
+
+
+class StreamUploadHandler(AbstractUploadHandler):
+
+    """Writes uploaded files to objects made by the function
+
+    Data are written as they arrive, so the object may send them further in
+    chunks, e.g. to an object storage.
+
+    :param open_func: function that takes field name, file name and headers
+        of the part and returns a writable file-like object
+    """
+
+    def __init__(self, open_func: ty.Callable[[str, str, Headers], ty.Any]) -> None:
+        self.open_func = open_func
+
+    def new_upload(self, field_name: str, filename: str, headers: Headers) -> AbstractUpload:
+        return FileUpload(self.open_func(field_name, filename, headers), filename, headers)
+
+
+class _HashingUpload(AbstractUpload):
+
+    __slots__ = ('upload', 'hashes')
+
+    def __init__(self, upload: AbstractUpload, algorithms: ty.Iterable[str]) -> None:
+        self.upload = upload
+        self.hashes = [(algorithm, hashlib.new(algorithm)) for algorithm in algorithms]
+
+    def write(self, chunk: ty.Union[bytes, memoryview]) -> None:
+        for _, hash_ in self.hashes:
+            hash_.update(chunk)
+        self.upload.write(chunk)
+
+    def complete(self) -> FileStorage:
+        result = self.upload.complete()
+        for algorithm, hash_ in self.hashes:
+            result.checksums[algorithm] = hash_.hexdigest()
+        return result
+
+    def abort(self) -> None:
+        self.upload.abort()
+
+
+class HashingUploadHandler(AbstractUploadHandler):
+
+    """Computes checksums of uploaded files while they are written by another handler
+
+    Checksums are put into ``checksums`` of the file storage by names of algorithms.
+
+    :param handler: handler that stores files. Defaults to :class:`TemporaryFileUploadHandler`
+    :param algorithms: names of algorithms supported by :mod:`hashlib`
+    """
+
+    def __init__(
+            self,
+            handler: ty.Optional[AbstractUploadHandler] = None,
+            algorithms: ty.Iterable[str] = ('sha256', )
+    ) -> None:
+        self.handler = handler or TemporaryFileUploadHandler()
+        self.algorithms = tuple(algorithms)
+        for algorithm in self.algorithms:
+            # Fails early on unknown algorithms
+            hashlib.new(algorithm)
+
+    def new_request(self) -> AbstractUploadHandler:
+        handler = self.handler.new_request()
+        if handler is self.handler:
+            return self
+
+        return HashingUploadHandler(handler, self.algorithms)
+
+    def new_upload(self, field_name: str, filename: str, headers: Headers) -> AbstractUpload:
+        return _HashingUpload(self.handler.new_upload(field_name, filename, headers), self.algorithms)
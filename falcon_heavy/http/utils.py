@@ -23,6 +23,7 @@ from .exceptions import TooManyFieldsSent
 
 __all__ = (
     'limited_parse_qsl',
+    'parse_form',
     'parse_header',
     'ContentTypeLikeHeader',
     'parse_options_header',
@@ -77,6 +78,67 @@ def limited_parse_qsl(qs, keep_blank_values=False, encoding='utf-8',
     return r
 
 
+def parse_form(qs, encoding='utf-8', errors='replace', fields_limit=None):
+    """
+    Return a dict of fields parsed from urlencoded form data.
+
+    Parses like `limited_parse_qsl` with kept blank values, but the result is
+    built in a single pass. The value of a repeated field is the list of its values.
+    Fields are decoded only if they contain escapes.
+
+    :param qs: percent-encoded form data to be parsed
+    :param encoding: specify how to decode percent-encoded sequences
+        into Unicode characters, as accepted by the bytes.decode() method
+    :param errors: may be given to set the desired error handling scheme
+    :param fields_limit: maximum number of fields parsed or an exception
+        is raised. None means no limit and is the default
+    """
+    # Fields are found one by one, so the limit stops parsing early
+    separators = None
+    if ';' in qs:
+        separators = (match.start() for match in FIELDS_MATCH.finditer(qs))
+
+    result = {}
+    count = 0
+    start = 0
+    length = len(qs)
+    while True:
+        if separators is None:
+            end = qs.find('&', start)
+        else:
+            end = next(separators, -1)
+        if end == -1:
+            end = length
+
+        count += 1
+        if fields_limit and count > fields_limit:
+            raise TooManyFieldsSent("Too many GET/POST parameters")
+
+        if end != start:
+            name, _, value = qs[start:end].partition('=')
+            if '+' in name:
+                name = name.replace('+', ' ')
+            if '%' in name:
+                name = unquote(name, encoding=encoding, errors=errors)
+            if '+' in value:
+                value = value.replace('+', ' ')
+            if '%' in value:
+                value = unquote(value, encoding=encoding, errors=errors)
+
+            existing = result.get(name)
+            if existing is None:
+                result[name] = value
+            elif existing.__class__ is list:
+                existing.append(value)
+            else:
+                result[name] = [existing, value]
+
+        if end == length:
+            return result
+
+        start = end + 1
+
+
 def parse_header(line):
     """
     Parse the header into a name-value.
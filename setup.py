@@ -46,6 +46,11 @@ setuptools.setup(
             'Flask>=1.1.0',
         ],
     },
+    entry_points={
+        'console_scripts': [
+            'falcon-heavy=falcon_heavy.__main__:main',
+        ],
+    },
     tests_require=[
         'pytest>=3.1.1,<4',
         'pytest-cov>=2.3.1',
@@ -5,13 +5,18 @@ import unittest
 
 import falcon
 
+from falcon_heavy.core import types as t
+from falcon_heavy.core.factories.media_type import PartChecker
 from falcon_heavy.contrib.operations import OpenAPIOperations
 from falcon_heavy.contrib.parsers import MultiPartParser
 from falcon_heavy.contrib.renderers import TextRenderer, JSONRenderer
+from falcon_heavy.contrib.responses import OpenAPIMultiPartResponse
 from falcon_heavy.contrib.falcon.testing import create_client, make_resource_class, FalconDummyOpenAPIDecorator
 
 from falcon_heavy.http.testing import encode_multipart
 from falcon_heavy.http.datastructures import FormStorage, FileStorage
+from falcon_heavy.http.multipart_parser import MultiPartParser as HttpMultiPartParser
+from falcon_heavy.http.upload_handlers import StreamUploadHandler
 
 
 class MultipartTest(unittest.TestCase):
@@ -51,5 +56,227 @@ class MultipartTest(unittest.TestCase):
         self.assertEqual(resp.status, falcon.HTTP_400)
 
 
+class EarlyRejectionTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.uploads = []
+        cls.errors = []
+
+        def open_func(field_name, filename, headers):
+            cls.uploads.append(io.BytesIO())
+            return cls.uploads[-1]
+
+        class Decorator(FalconDummyOpenAPIDecorator):
+
+            def _handle_invalid_request(self, request, operation, instance, exception):
+                cls.errors.append(exception)
+                return super(Decorator, self)._handle_invalid_request(request, operation, instance, exception)
+
+        operations = OpenAPIOperations.from_file(
+            os.path.join(os.path.dirname(__file__), 'petstore/schema/petstore.yaml'))
+        resource_class = make_resource_class(Decorator(
+            operations,
+            parsers=(MultiPartParser(upload_handler=StreamUploadHandler(open_func)),),
+            renderers=(TextRenderer(), JSONRenderer())
+        ))
+        cls.client = create_client('/test-multipart', resource_class())
+
+    def setUp(self):
+        del self.uploads[:]
+        del self.errors[:]
+
+    def _post(self, parts):
+        body, headers = encode_multipart(parts)
+        return self.client.simulate_post('/test-multipart', body=body, headers=headers)
+
+    def _photo(self, content_type='image/png'):
+        return FileStorage(
+            stream=io.BytesIO(b'photo'),
+            filename='cam.jpg',
+            content_type=content_type,
+            headers={'X-Rate-Limit-Limit': '1'}
+        )
+
+    def test_not_allowed_content_type(self):
+        resp = self._post((
+            ('id', FormStorage('1')),
+            ('photo', self._photo(content_type='text/plain')),
+        ))
+        self.assertEqual(falcon.HTTP_400, resp.status)
+        self.assertEqual([], self.uploads)
+
+    def test_unknown_field(self):
+        resp = self._post((
+            ('unknown', FormStorage('1')),
+            ('photo', self._photo()),
+        ))
+        self.assertEqual(falcon.HTTP_400, resp.status)
+        self.assertEqual([], self.uploads)
+
+    def test_repeated_field(self):
+        resp = self._post((
+            ('meta', FormStorage(json.dumps({'name': 'Max'}), content_type='application/json')),
+            ('photo', self._photo()),
+            ('photo', self._photo()),
+        ))
+        self.assertEqual(falcon.HTTP_400, resp.status)
+        self.assertEqual(1, len(self.uploads))
+        self.assertEqual(
+            [('#/content/photo', PartChecker.MESSAGES['repeated'])],
+            [(str(error.path), error.message) for error in self.errors[0].errors]
+        )
+
+    def test_valid(self):
+        resp = self._post((
+            ('id', FormStorage('1')),
+            ('meta', FormStorage(json.dumps({'name': 'Max'}), content_type='application/json')),
+            ('photo', self._photo()),
+        ))
+        self.assertEqual(falcon.HTTP_200, resp.status)
+        self.assertEqual(b'photo', self.uploads[0].getvalue())
+
+
+class LazyMultipartTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        operations = OpenAPIOperations.from_file(
+            os.path.join(os.path.dirname(__file__), 'petstore/schema/petstore.yaml'))
+        resource_class = make_resource_class(FalconDummyOpenAPIDecorator(
+            operations, parsers=(MultiPartParser(lazy=True),), renderers=(TextRenderer(), JSONRenderer())))
+        cls.client = create_client('/test-multipart', resource_class())
+
+    def _post(self, parts):
+        body, headers = encode_multipart(parts)
+        resp = self.client.simulate_post('/test-multipart', body=body, headers=headers)
+        self.assertEqual(falcon.HTTP_200, resp.status)
+        return self.client.resource.captured_request.content
+
+    def test_multipart(self):
+        content = self._post((
+            ('id', FormStorage('1')),
+            ('meta', FormStorage(json.dumps({'name': 'Max'}), content_type='application/json')),
+            ('artist', FormStorage(json.dumps({'name': 'Jared Leto'}), content_type='application/json')),
+            ('artist', FormStorage(json.dumps({'name': 'Jared Leto'}), content_type='application/json')),
+            ('photo', FileStorage(
+                stream=io.StringIO(r'photo\t\n\dummy\r\n'),
+                filename='cam.jpg',
+                content_type='image/png',
+                headers={'X-Rate-Limit-Limit': '1'}
+            ))
+        ))
+
+        parts = []
+        for name, part in content:
+            if name == 'photo':
+                self.assertEqual(r'photo\t\n\dummy\r\n'.encode(), part.content.read())
+            parts.append((name, part))
+
+        self.assertEqual(['id', 'meta', 'artist', 'artist', 'photo'], [name for name, _ in parts])
+        self.assertEqual(1, parts[0][1].content)
+        self.assertEqual('Max', parts[1][1].content['name'])
+        self.assertEqual(u'cam.jpg', parts[4][1].storage.filename)
+
+    def test_early_errors(self):
+        content = self._post((
+            ('id', FormStorage('1')),
+            ('unknown', FormStorage('1')),
+        ))
+
+        self.assertEqual('id', next(content)[0])
+        with self.assertRaises(t.SchemaError):
+            next(content)
+
+        content = self._post((
+            ('id', FormStorage('1')),
+        ))
+
+        self.assertEqual('id', next(content)[0])
+        with self.assertRaises(t.SchemaError) as ctx:
+            next(content)
+        self.assertIn("'meta', 'photo'", ctx.exception.errors[0].message)
+
+
+class MultipartResponseTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        operations = OpenAPIOperations.from_file(
+            os.path.join(os.path.dirname(__file__), 'petstore/schema/petstore.yaml'))
+        decorator = FalconDummyOpenAPIDecorator(operations, renderers=(TextRenderer(), JSONRenderer()))
+
+        class Resource:
+
+            parts = None
+
+            @decorator
+            def on_get(self, request):
+                return OpenAPIMultiPartResponse(self.parts, boundary='foo')
+
+        cls.client = create_client('/test-multipart', Resource())
+        cls.operation = operations.find('/test-multipart', 'GET')
+
+    def _get(self, parts):
+        self.client.resource.parts = parts
+        return self.client.simulate_get('/test-multipart')
+
+    def test_multipart(self):
+        resp = self._get((
+            ('id', 1),
+            ('meta', {'name': 'Max'}),
+            ('artist', {'name': 'Jared Leto'}),
+            ('photo', io.BytesIO(b'photo')),
+        ))
+        self.assertEqual(falcon.HTTP_200, resp.status)
+        self.assertEqual('multipart/form-data; boundary=foo', resp.headers['content-type'])
+        self.assertEqual(str(len(resp.content)), resp.headers['content-length'])
+
+        form, files = HttpMultiPartParser(
+            io.BytesIO(resp.content), resp.headers['content-type'], len(resp.content)).parse()
+        self.assertEqual('1', form['id'].value)
+        self.assertEqual('application/json', form['meta'].content_type)
+        self.assertEqual({'name': 'Max'}, json.loads(form['meta'].value))
+        self.assertEqual('image/png', form['photo'].content_type)
+        self.assertEqual('photo', form['photo'].value)
+
+    def test_encoding_headers(self):
+        resp = self._get((
+            ('id', 1),
+            ('photo', FileStorage(io.BytesIO(b'photo'), headers={'X-Rate-Limit-Limit': 5})),
+        ))
+        self.assertEqual(falcon.HTTP_200, resp.status)
+
+        form, files = HttpMultiPartParser(
+            io.BytesIO(resp.content), resp.headers['content-type'], len(resp.content)).parse()
+        self.assertEqual('5', form['photo'].headers['x-rate-limit-limit'])
+
+        resp = self._get((
+            ('id', 1),
+            ('photo', FileStorage(io.BytesIO(b'photo'), headers={'X-Rate-Limit-Limit': 'many'})),
+        ))
+        self.assertEqual(falcon.HTTP_500, resp.status)
+
+    def test_invalid(self):
+        for parts in (
+            (('photo', b'photo'), ),
+            (('id', 'one'), ('photo', b'photo')),
+            (('id', 1), ('id', 2), ('photo', b'photo')),
+            (('id', 1), ('unknown', 1), ('photo', b'photo')),
+            (('id', 1), ('artist', {}), ('artist', {}), ('artist', {}), ('photo', b'photo')),
+        ):
+            resp = self._get(parts)
+            self.assertEqual(falcon.HTTP_500, resp.status)
+
+    def test_mapping(self):
+        # Mappings are rendered by renderers of the application
+        response = self.operation.response_converter.convert(
+            200, {}, {'id': 1, 'photo': io.BytesIO(b'photo')}, 'multipart/form-data')
+        self.assertEqual(1, response.content['id'])
+
+        with self.assertRaises(t.SchemaError):
+            self.operation.response_converter.convert(200, {}, {'id': 1}, 'multipart/form-data')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -58,6 +58,8 @@ class PetstoreTest(testing.TestCase):
         resp = self.simulate_post('/test-urlencoded', body=body, headers=headers)
         self.assertEqual(resp.status, falcon.HTTP_200)
         self.assertEqual([45, u'adobe_русский.pdf 45'], resp.json)
+        # Rendered bytes are sent as they are
+        self.assertEqual(str(len(resp.content)), resp.headers['content-length'])
 
     def test_styles(self):
         resp = self.simulate_get('/test-styles-array', query_string='x=1,2,3')
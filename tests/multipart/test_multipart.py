@@ -1,9 +1,27 @@
+import io
+import os
+import re
+import base64
+import shutil
+import decimal
+import hashlib
+import tempfile
 import unittest
 from os.path import join, dirname
 from io import BytesIO
 from urllib.parse import quote
 
+from falcon_heavy.core.encoders import get_json_backend
+from falcon_heavy.http.datastructures import FormStorage, FileStorage
 from falcon_heavy.http.multipart_parser import MultiPartParser, MultiPartParserError
+from falcon_heavy.http.multipart_encoder import MultiPartEncoder
+from falcon_heavy.http.upload_handlers import (
+    MemoryBudget,
+    TemporaryFileUploadHandler,
+    LocalFileUploadHandler,
+    StreamUploadHandler,
+    HashingUploadHandler
+)
 from falcon_heavy.http.exceptions import RequestDataTooBig, TooManyFieldsSent
 from falcon_heavy.http.utils import parse_options_header
 
@@ -221,6 +239,40 @@ class TestMultipartParser(unittest.TestCase):
 
         self.assertIn(u'Could not decode base64 data', str(ctx.exception))
 
+    def test_base64(self):
+        contents = bytes(range(256)) * 4
+        payload = (
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="text"\r\n'
+            b'Content-Transfer-Encoding: base64\r\n\r\n'
+            b'dmFs\r\ndWU=\r\n'
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="file"; filename="test.bin"\r\n'
+            b'Content-Transfer-Encoding: base64\r\n\r\n'
+            b'%s\r\n'
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="odd"; filename="odd.bin"\r\n'
+            b'Content-Transfer-Encoding: base64\r\n\r\n'
+            b'%s\r\n--foo--'
+        ) % (
+            base64.encodebytes(contents).replace(b'\n', b'\r\n'),
+            b' \r\n'.join(re.findall(b'.{1,7}', base64.b64encode(contents)))
+        )
+
+        for chunk_size in (4, 13, 64, 1024):
+            parser = MultiPartParser(
+                stream=BytesIO(payload),
+                content_type='multipart/form-data; boundary=foo',
+                content_length=len(payload),
+                chunk_size=chunk_size
+            )
+
+            form, files = parser.parse()
+
+            self.assertEqual('value', form['text'].value)
+            self.assertEqual(contents, files['file'].stream.read())
+            self.assertEqual(contents, files['odd'].stream.read())
+
     def test_file_no_content_type(self):
         payload = (
             b'--foo\r\n'
@@ -473,6 +525,292 @@ class TestMultipartParser(unittest.TestCase):
             self.assertLess(len(got.filename), 256,
                             "Got a long file name (%s characters)." % len(got.filename))
 
+    def test_chunk_size(self):
+        payload = (
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="text"\r\n\r\n'
+            b'a\r\n--fo\r\n'
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="file"; filename="%s.txt"\r\n'
+            b'Content-Type: text/plain\r\n\r\n'
+            b'file contents\r\n--foo--'
+        ) % (b'f' * 200)
+
+        for chunk_size in range(4, len(payload) + 4):
+            parser = MultiPartParser(
+                stream=BytesIO(payload),
+                content_type='multipart/form-data; boundary=foo',
+                content_length=len(payload),
+                chunk_size=chunk_size
+            )
+
+            form, files = parser.parse()
+
+            self.assertEqual('a\r\n--fo', form['text'].value)
+            self.assertEqual('f' * 200 + '.txt', files['file'].filename)
+            self.assertEqual(b'file contents', files['file'].stream.read())
+
+    def test_upload_handlers(self):
+        payload = (
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="file"; filename="test.txt"\r\n'
+            b'Content-Type: text/plain\r\n\r\n'
+            b'file contents\r\n--foo--'
+        )
+
+        def parse(upload_handler):
+            return MultiPartParser(
+                stream=BytesIO(payload),
+                content_type='multipart/form-data; boundary=foo',
+                content_length=len(payload),
+                upload_handler=upload_handler
+            ).parse()[1]['file']
+
+        directory = tempfile.mkdtemp()
+        try:
+            storage = parse(HashingUploadHandler(LocalFileUploadHandler(directory), algorithms=('md5', 'sha256')))
+            storage.stream.close()
+            self.assertEqual(hashlib.md5(b'file contents').hexdigest(), storage.checksums['md5'])
+            self.assertEqual(hashlib.sha256(b'file contents').hexdigest(), storage.checksums['sha256'])
+            self.assertEqual(os.path.dirname(storage.stream.name), directory)
+            self.assertEqual(b'file contents', get_contents(storage.stream.name))
+        finally:
+            for filename in os.listdir(directory):
+                os.unlink(os.path.join(directory, filename))
+            os.rmdir(directory)
+
+        opened = []
+
+        def open_func(field_name, filename, headers):
+            self.assertEqual(('file', 'test.txt', 'text/plain'), (field_name, filename, headers['content-type']))
+            opened.append(BytesIO())
+            return opened[-1]
+
+        storage = parse(StreamUploadHandler(open_func))
+        self.assertIs(opened[0], storage.stream)
+        self.assertEqual(b'file contents', storage.stream.getvalue())
+
+        with self.assertRaises(ValueError):
+            HashingUploadHandler(algorithms=('unknown', ))
+
+    def test_abort_completed_uploads(self):
+        payload = (
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="a"; filename="a.txt"\r\n\r\n'
+            b'a contents\r\n'
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="b"; filename="b.txt"\r\n\r\n'
+            b'b contents\r\n--foo--'
+        )
+
+        def part_checker(field_name, filename, headers):
+            if field_name == 'b':
+                raise ValueError()
+
+        directory = tempfile.mkdtemp()
+        try:
+            parser = MultiPartParser(
+                stream=BytesIO(payload),
+                content_type='multipart/form-data; boundary=foo',
+                content_length=len(payload),
+                upload_handler=LocalFileUploadHandler(directory),
+                part_checker=part_checker
+            )
+            with self.assertRaises(ValueError):
+                parser.parse()
+
+            self.assertEqual([], os.listdir(directory))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_memory_budget(self):
+        payload = b''.join(
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="file%d"; filename="test.txt"\r\n\r\n'
+            b'contents\r\n' % i for i in range(3)
+        ) + b'--foo--'
+
+        def parse(upload_handler):
+            return MultiPartParser(
+                stream=BytesIO(payload),
+                content_type='multipart/form-data; boundary=foo',
+                content_length=len(payload),
+                upload_handler=upload_handler
+            ).parse()[1]
+
+        budget = MemoryBudget(20)
+        files = parse(TemporaryFileUploadHandler(budget=budget, max_request_memory_size=15))
+        self.assertEqual((20, 8, 8, 2), budget.stats())
+        self.assertIsInstance(files['file0'].stream, BytesIO)
+        self.assertNotIsInstance(files['file1'].stream, BytesIO)
+        for name in ('file0', 'file1', 'file2'):
+            self.assertEqual(b'contents', files[name].stream.read())
+
+        # Memory of the process is shared by requests
+        handler = TemporaryFileUploadHandler(budget=budget)
+        other_files = parse(handler)
+        self.assertEqual((20, 16, 16, 4), budget.stats())
+        self.assertEqual(b'contents', other_files['file2'].stream.read())
+
+        files['file0'].close()
+        del other_files
+        self.assertEqual(0, budget.stats().used)
+
+    def test_part_checker(self):
+        payload = (
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="text"\r\n\r\n'
+            b'value\r\n'
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="file"; filename="test.txt"\r\n'
+            b'Content-Type: text/plain\r\n\r\n'
+            b'file contents\r\n--foo--'
+        )
+
+        checked = []
+        opened = []
+
+        def part_checker(field_name, filename, headers):
+            checked.append((field_name, filename))
+            if filename is not None:
+                raise ValueError()
+
+        def open_func(field_name, filename, headers):
+            opened.append(BytesIO())
+            return opened[-1]
+
+        parser = MultiPartParser(
+            stream=BytesIO(payload),
+            content_type='multipart/form-data; boundary=foo',
+            content_length=len(payload),
+            upload_handler=StreamUploadHandler(open_func),
+            part_checker=part_checker
+        )
+
+        with self.assertRaises(ValueError):
+            parser.parse()
+
+        self.assertEqual([('text', None), ('file', 'test.txt')], checked)
+        self.assertEqual([], opened)
+
+    def test_iter_parts(self):
+        payload = (
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="text"\r\n\r\n'
+            b'value\r\n'
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="file"; filename="test.txt"\r\n'
+            b'Content-Transfer-Encoding: base64\r\n\r\n'
+            b'ZmlsZSBjb250ZW50cw==\r\n'
+            b'--foo\r\n'
+            b'Content-Disposition: form-data; name="skipped"; filename="skipped.txt"\r\n\r\n'
+            b'skipped contents\r\n--foo--'
+        )
+
+        parser = MultiPartParser(
+            stream=BytesIO(payload),
+            content_type='multipart/form-data; boundary=foo',
+            content_length=len(payload),
+            chunk_size=4
+        )
+
+        parts = parser.iter_parts()
+        name, storage = next(parts)
+        self.assertEqual(('text', 'value'), (name, storage.value))
+
+        name, storage = next(parts)
+        self.assertEqual(('file', 'test.txt'), (name, storage.filename))
+        self.assertEqual(b'fil', storage.stream.read(3))
+        self.assertEqual(b'e contents', storage.stream.read())
+
+        name, skipped = next(parts)
+        self.assertEqual('skipped', name)
+        self.assertTrue(storage.stream.closed)
+
+        with self.assertRaises(StopIteration):
+            next(parts)
+        self.assertTrue(skipped.stream.closed)
+
+    def test_encoder(self):
+        contents = bytes(range(256)) * 1024
+        with tempfile.TemporaryFile() as f:
+            f.write(contents)
+            f.seek(0)
+
+            encoder = MultiPartEncoder((
+                ('text', 'value'),
+                ('json', FormStorage('{"a": 1}', content_type='application/json')),
+                ('file', FileStorage(f, filename=UNICODE_FILENAME)),
+                ('file', b'bytes'),
+            ), boundary='foo', chunk_size=1000)
+
+            self.assertEqual('multipart/form-data; boundary=foo', encoder.content_type)
+            content_length = encoder.content_length
+            chunks = list(encoder)
+            self.assertTrue(all(len(chunk) <= 1000 for chunk in chunks))
+            payload = b''.join(chunks)
+            self.assertEqual(len(payload), content_length)
+
+        parser = MultiPartParser(
+            stream=BytesIO(payload),
+            content_type=encoder.content_type,
+            content_length=len(payload)
+        )
+        form, files = parser.parse()
+        self.assertEqual(['value'], [storage.value for storage in form.getlist('text')])
+        self.assertEqual('application/json', form['json'].content_type)
+        self.assertEqual('{"a": 1}', form['json'].value)
+        self.assertEqual(UNICODE_FILENAME, files['file'].filename)
+        self.assertEqual('image/jpeg', files['file'].content_type)
+        self.assertEqual(contents, files['file'].read())
+        # Parts without file names are fields
+        self.assertEqual('application/octet-stream', form['file'].content_type)
+        self.assertEqual('bytes', form['file'].value)
+
+        # Size of the stream isn't known
+        encoder = MultiPartEncoder(
+            {'file': FileStorage(io.BufferedReader(BytesIO(b'data')))}, subtype='mixed', boundary='foo')
+        self.assertIsNone(encoder.content_length)
+        self.assertEqual(b'--foo\r\nContent-Type: application/octet-stream\r\n\r\n', encoder.read(49))
+        self.assertEqual(b'data\r\n--foo--\r\n', encoder.read())
+
+    def test_encoder_line_breaks(self):
+        filename = 'a"b.txt\r\nX-Injected: 1\r\n\r\n1'
+        encoder = MultiPartEncoder((
+            ('file\r\nX-Injected: 1', FileStorage(BytesIO(b'data'), filename=filename)),
+        ), boundary='foo')
+        payload = encoder.read()
+        self.assertNotIn(b'\r\nX-Injected', payload)
+
+        form, files = MultiPartParser(
+            stream=BytesIO(payload),
+            content_type=encoder.content_type,
+            content_length=len(payload)
+        ).parse()
+        self.assertEqual([], list(form))
+        self.assertEqual(['fileX-Injected: 1'], list(files))
+        self.assertEqual('a%22b.txtX-Injected: 11', files['fileX-Injected: 1'].filename)
+        self.assertEqual(b'data', files['fileX-Injected: 1'].read())
+
+        for headers in ({'X-Custom': 'a\r\nX-Injected: 1'}, {'X-Custom\nX-Injected': '1'}):
+            encoder = MultiPartEncoder({'text': FormStorage('value', headers=headers)})
+            with self.assertRaises(ValueError):
+                encoder.read()
+
+    def test_encoder_defaults(self):
+        encoder = MultiPartEncoder({'json': {'a': decimal.Decimal('1.5')}})
+        self.assertNotEqual(encoder.boundary, MultiPartEncoder(()).boundary)
+        self.assertRegex(encoder.boundary, r'^[0-9a-f]{30}$')
+
+        payload = encoder.read()
+        form, _ = MultiPartParser(
+            stream=BytesIO(payload),
+            content_type=encoder.content_type,
+            content_length=len(payload)
+        ).parse()
+        self.assertEqual('application/json', form['json'].content_type)
+        self.assertEqual(get_json_backend().dumps({'a': decimal.Decimal('1.5')}), form['json'].value)
+
     def test_rfc2231_parsing(self):
         test_data = (
             (b"Content-Type: application/x-stuff; title*=us-ascii'en-us'This%20is%20%2A%2A%2Afun%2A%2A%2A",
@@ -0,0 +1,202 @@
+import os
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from falcon_heavy.__main__ import main
+from falcon_heavy.core.openapi import bundle_specification, load_specification
+from falcon_heavy.contrib.operations import OpenAPIOperations
+
+PETSTORE = os.path.join(os.path.dirname(__file__), 'falcon/petstore/schema/petstore.yaml')
+
+
+def _iter_refs(node):
+    if isinstance(node, dict):
+        if '$ref' in node:
+            yield node['$ref']
+        for value in node.values():
+            yield from _iter_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_refs(value)
+
+
+class BundleTest(unittest.TestCase):
+
+    def test_bundle_petstore(self):
+        bundle = bundle_specification(PETSTORE)
+        self.assertEqual({'Pet', 'NewPet', 'error'}, set(bundle['components']['schemas']))
+        self.assertTrue(all(ref.startswith('#/components/') for ref in _iter_refs(bundle)))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bundle.json')
+            with open(path, 'w') as f:
+                json.dump(bundle, f)
+
+            specification = load_specification(path)
+            self.assertIn('/pets', specification.paths)
+
+    def test_recursive_references(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, 'node.json'), 'w') as f:
+                json.dump({
+                    'Node': {
+                        'type': 'object',
+                        'properties': {
+                            'children': {'type': 'array', 'items': {'$ref': '#/Node'}}
+                        }
+                    }
+                }, f)
+
+            path = os.path.join(tmp, 'openapi.json')
+            with open(path, 'w') as f:
+                json.dump({
+                    'openapi': '3.0.2',
+                    'info': {'title': 'Test', 'version': '1'},
+                    'paths': {
+                        '/nodes': {
+                            'get': {
+                                'responses': {
+                                    '200': {
+                                        'description': 'OK',
+                                        'content': {
+                                            'application/json': {'schema': {'$ref': 'node.json#/Node'}}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    'components': {'schemas': {'Node': {'type': 'string'}}}
+                }, f)
+
+            bundle = bundle_specification(path)
+            schemas = bundle['components']['schemas']
+            self.assertEqual({'type': 'string'}, schemas['Node'])
+            self.assertEqual(
+                {'$ref': '#/components/schemas/Node_2'},
+                schemas['Node_2']['properties']['children']['items']
+            )
+
+            output = os.path.join(tmp, 'bundle.json')
+            self.assertEqual(0, main(['bundle', path, '-o', output]))
+            self.assertIsNotNone(load_specification(output))
+
+    def _bundle_and_load(self, tmp, documents, validate=True):
+        for name, document in documents.items():
+            with open(os.path.join(tmp, name), 'w') as f:
+                json.dump(document, f)
+
+        bundle = bundle_specification(os.path.join(tmp, 'openapi.json'), validate=validate)
+        self.assertTrue(all(ref.startswith('#/components/') for ref in _iter_refs(bundle)))
+
+        path = os.path.join(tmp, 'bundle.json')
+        with open(path, 'w') as f:
+            json.dump(bundle, f)
+        return bundle, path
+
+    def test_path_item_references(self):
+        operation = {
+            'responses': {
+                '200': {
+                    'description': 'OK',
+                    'content': {'application/json': {'schema': {'$ref': 'schemas.json#/Pet'}}}
+                }
+            }
+        }
+        documents = {
+            'schemas.json': {'Pet': {'type': 'object', 'properties': {'name': {'type': 'string'}}}},
+            'paths.json': {'pets': {'get': dict(operation)}, 'callback': {'post': operation}},
+            'openapi.json': {
+                'openapi': '3.0.2',
+                'info': {'title': 'Test', 'version': '1'},
+                'paths': {'/pets': {'$ref': 'paths.json#/pets'}}
+            }
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            bundle, path = self._bundle_and_load(tmp, documents)
+            self.assertEqual({'Pet'}, set(bundle['components']['schemas']))
+            self.assertIn('get', bundle['paths']['/pets'])
+
+            specification = load_specification(path)
+            self.assertIsNotNone(specification.paths['/pets'].get)
+
+        # Path items of callbacks are inlined too
+        documents['paths.json']['pets']['get']['callbacks'] = {
+            'created': {'{$request.body#/url}': {'$ref': 'paths.json#/callback'}}
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            bundle, _ = self._bundle_and_load(tmp, documents, validate=False)
+            callback = bundle['paths']['/pets']['get']['callbacks']['created']['{$request.body#/url}']
+            self.assertEqual(
+                {'$ref': '#/components/schemas/Pet'},
+                callback['post']['responses']['200']['content']['application/json']['schema']
+            )
+
+    def test_discriminator_mapping(self):
+        def pet(kind, sound):
+            return {
+                'type': 'object',
+                'required': ['petType', sound],
+                'properties': {'petType': {'type': 'string'}, sound: {'type': 'string'}}
+            }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            bundle, path = self._bundle_and_load(tmp, {
+                'pets.json': {'Dog': pet('Dog', 'bark'), 'Cat': pet('Cat', 'meow')},
+                'openapi.json': {
+                    'openapi': '3.0.2',
+                    'info': {'title': 'Test', 'version': '1'},
+                    'paths': {
+                        '/pets': {
+                            'get': {
+                                'responses': {
+                                    '200': {
+                                        'description': 'OK',
+                                        'content': {
+                                            'application/json': {
+                                                'schema': {
+                                                    'oneOf': [
+                                                        {'$ref': 'pets.json#/Dog'},
+                                                        {'$ref': 'pets.json#/Cat'}
+                                                    ],
+                                                    'discriminator': {
+                                                        'propertyName': 'petType',
+                                                        'mapping': {
+                                                            'woof': 'pets.json#/Dog',
+                                                            'meow': 'pets.json#/Cat'
+                                                        }
+                                                    }
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            })
+
+            schema = bundle['paths']['/pets']['get']['responses']['200']['content']['application/json']['schema']
+            self.assertEqual(
+                {'woof': '#/components/schemas/Dog', 'meow': '#/components/schemas/Cat'},
+                schema['discriminator']['mapping']
+            )
+
+            operation = OpenAPIOperations.from_file(path).find('/pets', 'GET')
+            response = operation.response_converter.convert(
+                200, {}, {'petType': 'woof', 'bark': 'loud'}, 'application/json')
+            self.assertEqual('loud', response.content['bark'])
+
+    def test_fingerprint_command(self):
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(0, main(['fingerprint', PETSTORE]))
+        self.assertTrue(stdout.getvalue().strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
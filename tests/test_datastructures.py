@@ -0,0 +1,103 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from falcon_heavy.http.datastructures import FileStorage
+
+CONTENTS = bytes(range(256)) * 1024
+
+
+class FileStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _read(self, name):
+        with open(self._path(name), 'rb') as f:
+            return f.read()
+
+    def _named_file(self):
+        f = tempfile.NamedTemporaryFile(dir=self.directory, delete=False)
+        f.write(CONTENTS)
+        f.seek(0)
+        return f
+
+    def _spooled_file(self, max_size):
+        f = tempfile.SpooledTemporaryFile(max_size=max_size, dir=self.directory)
+        f.write(CONTENTS)
+        f.seek(0)
+        return f
+
+    def test_move_named_file(self):
+        f = self._named_file()
+        storage = FileStorage(f)
+        storage.move(self._path('moved'))
+
+        self.assertFalse(os.path.exists(f.name))
+        self.assertEqual(CONTENTS, self._read('moved'))
+        self.assertEqual(CONTENTS, storage.read())
+        storage.close()
+
+    def test_move_unnamed_file(self):
+        for stream in (io.BytesIO(CONTENTS), self._spooled_file(0), self._spooled_file(len(CONTENTS))):
+            stream.seek(10)
+            storage = FileStorage(stream)
+            storage.move(self._path('moved'))
+
+            self.assertEqual(CONTENTS, self._read('moved'))
+            self.assertEqual(10, stream.tell())
+            self.assertEqual(['moved'], os.listdir(self.directory))
+            storage.close()
+
+    def test_save(self):
+        for stream in (io.BytesIO(CONTENTS), self._named_file(), self._spooled_file(0)):
+            stream.seek(10)
+            storage = FileStorage(stream)
+            storage.save(self._path('saved'))
+            self.assertEqual(CONTENTS[10:], self._read('saved'))
+            self.assertEqual(b'', storage.read())
+
+            stream.seek(0)
+            dst = io.BytesIO()
+            storage.save(dst)
+            self.assertEqual(CONTENTS, dst.getvalue())
+
+            stream.seek(0)
+            with open(self._path('saved'), 'ab') as dst:
+                storage.save(dst)
+                dst.write(b'end')
+            self.assertEqual(CONTENTS[10:] + CONTENTS + b'end', self._read('saved'))
+            storage.close()
+
+    def test_view(self):
+        for stream in (io.BytesIO(CONTENTS), self._named_file(), self._spooled_file(0),
+                       self._spooled_file(len(CONTENTS))):
+            storage = FileStorage(stream)
+            with storage.view() as data:
+                self.assertTrue(data.readonly)
+                self.assertEqual(CONTENTS, data)
+            storage.close()
+
+        storage = FileStorage(tempfile.TemporaryFile(dir=self.directory))
+        with storage.view() as data:
+            self.assertEqual(b'', data)
+        storage.close()
+
+        # Data of streams that are neither in memory nor on disk are read
+        storage = FileStorage(io.BufferedReader(io.BytesIO(CONTENTS)))
+        with storage.view() as data:
+            self.assertTrue(data.readonly)
+            self.assertEqual(CONTENTS, data)
+        storage.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import decimal
+import unittest
+
+from falcon_heavy.core import types as t
+from falcon_heavy.core.encoders import (
+    StdlibJSONBackend,
+    OrjsonBackend,
+    RapidJSONBackend,
+    UjsonBackend,
+    get_json_backend,
+    set_json_backend
+)
+
+
+def make_value():
+    return {
+        'object': t.Object(properties={'a': 1}, additional_properties={'a': 2, 'b': 'ü'}),
+        'single': t.Object(properties={'c': [t.Object()]}),
+        'decimal': decimal.Decimal('1.10'),
+        'path': t.Path('#') / 'a',
+        'big': 2 ** 70,
+    }
+
+
+EXPECTED = {
+    'object': {'a': 1, 'b': 'ü'},
+    'single': {'c': [{}]},
+    'decimal': '1.10',
+    'path': '#/a',
+    'big': 2 ** 70,
+}
+
+
+class JSONBackendTest(unittest.TestCase):
+
+    def _check(self, backend):
+        self.assertEqual(EXPECTED, json.loads(backend.dumps(make_value())))
+        self.assertEqual(EXPECTED, json.loads(backend.dumpb(make_value())))
+        self.assertIn('ü', backend.dumps(make_value()))
+        self.assertEqual({'a': 'ü'}, backend.loads('{"a": "ü"}'.encode()))
+        self.assertEqual({'a': 'ü'}, backend.loads('{"a": "ü"}'))
+
+        for data in (b'{', b'\xff', '[1,]'):
+            with self.assertRaises(ValueError):
+                backend.loads(data)
+
+        for dump in (backend.dumps, backend.dumpb):
+            with self.assertRaises(TypeError):
+                dump({'a': object()})
+
+    def test_stdlib(self):
+        self._check(StdlibJSONBackend())
+        self.assertEqual('{"a": [1, 2]}', StdlibJSONBackend().dumps({'a': [1, 2]}))
+
+    def test_libraries(self):
+        for backend_class in (OrjsonBackend, RapidJSONBackend, UjsonBackend):
+            try:
+                backend = backend_class()
+            except ImportError:
+                continue
+
+            with self.subTest(backend=backend_class.__name__):
+                self._check(backend)
+
+    def test_set_json_backend(self):
+        previous = get_json_backend()
+        backend = StdlibJSONBackend()
+        set_json_backend(backend)
+        try:
+            self.assertIs(backend, get_json_backend())
+        finally:
+            set_json_backend(previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
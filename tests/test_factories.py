@@ -1189,6 +1189,35 @@ class FactoriesTest(unittest.TestCase):
         }):
             self._convert(type_, payload)
 
+    def test_canonical_types(self):
+        spec = {
+            'properties': {
+                'a': {'type': 'string', 'maxLength': 255},
+                'b': {'type': 'string', 'maxLength': 255},
+                'c': {'type': 'string', 'maxLength': 254},
+                'd': {'type': 'integer', 'format': 'int64', 'enum': [1]},
+                'e': {'type': 'integer', 'format': 'int64', 'enum': [True]},
+                'f': {'type': 'array', 'items': {'type': 'string', 'maxLength': 255}},
+                'g': {'type': 'array', 'items': {'type': 'string', 'maxLength': 255}},
+                'h': {'type': 'object', 'properties': {'x': {'type': 'integer'}}},
+                'i': {'type': 'object', 'properties': {'x': {'type': 'integer'}}, 'required': ['x']}
+            }
+        }
+
+        spec = self._load(SchemaObjectType, spec)
+        properties = self._generate_type(spec).properties
+
+        self.assertIs(properties['a'], properties['b'])
+        self.assertIsNot(properties['a'], properties['c'])
+        self.assertIsNot(properties['d'], properties['e'])
+        self.assertIs(properties['f'], properties['g'])
+        self.assertIs(properties['f'].item_type, properties['a'])
+        self.assertIsNot(properties['h'], properties['i'])
+        self.assertIs(properties['h'].properties['x'], properties['i'].properties['x'])
+
+        properties = TypeFactory(canonicalize=False).generate(spec).properties
+        self.assertIsNot(properties['a'], properties['b'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+import sys
+import subprocess
+import unittest
+
+# Dependencies that are imported on first use
+LAZY_MODULES = (
+    'yaml',
+    'rfc3987',
+    'rfc3339',
+    'strict_rfc3339',
+    'uuid',
+    'cgi',
+    'unittest',
+    'distutils',
+    'urllib.request',
+    'concurrent.futures.process',
+    'orjson',
+    'rapidjson',
+    'ujson',
+)
+
+
+class ImportsTest(unittest.TestCase):
+
+    def _get_imported(self, statement):
+        output = subprocess.check_output([
+            sys.executable,
+            '-c',
+            '%s; import sys; print("\\n".join(sys.modules))' % statement
+        ], universal_newlines=True)
+        return set(output.splitlines())
+
+    def test_lazy_imports(self):
+        imported = self._get_imported('import falcon_heavy.contrib')
+        self.assertEqual(set(), imported.intersection(LAZY_MODULES))
+        self.assertNotIn('wrapt', self._get_imported('import falcon_heavy.core'))
+
+    def test_first_use(self):
+        from falcon_heavy.core import types as t
+        from falcon_heavy.core.types.ref_resolver import _parse
+
+        self.assertEqual({'a': 1}, _parse('a: 1'))
+        self.assertIsNotNone(t.get_safe_loader())
+
+        type_ = t.DateTimeType(t.StringType())
+        self.assertEqual(2019, type_.convert('2019-01-01T00:00:00Z', t.Path('')).year)
+        with self.assertRaises(t.SchemaError):
+            type_.convert('2019-01-01', t.Path(''))
+
+        type_ = t.URIType()
+        with self.assertRaises(t.SchemaError):
+            type_.convert('not a uri', t.Path(''))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import gc
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import weakref
+import threading
+
+from falcon_heavy.core.openapi import load_specification
+from falcon_heavy.core.factories import TypeCache, shared_type_cache
+from falcon_heavy.contrib.operations import (
+    OpenAPIOperations,
+    OpenAPIServer,
+    OpenAPIOAuthFlow,
+    OpenAPIOAuthFlows,
+    OpenAPISecurityScheme,
+    OperationNotFoundError
+)
+
+PETSTORE = os.path.join(os.path.dirname(__file__), 'falcon/petstore/schema/petstore.yaml')
+
+SECURED = {
+    'openapi': '3.0.2',
+    'info': {'title': 'test', 'version': '1'},
+    'security': [{'apiKey': []}, {'oauth2': ['read']}],
+    'paths': {
+        '/items': {
+            'get': {
+                'responses': {'200': {'description': 'ok'}}
+            }
+        }
+    },
+    'components': {
+        'securitySchemes': {
+            'apiKey': {'type': 'apiKey', 'name': 'X-Key', 'in': 'header'},
+            'bearer': {'type': 'http', 'scheme': 'bearer', 'bearerFormat': 'JWT'},
+            'oauth2': {
+                'type': 'oauth2',
+                'flows': {
+                    'clientCredentials': {
+                        'authorizationUrl': 'http://example.com/authorize',
+                        'tokenUrl': 'http://example.com/token',
+                        'scopes': {'read': 'Read'}
+                    }
+                }
+            },
+            'openId': {'type': 'openIdConnect', 'openIdConnectUrl': 'http://example.com/openid'}
+        }
+    }
+}
+
+
+class OperationsTest(unittest.TestCase):
+
+    def test_lazy_converters(self):
+        operations = OpenAPIOperations.from_file(PETSTORE)
+        self.assertFalse(any(operation.is_prepared for operation in operations.iter_operations()))
+
+        operation = operations.find('/pets', 'GET')
+        self.assertFalse(operation.is_prepared)
+        request_converter = operation.request_converter
+        self.assertIs(request_converter, operation.request_converter)
+        self.assertFalse(operation.is_prepared)
+        operation.response_converter  # noqa
+        self.assertTrue(operation.is_prepared)
+
+    def test_concurrent_generation(self):
+        operations = OpenAPIOperations.from_file(PETSTORE)
+        operation = operations.find('/pets', 'POST')
+        converters = []
+
+        def target():
+            converters.append(operation.request_converter)
+
+        threads = [threading.Thread(target=target) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(8, len(converters))
+        self.assertTrue(all(converter is converters[0] for converter in converters))
+
+    def test_warm_up(self):
+        operations = OpenAPIOperations.from_file(PETSTORE)
+        self.assertEqual(2, operations.warm_up(['findPets', 'addPet']))
+        prepared = {
+            operation.operation_id
+            for operation in operations.iter_operations()
+            if operation.is_prepared
+        }
+        self.assertEqual({'findPets', 'addPet'}, prepared)
+
+        with self.assertRaises(OperationNotFoundError):
+            operations.warm_up(['unknown'])
+
+        count = operations.warm_up()
+        self.assertEqual(len(list(operations.iter_operations())), count)
+        self.assertTrue(all(operation.is_prepared for operation in operations.iter_operations()))
+
+    def test_prepare_for_fork(self):
+        operations = OpenAPIOperations.from_file(PETSTORE)
+        try:
+            report = operations.prepare_for_fork()
+        finally:
+            if hasattr(gc, 'unfreeze'):
+                gc.unfreeze()
+
+        self.assertEqual(len(list(operations.iter_operations())), report.operations)
+        self.assertTrue(all(operation.is_prepared for operation in operations.iter_operations()))
+        if hasattr(gc, 'freeze'):
+            self.assertGreater(report.frozen_objects, 0)
+        if os.path.exists('/proc/self/statm'):
+            self.assertIsNotNone(report.shared_size)
+            self.assertGreater(report.private_size, 0)
+
+    def test_compact(self):
+        openapi_object = load_specification(PETSTORE)
+        ref = weakref.ref(openapi_object.servers[0])
+        operations = OpenAPIOperations.from_openapi_object(openapi_object, compact=True)
+        del openapi_object
+        gc.collect()
+        self.assertIsNone(ref())
+
+        operation = operations.find('/pets', 'GET')
+        self.assertTrue(operation.is_prepared)
+        self.assertEqual((OpenAPIServer('http://petstore.swagger.io/api', None, {}), ), operation.servers)
+        self.assertEqual('controllers.pets.Pets', operation.extensions['x-resource'])
+
+        response = operation.response_converter.convert(
+            200, {}, [{'id': 1, 'name': 'Max'}], 'application/json')
+        self.assertEqual('Max', response.content[0]['name'])
+
+    def test_compact_security_schemes(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'openapi.json')
+            with open(path, 'w') as fh:
+                json.dump(SECURED, fh)
+            openapi_object = load_specification(path)
+        finally:
+            shutil.rmtree(directory)
+
+        refs = [weakref.ref(scheme) for scheme in openapi_object.components.security_schemes.values()]
+        operations = OpenAPIOperations.from_openapi_object(openapi_object, compact=True)
+        del openapi_object
+        gc.collect()
+        self.assertTrue(all(ref() is None for ref in refs))
+
+        operation = operations.find('/items', 'GET')
+        self.assertEqual(({'apiKey': ()}, {'oauth2': ('read', )}), operation.security)
+        self.assertEqual({
+            'apiKey': OpenAPISecurityScheme(type='apiKey', name='X-Key', location='header'),
+            'bearer': OpenAPISecurityScheme(type='http', scheme='bearer', bearer_format='JWT'),
+            'oauth2': OpenAPISecurityScheme(type='oauth2', flows=OpenAPIOAuthFlows(
+                implicit=None,
+                password=None,
+                client_credentials=OpenAPIOAuthFlow(
+                    authorization_url='http://example.com/authorize',
+                    token_url='http://example.com/token',
+                    refresh_url=None,
+                    scopes={'read': 'Read'}
+                ),
+                authorization_code=None
+            )),
+            'openId': OpenAPISecurityScheme(type='openIdConnect', open_id_connect_url='http://example.com/openid')
+        }, operation.security_schemes)
+
+    def test_shared_type_cache(self):
+        type_cache = TypeCache()
+
+        operations = OpenAPIOperations.from_file(PETSTORE, type_cache=type_cache)
+        operations.warm_up()
+        count = len(type_cache)
+        self.assertGreater(count, 0)
+
+        other = OpenAPIOperations.from_file(PETSTORE, type_cache=type_cache)
+        other.warm_up()
+        self.assertEqual(count, len(type_cache))
+
+        content_type = operations.find('/pets', 'GET').response_converter
+        response = content_type.convert(200, {}, [{'id': 1, 'name': 'Max'}], 'application/json')
+        self.assertEqual('Max', response.content[0]['name'])
+
+        del operations, other, content_type
+        gc.collect()
+        self.assertEqual(0, len(type_cache))
+
+    def test_private_type_cache(self):
+        count = len(shared_type_cache)
+        operations = OpenAPIOperations.from_file(PETSTORE)
+        operations.warm_up()
+        self.assertEqual(count, len(shared_type_cache))
+
+        operations = OpenAPIOperations.from_file(PETSTORE, type_cache=shared_type_cache)
+        operations.warm_up()
+        self.assertGreater(len(shared_type_cache), count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import pickle
+import unittest
+
+from falcon_heavy.core import types as t
+from falcon_heavy.core.context import make_specification_conversion_context, make_request_conversion_context
+from falcon_heavy.core.openapi import SchemaObjectType
+from falcon_heavy.core.factories import TypeFactory
+from falcon_heavy.contrib.operations import OpenAPIOperations
+from falcon_heavy.contrib.parallel import build_operations
+
+PETSTORE = os.path.join(os.path.dirname(__file__), 'falcon/petstore/schema/petstore.yaml')
+
+
+class ParallelTest(unittest.TestCase):
+
+    def test_build_operations(self):
+        operations = build_operations(PETSTORE, processes=2)
+        expected = OpenAPIOperations.from_file(PETSTORE, compact=True)
+
+        self.assertEqual(
+            {(uri_template.template, method) for uri_template, mapping in expected.items() for method in mapping},
+            {(uri_template.template, method) for uri_template, mapping in operations.items() for method in mapping}
+        )
+        self.assertIsNone(operations.subset_report)
+
+        operation = operations.find('/pets', 'GET')
+        self.assertTrue(operation.is_prepared)
+        self.assertEqual(expected.find('/pets', 'GET').servers, operation.servers)
+        response = operation.response_converter.convert(
+            200, {}, [{'id': 1, 'name': 'Max'}], 'application/json')
+        self.assertEqual('Max', response.content[0]['name'])
+
+        with self.assertRaises(t.SchemaError):
+            operation.response_converter.convert(200, {}, [{'id': 1}], 'application/json')
+
+        # `Pet` is used by paths of different partitions
+        self.assertEqual(1, len({id(type_) for type_ in operations._generated if type(type_) is t.AllOfType}))
+
+    def test_pickle_recursive_type(self):
+        spec = {
+            'properties': {
+                'name': {'type': 'string'},
+                'children': {'type': 'array', 'items': {'$ref': '#/'}}
+            }
+        }
+        spec = SchemaObjectType().convert(spec, t.Path(''), **make_specification_conversion_context('', spec))
+        type_ = pickle.loads(pickle.dumps(TypeFactory().generate(spec)))
+
+        result = type_.convert(
+            {'name': 'a', 'children': [{'name': 'b', 'children': [{'name': 1}]}]},
+            t.Path(''),
+            strict=False,
+            **make_request_conversion_context()
+        )
+        self.assertEqual('1', result['children'][0]['children'][0]['name'])
+
+
+if __name__ == '__main__':
+    unittest.main()
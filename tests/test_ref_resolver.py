@@ -0,0 +1,120 @@
+import os
+import json
+import pickle
+import hashlib
+import pathlib
+import tempfile
+import unittest
+from io import StringIO
+from urllib.parse import urljoin
+
+from falcon_heavy.core.types import RefResolver, RefResolutionError, load_file, load_document
+from falcon_heavy.core.types.ref_resolver import _write_cache, _load_cached
+from falcon_heavy.core.openapi import load_specification
+
+PETSTORE = os.path.join(os.path.dirname(__file__), 'falcon/petstore/schema/petstore.yaml')
+
+
+class RefResolverTest(unittest.TestCase):
+
+    def test_prefetch(self):
+        base_uri = urljoin('file://', pathlib.Path(os.path.abspath(PETSTORE)).as_uri())
+        resolver = RefResolver(base_uri, load_file(PETSTORE))
+        self.assertEqual(2, resolver.prefetch())
+        self.assertIn(urljoin(base_uri, 'error.yaml'), resolver.store)
+        self.assertIn(urljoin(base_uri, 'pet.yaml'), resolver.store)
+        self.assertEqual(0, resolver.prefetch())
+
+        self.assertIsNotNone(load_specification(PETSTORE, prefetch=True))
+
+    def test_file_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'document.json')
+            with open(path, 'w') as f:
+                json.dump({'a': 1}, f)
+
+            document = load_file(path)
+            self.assertEqual({'a': 1}, document)
+            self.assertIs(document, load_file(path))
+
+            with open(path, 'w') as f:
+                json.dump({'a': 10}, f)
+
+            self.assertEqual({'a': 10}, load_file(path))
+
+    def test_cache_dir(self):
+        uri = 'http://example.invalid/schemas/pet.json'
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, hashlib.sha256(uri.encode('utf-8')).hexdigest() + '.json')
+            with open(cache_path, 'w') as f:
+                json.dump({'Pet': {'type': 'object'}}, f)
+
+            referrer = {'schema': {'$ref': uri + '#/Pet'}}
+            resolver = RefResolver('', referrer, cache_dir=tmp)
+            self.assertEqual(1, resolver.prefetch())
+            url, resolved = resolver.resolve(uri + '#/Pet')
+            self.assertEqual({'type': 'object'}, resolved)
+
+    def test_write_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, 'cache', 'document.json')
+            _write_cache(cache_path, lambda fh: json.dump({'a': 1}, fh))
+            with open(cache_path) as f:
+                self.assertEqual({'a': 1}, json.load(f))
+
+            def fail(fh):
+                fh.write('{"a": ')
+                raise ValueError()
+
+            with self.assertRaises(ValueError):
+                _write_cache(cache_path, fail)
+
+            # The temporary file is removed and the cache is kept
+            self.assertEqual(['document.json'], os.listdir(os.path.dirname(cache_path)))
+            with open(cache_path) as f:
+                self.assertEqual({'a': 1}, json.load(f))
+
+    def test_load_document(self):
+        self.assertEqual({'a': [1, 2]}, load_document(StringIO('{"a": [1, 2]}')))
+        self.assertEqual({'a': [1, 2]}, load_document(StringIO('a:\n  - 1\n  - 2\n')))
+        self.assertEqual({'a': 'b'}, load_document(StringIO('{a: b}')))
+
+        with self.assertRaises(RefResolutionError):
+            load_document(StringIO('a: b: c'))
+
+    def test_parsed_documents_cache_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'document.yaml')
+            with open(path, 'w') as f:
+                f.write('a: 1\n')
+
+            cache_dir = os.path.join(tmp, 'cache')
+            self.assertEqual({'a': 1}, load_file(path, cache_dir=cache_dir))
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+
+            self.assertTrue(os.listdir(cache_dir)[0].endswith('.json'))
+
+            # Corrupted documents are missed
+            for data in (b'', b'{"a": ', b'\x80\x04\x95'):
+                cache_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+                with open(cache_path, 'wb') as f:
+                    f.write(data)
+                self.assertEqual({'a': 1}, _load_cached(b'a: 1\n', cache_dir))
+                self.assertEqual(1, len(os.listdir(cache_dir)))
+
+    def test_parsed_documents_cache_dir_unsafe(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # Pickles put into the directory are never loaded
+            data = b'a: 1\n'
+            with open(os.path.join(tmp, hashlib.sha256(data).hexdigest() + '.pickle'), 'wb') as f:
+                pickle.dump({'a': 2}, f)
+            self.assertEqual({'a': 1}, _load_cached(data, tmp))
+
+            # Documents that aren't the same after a JSON round trip aren't kept
+            for data in (b'1: a\n', b'a: 2001-12-14\n'):
+                _load_cached(data, tmp)
+                self.assertFalse(os.path.exists(os.path.join(tmp, hashlib.sha256(data).hexdigest() + '.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import json
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from falcon_heavy.core import openapi as o
+from falcon_heavy.contrib.reloader import OpenAPIOperationsReloader, ReloadReport
+
+
+def _make_specification(item_max_length=64, user_max_length=64):
+    specification = {
+        'openapi': '3.0.2',
+        'info': {'title': 'test', 'version': '1'},
+        'paths': {
+            '/items': {
+                'get': {
+                    'operationId': 'getItems',
+                    'responses': {
+                        '200': {
+                            'description': 'ok',
+                            'content': {'application/json': {'schema': {'$ref': 'schemas.json#/Item'}}}
+                        }
+                    }
+                }
+            },
+            '/users': {
+                'get': {
+                    'operationId': 'getUsers',
+                    'responses': {
+                        '200': {
+                            'description': 'ok',
+                            'content': {'application/json': {'schema': {'$ref': 'schemas.json#/User'}}}
+                        }
+                    }
+                }
+            }
+        }
+    }
+    schemas = {
+        'Item': {'type': 'object', 'properties': {'name': {'type': 'string', 'maxLength': item_max_length}}},
+        'User': {'type': 'object', 'properties': {'name': {'type': 'string', 'maxLength': user_max_length}}}
+    }
+    return specification, schemas
+
+
+class ReloaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'openapi.json')
+        self.version = 0
+        self._write(*_make_specification())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, specification, schemas):
+        self.version += 1
+        for name, document in (('openapi.json', specification), ('schemas.json', schemas)):
+            path = os.path.join(self.directory, name)
+            with open(path, 'w') as fh:
+                json.dump(document, fh)
+            # Timestamps of files written in a row may be equal
+            os.utime(path, ns=(self.version * 10 ** 9, self.version * 10 ** 9))
+
+    def test_reload(self):
+        reports = []
+        reloader = OpenAPIOperationsReloader(self.path, on_reload=reports.append)
+        self.assertEqual([ReloadReport(operations=2, reused=0)], reports)
+        self.assertEqual(2, len(reloader.files))
+        self.assertIsNone(reloader.check())
+
+        operations = reloader.operations
+        items = reloader.find('/items', 'GET')
+        users = reloader.find('/users', 'GET')
+        self.assertTrue(items.is_prepared)
+
+        self._write(*_make_specification(user_max_length=8))
+        self.assertEqual(ReloadReport(operations=2, reused=1), reloader.check())
+        self.assertIsNot(operations, reloader.operations)
+        self.assertIs(items, reloader.find('/items', 'GET'))
+        self.assertIsNot(users, reloader.find('/users', 'GET'))
+
+        # The previous version is still usable
+        response = users.response_converter.convert(200, {}, {'name': 'x' * 10}, 'application/json')
+        self.assertEqual('x' * 10, response.content['name'])
+
+    def test_invalid_specification(self):
+        errors = []
+        reloader = OpenAPIOperationsReloader(self.path, on_error=errors.append)
+        operations = reloader.operations
+
+        specification, schemas = _make_specification()
+        del specification['info']
+        self._write(specification, schemas)
+
+        self.assertIsNone(reloader.check())
+        self.assertEqual(1, len(errors))
+        self.assertIs(operations, reloader.operations)
+
+    def test_change_while_loading(self):
+        make_ref_resolver = o.make_ref_resolver
+
+        def make_and_change(*args, **kwargs):
+            ref_resolver = make_ref_resolver(*args, **kwargs)
+            self._write(*_make_specification(item_max_length=8, user_max_length=8))
+            return ref_resolver
+
+        reloader = OpenAPIOperationsReloader(self.path)
+        self._write(*_make_specification(user_max_length=8))
+        with mock.patch.object(o, 'make_ref_resolver', make_and_change):
+            self.assertEqual(ReloadReport(operations=2, reused=1), reloader.check())
+
+        # Files were read before the last change
+        users = reloader.find('/users', 'GET')
+        self.assertEqual(ReloadReport(operations=2, reused=1), reloader.check())
+        self.assertIs(users, reloader.find('/users', 'GET'))
+        self.assertIsNone(reloader.check())
+
+    def test_watch(self):
+        reports = []
+        reloader = OpenAPIOperationsReloader(self.path, on_reload=reports.append)
+        reloader.start(interval=0.01)
+        try:
+            self._write(*_make_specification(item_max_length=8))
+            for _ in range(500):
+                if reports[-1] == ReloadReport(operations=2, reused=1):
+                    break
+                time.sleep(0.01)
+        finally:
+            reloader.stop()
+
+        self.assertEqual(ReloadReport(operations=2, reused=1), reports[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
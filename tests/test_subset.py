@@ -0,0 +1,121 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from falcon_heavy.core.openapi import load_specification_subset
+from falcon_heavy.contrib.operations import OpenAPIOperations
+
+PETSTORE = os.path.join(os.path.dirname(__file__), 'falcon/petstore/schema/petstore.yaml')
+
+SPECIFICATION = {
+    'openapi': '3.0.2',
+    'info': {'title': 'test', 'version': '1'},
+    'paths': {
+        '/pets': {
+            'get': {
+                'operationId': 'getPets',
+                'tags': ['pets'],
+                'responses': {
+                    '200': {
+                        'description': 'ok',
+                        'content': {'application/json': {'schema': {'$ref': '#/components/schemas/Pet'}}}
+                    },
+                    'default': {'$ref': '#/components/responses/Error'}
+                }
+            }
+        },
+        '/users': {
+            'get': {
+                'operationId': 'getUsers',
+                'tags': ['users'],
+                'responses': {
+                    '200': {
+                        'description': 'ok',
+                        'content': {'application/json': {'schema': {'$ref': '#/components/schemas/User'}}}
+                    }
+                }
+            }
+        }
+    },
+    'components': {
+        'schemas': {
+            'Pet': {
+                'type': 'object',
+                'required': ['petType'],
+                'properties': {'petType': {'type': 'string'}},
+                'discriminator': {'propertyName': 'petType'}
+            },
+            'Cat': {
+                'allOf': [
+                    {'$ref': '#/components/schemas/Pet'},
+                    {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+                ]
+            },
+            'User': {
+                'type': 'object',
+                'properties': {'name': {'type': 'string'}}
+            },
+            'Error': {
+                'type': 'object',
+                'properties': {'message': {'type': 'string'}}
+            }
+        },
+        'responses': {
+            'Error': {
+                'description': 'error',
+                'content': {'application/json': {'schema': {'$ref': '#/components/schemas/Error'}}}
+            }
+        }
+    }
+}
+
+
+class SubsetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'openapi.json')
+        with open(self.path, 'w') as fh:
+            json.dump(SPECIFICATION, fh)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_tree_shaking(self):
+        openapi_object, report = load_specification_subset(self.path, include_tags=['pets'])
+
+        self.assertEqual((('/pets', 'get'), ), report.operations)
+        self.assertEqual(('Pet', 'Cat', 'Error'), report.components['schemas'])
+        self.assertEqual(('Error', ), report.components['responses'])
+        self.assertEqual(1, report.removed_operations)
+        self.assertEqual(1, report.removed_components)
+
+        self.assertEqual(['/pets'], list(openapi_object.paths))
+        pet = openapi_object.components.schemas['Pet']
+        self.assertEqual(['Cat'], [subschema.name for subschema in pet.subschemas])
+
+    def test_unmatched(self):
+        _, report = load_specification_subset(self.path, include_operation_ids=['unknown'])
+        self.assertEqual((), report.operations)
+        self.assertEqual((), report.components['schemas'])
+
+    def test_operations(self):
+        operations = OpenAPIOperations.from_file(PETSTORE, include_paths=['/pets*'], include_operation_ids=['post'])
+        self.assertEqual(
+            {'findPets', 'addPet', 'findPetById', 'deletePet', 'post'},
+            {operation.operation_id for operation in operations.iter_operations()}
+        )
+        self.assertEqual(5, len(operations.subset_report.operations))
+
+        operation = operations.find('/pets', 'GET')
+        response = operation.response_converter.convert(
+            200, {}, [{'id': 1, 'name': 'Max'}], 'application/json')
+        self.assertEqual('Max', response.content[0]['name'])
+
+        self.assertIsNone(OpenAPIOperations.from_file(PETSTORE).subset_report)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import json
+import tempfile
+import unittest
+
+from falcon_heavy.core.types import SchemaError
+from falcon_heavy.core.openapi import load_specification, fingerprint_specification
+
+PETSTORE = os.path.join(os.path.dirname(__file__), 'falcon/petstore/schema/petstore.yaml')
+
+
+def _make_specification(max_length):
+    return {
+        'openapi': '3.0.2',
+        'info': {'title': 'Test', 'version': '1'},
+        'paths': {
+            '/items': {
+                'get': {
+                    'operationId': 'getItems',
+                    'parameters': [{
+                        'name': 'q',
+                        'in': 'query',
+                        'schema': {'type': 'string', 'minLength': 10, 'maxLength': max_length}
+                    }],
+                    'responses': {'200': {'description': 'OK'}}
+                }
+            }
+        }
+    }
+
+
+class TrustedSpecificationTest(unittest.TestCase):
+
+    def test_fingerprint(self):
+        fingerprint = fingerprint_specification(PETSTORE)
+        self.assertEqual(fingerprint, fingerprint_specification(PETSTORE))
+        self.assertIsNotNone(load_specification(PETSTORE, trusted_fingerprint=fingerprint))
+
+    def test_trusted_specification(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'openapi.json')
+            with open(path, 'w') as f:
+                json.dump(_make_specification(5), f)
+
+            with self.assertRaises(SchemaError):
+                load_specification(path)
+
+            fingerprint = fingerprint_specification(path)
+            self.assertIsNotNone(load_specification(path, trusted_fingerprint=fingerprint))
+
+            with open(path, 'w') as f:
+                json.dump(_make_specification(6), f)
+
+            with self.assertWarns(RuntimeWarning):
+                with self.assertRaises(SchemaError):
+                    load_specification(path, trusted_fingerprint=fingerprint)
+
+
+if __name__ == '__main__':
+    unittest.main()
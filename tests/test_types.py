@@ -0,0 +1,58 @@
+import unittest
+
+from falcon_heavy.core.types import (
+    StringType,
+    IntegerType,
+    ArrayType,
+    SchemaError,
+    Path,
+    ConvertibleEntity
+)
+
+
+class TypesTest(unittest.TestCase):
+
+    def test_shared_messages(self):
+        first = StringType()
+        second = StringType()
+        self.assertIs(first.messages, second.messages)
+        self.assertIs(StringType.MESSAGES, first.messages)
+
+        custom = StringType(messages={'type': "Custom"})
+        self.assertEqual("Custom", custom.messages['type'])
+        self.assertEqual(StringType.MESSAGES['nullable'], custom.messages['nullable'])
+        self.assertNotEqual("Custom", StringType.MESSAGES['type'])
+
+        self.assertIs(IntegerType.MESSAGES, IntegerType().messages)
+
+    def test_unconstrained_validators_are_not_bound(self):
+        self.assertEqual([], StringType().validators)
+        self.assertEqual([], IntegerType().validators)
+        self.assertEqual([], ArrayType(StringType()).validators)
+
+        type_ = StringType(max_length=2, enum=['a', 'abc'])
+        self.assertEqual(2, len(type_.validators))
+        with self.assertRaises(SchemaError):
+            type_.convert('abc', Path(''), entity=ConvertibleEntity.REQUEST)
+
+        type_ = IntegerType(minimum=0)
+        self.assertEqual(1, len(type_.validators))
+        with self.assertRaises(SchemaError):
+            type_.convert(-1, Path(''), entity=ConvertibleEntity.REQUEST)
+
+        type_ = StringType(validators=[lambda value, *args, **context: "Invalid" if value == 'x' else None])
+        self.assertEqual(1, len(type_.validators))
+        with self.assertRaises(SchemaError):
+            type_.convert('x', Path(''), entity=ConvertibleEntity.REQUEST)
+
+    def test_cast(self):
+        type_ = IntegerType()
+        with self.assertRaises(SchemaError):
+            type_.convert('1', Path(''), entity=ConvertibleEntity.REQUEST)
+        with self.assertRaises(SchemaError):
+            type_.convert(True, Path(''), entity=ConvertibleEntity.REQUEST)
+        self.assertEqual(1, type_.convert('1', Path(''), strict=False, entity=ConvertibleEntity.REQUEST))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from falcon_heavy.http.exceptions import TooManyFieldsSent
+from falcon_heavy.http.utils import parse_form, limited_parse_qsl
+
+
+class ParseFormTest(unittest.TestCase):
+
+    def test_parse_form(self):
+        self.assertEqual({}, parse_form(''))
+        self.assertEqual(
+            {'a': ['1', '2', ''], 'b c': 'd e', 'файл': '€!', 'empty': ''},
+            parse_form('a=1&b+c=d+e;a=2&&%D1%84%D0%B0%D0%B9%D0%BB=%E2%82%AC%21&a&empty=')
+        )
+        self.assertEqual({'a': '%zz�'}, parse_form('a=%zz%ff'))
+
+    def test_same_as_parse_qsl(self):
+        for qs in ('a=1&a=2&b', 'a=1;b=2;;', '=&=', 'a=b=c', '&%41=%42&'):
+            expected = {}
+            for name, value in limited_parse_qsl(qs, keep_blank_values=True):
+                expected.setdefault(name, []).append(value)
+            expected = {name: values[0] if len(values) == 1 else values for name, values in expected.items()}
+            self.assertEqual(expected, parse_form(qs))
+
+    def test_fields_limit(self):
+        self.assertEqual({'a': '1', 'b': '2'}, parse_form('a=1&b=2', fields_limit=2))
+        for qs in ('a=1&b=2&c=3', 'a=1&b=2&', 'a=1;b=2;c=3'):
+            with self.assertRaises(TooManyFieldsSent):
+                parse_form(qs, fields_limit=2)
+
+
+if __name__ == '__main__':
+    unittest.main()